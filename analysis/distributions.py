@@ -0,0 +1,267 @@
+import math
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from data.cleaning_pipeline import DEFAULT_CASE_COLUMNS
+from data.indexing import date_index
+
+# Quantiles read from a sketch are within this relative error of the true value
+RELATIVE_ACCURACY = 0.01
+# Bins of the histograms drawn from a sketch
+HISTOGRAM_BINS = 10
+
+# Log-spaced buckets (as in DDSketch): a positive value v goes to bucket
+# ceil(log_gamma(v)), shifted by _BIAS so keys of positive values are >= 1;
+# negative values mirror that with negative keys, zero has key 0.
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+_MIN_MAGNITUDE = 1e-9
+_BIAS = int(-math.floor(math.log(_MIN_MAGNITUDE) / _LOG_GAMMA)) + 1
+_KEY_MAX = _BIAS + int(math.ceil(math.log(np.finfo(np.float64).max) / _LOG_GAMMA))
+_KEY_SPAN = 2 * _KEY_MAX + 1
+
+
+def sketch_keys(values: np.ndarray) -> np.ndarray:
+    """Bucket key of every value; keys sort in the same order as the values."""
+    values = np.asarray(values, dtype=np.float64)
+    magnitude = np.maximum(np.abs(values), _MIN_MAGNITUDE)
+    keys = np.ceil(np.log(magnitude) / _LOG_GAMMA).astype(np.int64) + _BIAS
+    return np.where(values > 0, keys, np.where(values < 0, -keys, 0))
+
+
+def key_values(keys: np.ndarray) -> np.ndarray:
+    """Representative value of each bucket key (within ``RELATIVE_ACCURACY`` of its members)."""
+    keys = np.asarray(keys, dtype=np.int64)
+    magnitude = 2 * np.power(_GAMMA, np.abs(keys) - _BIAS) / (_GAMMA + 1)
+    return np.sign(keys) * magnitude
+
+
+class Sketch:
+    """
+    Mergeable summary of a set of values: counts per log-spaced bucket
+    (``keys`` sorted, ``counts``) plus the exact minimum and maximum.
+    Quantiles, fixed-edge histograms and box statistics are read from it
+    without the underlying values.
+    """
+
+    def __init__(self, keys: np.ndarray, counts: np.ndarray, vmin: float, vmax: float):
+        self.keys = keys
+        self.counts = counts
+        self.min = vmin
+        self.max = vmax
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "Sketch":
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.nan, np.nan)
+        keys, counts = np.unique(sketch_keys(values), return_counts=True)
+        return cls(keys, counts, float(values.min()), float(values.max()))
+
+    @classmethod
+    def from_keys(cls, keys: np.ndarray, counts: np.ndarray, vmin: float, vmax: float) -> "Sketch":
+        """Sketch from (possibly repeated) bucket keys and their counts."""
+        dense = np.bincount(keys + _KEY_MAX, weights=counts, minlength=_KEY_SPAN)
+        nonzero = np.flatnonzero(dense)
+        return cls(nonzero - _KEY_MAX, dense[nonzero].astype(np.int64), vmin, vmax)
+
+    @classmethod
+    def merge(cls, sketches: list) -> "Sketch":
+        sketches = [s for s in sketches if len(s)]
+        if not sketches:
+            return cls.from_values(np.empty(0))
+        return cls.from_keys(np.concatenate([s.keys for s in sketches]), np.concatenate([s.counts for s in sketches]),
+                             min(s.min for s in sketches), max(s.max for s in sketches))
+
+    def __len__(self):
+        return int(self.counts.sum())
+
+    def _values(self) -> np.ndarray:
+        return np.clip(key_values(self.keys), self.min, self.max)
+
+    def quantile(self, q: float) -> float:
+        if not len(self):
+            return np.nan
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        rank = q * (len(self) - 1)
+        i = int(np.searchsorted(np.cumsum(self.counts), rank, side='right'))
+        return float(self._values()[min(i, len(self.keys) - 1)])
+
+    def _bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        # Value interval covered by each bucket, clipped to [min, max]
+        k = np.abs(self.keys) - _BIAS
+        upper, lower = np.power(_GAMMA, k), np.power(_GAMMA, k - 1)
+        lo = np.where(self.keys > 0, lower, np.where(self.keys < 0, -upper, 0.0))
+        hi = np.where(self.keys > 0, upper, np.where(self.keys < 0, -lower, 0.0))
+        return np.clip(lo, self.min, self.max), np.clip(hi, self.min, self.max)
+
+    def histogram(self, bins: int = HISTOGRAM_BINS) -> tuple[np.ndarray, np.ndarray]:
+        """
+        (counts, edges) over ``bins`` equal-width bins from min to max. Each
+        bucket's count is spread evenly over its value interval.
+        """
+        lo, hi = (self.min, self.max) if self.max > self.min else (self.min - 0.5, self.max + 0.5)
+        edges = np.linspace(lo, hi, bins + 1)
+        b_lo, b_hi = self._bounds()
+        width = b_hi - b_lo
+        # Share of every bucket below every edge, then counts below every edge
+        below = np.where(width > 0, np.clip((edges[:, None] - b_lo) / np.where(width > 0, width, 1), 0, 1),
+                         edges[:, None] >= b_hi)
+        cumulative = below @ self.counts.astype(np.float64)
+        cumulative[0], cumulative[-1] = 0, len(self)
+        return np.diff(cumulative), edges
+
+    def box_stats(self, label: str = "", whis: float = 1.5) -> dict:
+        """Statistics for ``Axes.bxp`` in the style of ``Axes.boxplot``; only min/max can be fliers."""
+        q1, med, q3 = self.quantile(0.25), self.quantile(0.5), self.quantile(0.75)
+        iqr = q3 - q1
+        values = self._values()
+        lo_limit, hi_limit = q1 - whis * iqr, q3 + whis * iqr
+        inside = values[(values >= lo_limit) & (values <= hi_limit)]
+        whislo = self.min if self.min >= lo_limit else float(inside.min()) if len(inside) else q1
+        whishi = self.max if self.max <= hi_limit else float(inside.max()) if len(inside) else q3
+        fliers = [v for v in (self.min, self.max) if v < whislo or v > whishi]
+        return {'label': label, 'med': med, 'q1': q1, 'q3': q3,
+                'whislo': whislo, 'whishi': whishi, 'fliers': np.array(fliers)}
+
+
+class DistributionIndex:
+    """
+    Per-(Region, Year, Month) sketches of the case columns of a cleaned frame.
+
+    Each column's sketches are built once, on first use, as one sorted array of
+    (group, bucket) entries with counts plus exact per-group min/max. A
+    selection merges the entries of its groups, which are contiguous per
+    region. Months only partly inside a date range are sketched from their
+    rows, found by binary search through ``data.indexing.date_index``.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: list | None = None):
+        # Weak, so the per-frame cache does not keep the frame alive
+        self._frame = weakref.ref(df)
+        self.columns = [c for c in (DEFAULT_CASE_COLUMNS if columns is None else columns) if c in df.columns]
+        self._index = date_index(df)
+        region = df['Region']
+        if isinstance(region.dtype, pd.CategoricalDtype):
+            codes = region.cat.codes.values.astype(np.int64)
+        else:
+            codes = pd.factorize(region)[0].astype(np.int64)
+        months = df['Date'].values.astype('datetime64[M]').astype(np.int64)
+        self.month0 = int(months.min()) if len(months) else 0
+        self.n_months = int(months.max()) - self.month0 + 1 if len(months) else 0
+        self.n_groups = len(self._index.region_codes) * self.n_months
+        self._groups = np.where(codes >= 0, codes * self.n_months + (months - self.month0), -1)
+        self._summaries = {}
+
+    def _values(self, column: str) -> np.ndarray:
+        df = self._frame()
+        if df is None:
+            raise RuntimeError("The frame of this DistributionIndex no longer exists")
+        return df[column].values
+
+    def _summary(self, column: str) -> tuple:
+        if column not in self._summaries:
+            valid = self._groups >= 0
+            groups = self._groups[valid]
+            values = self._values(column)[valid].astype(np.float64)
+            entries, counts = np.unique(groups * _KEY_SPAN + (sketch_keys(values) + _KEY_MAX), return_counts=True)
+            stats = pd.Series(values).groupby(groups).agg(['min', 'max'])
+            gmin = np.full(self.n_groups, np.inf)
+            gmax = np.full(self.n_groups, -np.inf)
+            gmin[stats.index.values] = stats['min'].values
+            gmax[stats.index.values] = stats['max'].values
+            self._summaries[column] = (entries, counts, gmin, gmax)
+        return self._summaries[column]
+
+    def _month_ranges(self, month, year) -> list:
+        # Selected months as [a, b) ranges of month offsets from month0
+        if year is not None:
+            first = (int(year) - 1970) * 12 - self.month0
+            if month is not None:
+                return [(first + int(month) - 1, first + int(month))]
+            return [(first, first + 12)]
+        if month is not None:
+            first = (int(month) - 1 - self.month0) % 12
+            return [(m, m + 1) for m in range(first, self.n_months, 12)]
+        return [(0, self.n_months)]
+
+    def sketch(self, column: str, state: str | None = None, month: int | None = None, year: int | None = None,
+               start_date=None, end_date=None) -> Sketch:
+        """
+        Sketch of column over the rows ``analysis.trends`` selects for the same
+        arguments (state/month/year, or an inclusive start_date..end_date range).
+        """
+        if column not in self.columns:
+            raise ValueError(f"No distribution summary for column '{column}'")
+        entries, counts, gmin, gmax = self._summary(column)
+        if state:
+            code = self._index.region_codes.get(str(state))
+            codes = np.array([] if code is None else [code], dtype=np.int64)
+        else:
+            codes = np.arange(len(self._index.region_codes), dtype=np.int64)
+
+        parts = []
+        if start_date is not None or end_date is not None:
+            start = pd.Timestamp(start_date) if start_date is not None else pd.Timestamp(self._index.sorted_dates[0])
+            end = pd.Timestamp(end_date) if end_date is not None else pd.Timestamp(self._index.sorted_dates[-1])
+            # Whole months from the summaries, the partial months at either end from their rows
+            first = start.to_period('M').ordinal - self.month0 + (start.day != 1)
+            last = (end + pd.Timedelta(days=1)).to_period('M').ordinal - self.month0
+            if first < last:
+                ranges = [(first, last)]
+                edges = [(start, pd.Timestamp(1970, 1, 1) + pd.DateOffset(months=self.month0 + first) - pd.Timedelta(days=1)),
+                         (pd.Timestamp(1970, 1, 1) + pd.DateOffset(months=self.month0 + last), end)]
+            else:
+                ranges, edges = [], [(start, end)]
+            values = self._values(column)
+            for lo, hi in edges:
+                if lo <= hi:
+                    rows = self._index.rows(state or None, lo, hi)
+                    parts.append(Sketch.from_values(values[rows]))
+        else:
+            ranges = self._month_ranges(month, year)
+
+        ranges = [(max(a, 0), min(b, self.n_months)) for a, b in ranges if b > 0 and a < self.n_months]
+        if ranges and len(codes):
+            a = np.array([r[0] for r in ranges], dtype=np.int64)
+            b = np.array([r[1] for r in ranges], dtype=np.int64)
+            g0 = (codes[:, None] * self.n_months + a).ravel()
+            g1 = (codes[:, None] * self.n_months + b).ravel()
+            lo = np.searchsorted(entries, g0 * _KEY_SPAN)
+            hi = np.searchsorted(entries, g1 * _KEY_SPAN)
+            take = _concat_ranges(lo, hi)
+            groups = _concat_ranges(g0, g1)
+            if len(take):
+                parts.append(Sketch.from_keys(entries[take] % _KEY_SPAN - _KEY_MAX, counts[take],
+                                              float(gmin[groups].min()), float(gmax[groups].max())))
+        return Sketch.merge(parts)
+
+
+def _concat_ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    # Concatenation of arange(a, b) for every (a, b)
+    lengths = np.maximum(stops - starts, 0)
+    if not lengths.sum():
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return np.arange(lengths.sum(), dtype=np.int64) + offsets
+
+
+# id(frame) -> (weakref to frame, DistributionIndex)
+_DISTRIBUTIONS = {}
+
+
+def distribution_index(df: pd.DataFrame) -> DistributionIndex:
+    """Return the ``DistributionIndex`` of a frame, building it on first use."""
+    hit = _DISTRIBUTIONS.get(id(df))
+    if hit is not None and hit[0]() is df:
+        return hit[1]
+    index = DistributionIndex(df)
+    key = id(df)
+    _DISTRIBUTIONS[key] = (weakref.ref(df, lambda _: _DISTRIBUTIONS.pop(key, None)), index)
+    return index
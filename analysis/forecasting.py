@@ -0,0 +1,198 @@
+import hashlib
+import json
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+FORECAST_MODELS = ("holt", "arima")
+
+# Below this many daily points a model fit is meaningless; use a naive mean instead
+MIN_FIT_POINTS = 14
+NAIVE_WINDOW = 7
+
+# Fits kept per engine (LRU); a fit is a few parameters and ``horizon`` floats
+FORECAST_CACHE_SIZE = 1024
+CACHE_FORMAT = 1
+
+
+def _fit_region(region: str, increments: np.ndarray, model: str, horizon: int) -> dict:
+    """
+    Fit one model on a region's daily increments and forecast ``horizon`` days.
+    Module-level so it can run in a worker process.
+    """
+    if len(increments) < MIN_FIT_POINTS:
+        level = float(increments[-NAIVE_WINDOW:].mean()) if len(increments) else 0.0
+        return {'region': region, 'params': {'naive_level': level}, 'forecast': np.full(horizon, level)}
+
+    if model == "holt":
+        res = ExponentialSmoothing(increments, trend="add", damped_trend=True,
+                                   initialization_method="estimated").fit()
+        params = {k: float(v) for k, v in res.params.items() if np.isscalar(v)}
+    elif model == "arima":
+        res = ARIMA(increments, order=(1, 1, 1)).fit()
+        params = {name: float(v) for name, v in zip(res.param_names, res.params)}
+    else:
+        raise ValueError(f"Unknown forecast model: {model}")
+    forecast = np.clip(np.asarray(res.forecast(horizon), dtype=float), 0, None)
+    return {'region': region, 'params': params, 'forecast': forecast}
+
+
+def _fit_region_star(args):
+    return _fit_region(*args)
+
+
+def _load_cache(path: str) -> OrderedDict:
+    # JSON written by _save_cache: plain data only, so loading a cache file
+    # never runs code. Entries that do not have the expected shape are skipped.
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return OrderedDict()
+    cache = OrderedDict()
+    if not isinstance(data, dict) or data.get('format') != CACHE_FORMAT:
+        return cache
+    for item in data.get('entries', []):
+        try:
+            digest, last_date, case_type, model, horizon = item['key']
+            fit = item['fit']
+            key = (str(digest), pd.Timestamp(last_date), str(case_type), str(model), int(horizon))
+            entry = {'region': str(fit['region']),
+                     'params': {str(k): float(v) for k, v in fit['params'].items()},
+                     'forecast': np.asarray(fit['forecast'], dtype=float)}
+        except (KeyError, TypeError, ValueError, AttributeError):
+            continue
+        if model in FORECAST_MODELS and len(entry['forecast']) == key[4]:
+            cache[key] = entry
+    return cache
+
+
+def _save_cache(path: str, cache: OrderedDict):
+    entries = [{'key': [digest, last_date.isoformat(), case_type, model, horizon],
+                'fit': {'region': fit['region'], 'params': fit['params'], 'forecast': fit['forecast'].tolist()}}
+               for (digest, last_date, case_type, model, horizon), fit in cache.items()]
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'format': CACHE_FORMAT, 'entries': entries}, f)
+    os.replace(tmp, path)
+
+
+def _daily_series(region_df: pd.DataFrame, case_type: str) -> pd.Series:
+    # One cumulative value per calendar day (last report wins, gaps carried forward)
+    s = region_df.groupby('Date')[case_type].last().sort_index()
+    return s.asfreq('D').ffill()
+
+
+class ForecastEngine:
+    """
+    Forecast a cumulative case column for every region at once.
+
+    Each region's daily series is turned into daily increments and fitted with
+    Holt's damped exponential smoothing ("holt") or ARIMA(1,1,1) ("arima").
+    Fits run in parallel on a process pool.
+
+    Fitted parameters and forecasts are cached per region, keyed by the
+    fingerprint of that region's data, its last date and the fit settings, so
+    a new export only refits the regions whose series actually changed. At
+    most ``cache_size`` fits are kept, least recently used first out. Pass
+    ``cache_path`` to keep the cache on disk between sessions, as JSON.
+    """
+
+    def __init__(self, model: str = "holt", horizon: int = 30,
+                 max_workers: int | None = None, cache_path: str | None = None,
+                 cache_size: int = FORECAST_CACHE_SIZE):
+        if model not in FORECAST_MODELS:
+            raise ValueError(f"Unknown forecast model: {model}")
+        self.model = model
+        self.horizon = int(horizon)
+        self.max_workers = max_workers
+        self.cache_path = cache_path
+        self.cache_size = int(cache_size)
+        self._cache = OrderedDict()
+        if cache_path and os.path.exists(cache_path):
+            self._cache = _load_cache(cache_path)
+            self._trim_cache()
+        self.last_refit = []
+
+    def _key(self, series: pd.Series, case_type: str) -> tuple:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(series.index.values.tobytes())
+        h.update(series.values.tobytes())
+        return (h.hexdigest(), series.index[-1], case_type, self.model, self.horizon)
+
+    def _trim_cache(self):
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def params(self, region: str, case_type: str = "Confirmed Cases", model: str | None = None) -> dict | None:
+        """
+        Fitted parameters of the most recent fit of case_type for region with
+        model (default: this engine's model), if any.
+        """
+        model = self.model if model is None else model
+        for key, entry in reversed(self._cache.items()):
+            if entry['region'] == region and key[2] == case_type and key[3] == model:
+                return entry['params']
+        return None
+
+    def forecast(self, df: pd.DataFrame, case_type: str = "Confirmed Cases",
+                 regions: list | None = None) -> pd.DataFrame:
+        """
+        Forecast case_type for each region (all regions when regions is None).
+
+        Returns a frame shaped like the input (Region, Date, case_type) holding
+        ``horizon`` cumulative values per region after its last date, ready to
+        pass as ``forecast=`` to ``analysis.trends.create_figure``. The names of
+        regions that had to be (re)fitted are kept in ``last_refit``.
+        """
+        if case_type not in df.columns:
+            raise ValueError(f"Column '{case_type}' not found in DataFrame")
+        if regions is None:
+            regions = sorted(df['Region'].dropna().unique())
+
+        wanted = set(regions)
+        by_region = {r: g for r, g in df.groupby('Region', observed=True) if r in wanted}
+        series, keys, todo = {}, {}, []
+        for region, region_df in by_region.items():
+            s = _daily_series(region_df, case_type)
+            if s.empty:
+                continue
+            series[region] = s
+            keys[region] = self._key(s, case_type)
+            if keys[region] in self._cache:
+                self._cache.move_to_end(keys[region])
+            else:
+                increments = np.clip(np.diff(s.values.astype(float)), 0, None)
+                todo.append((region, increments, self.model, self.horizon))
+
+        self.last_refit = [t[0] for t in todo]
+        if len(todo) > 1:
+            # Spawned workers: forking a process that runs Tk and render threads is unsafe
+            with ProcessPoolExecutor(max_workers=self.max_workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as pool:
+                fits = list(pool.map(_fit_region_star, todo))
+        else:
+            fits = [_fit_region(*t) for t in todo]
+        for fit in fits:
+            self._cache[keys[fit['region']]] = fit
+        # Fits of this call may be evicted below, so answer from them directly
+        current = {region: self._cache[key] for region, key in keys.items()}
+        self._trim_cache()
+        if fits and self.cache_path:
+            _save_cache(self.cache_path, self._cache)
+
+        frames = []
+        for region, s in series.items():
+            fit = current[region]
+            dates = pd.date_range(s.index[-1] + pd.Timedelta(days=1), periods=self.horizon, freq='D')
+            values = s.iloc[-1] + np.cumsum(fit['forecast'])
+            frames.append(pd.DataFrame({'Region': region, 'Date': dates, case_type: np.round(values).astype(np.int64)}))
+        if not frames:
+            return pd.DataFrame(columns=['Region', 'Date', case_type])
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,150 @@
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from data.cleaning_pipeline import DEFAULT_CASE_COLUMNS, dataset_fingerprint
+
+RATE_METRICS = [
+    "Case Fatality Rate",
+    "Recovery Rate",
+    "Active Share",
+    "Growth Rate",
+    "Doubling Time",
+]
+
+# Row label used for the sum over all regions
+NATIONAL = "All Regions"
+
+PERIOD_FREQS = ("D", "M", "Y")
+# Average days per period, to express doubling time in days
+_DAYS_PER_PERIOD = {"D": 1.0, "M": 365.25 / 12, "Y": 365.25}
+
+# (dataset fingerprint, freq) -> rate table; a few datasets at most
+_RATE_CACHE = OrderedDict()
+_RATE_CACHE_SIZE = 8
+
+
+def _safe_divide(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    # num / den with NaN wherever the denominator is zero or missing
+    out = np.full(np.broadcast(num, den).shape, np.nan)
+    np.divide(num, den, out=out, where=np.nan_to_num(den) > 0)
+    return out
+
+
+def ffill_periods(matrix: np.ndarray) -> np.ndarray:
+    """Forward-fill NaN along the period axis (axis 1) of a regions x periods matrix."""
+    idx = np.where(np.isnan(matrix), 0, np.arange(matrix.shape[1]))
+    np.maximum.accumulate(idx, axis=1, out=idx)
+    return np.take_along_axis(matrix, idx, axis=1)
+
+
+def _period_codes(dates: pd.Series, freq: str) -> np.ndarray:
+    if freq == "D":
+        return dates.values.astype("datetime64[D]").astype(np.int64)
+    if freq == "M":
+        return dates.values.astype("datetime64[M]").astype(np.int64)
+    if freq == "Y":
+        return dates.values.astype("datetime64[Y]").astype(np.int64)
+    raise ValueError(f"Unknown period frequency: {freq} (expected one of {PERIOD_FREQS})")
+
+
+def compute_rates(df: pd.DataFrame, freq: str = "M") -> pd.DataFrame:
+    """
+    Compute rate metrics for every region x period of a cleaned frame.
+
+    The case columns are cumulative, so each (Region, period) takes the last
+    report in the period, pivoted into regions x periods matrices (gaps carried
+    forward). All metrics are then whole-matrix numpy operations:
+      - Case Fatality Rate = Death / Confirmed (%)
+      - Recovery Rate = Cured/Discharged / Confirmed (%)
+      - Active Share = Active / Confirmed (%)
+      - Growth Rate = change in Confirmed vs. the previous period (%)
+      - Doubling Time = days for Confirmed to double at that growth rate
+    Undefined values (zero denominators, no growth) are NaN. An extra
+    ``NATIONAL`` region holds the metrics of the summed counts.
+    """
+    if df.empty:
+        return pd.DataFrame(columns=["Region", "Period"] + DEFAULT_CASE_COLUMNS + RATE_METRICS)
+
+    region = df["Region"]
+    if isinstance(region.dtype, pd.CategoricalDtype):
+        region_codes = region.cat.codes.values.astype(np.int64)
+        region_names = list(region.cat.categories)
+    else:
+        region_codes, uniques = pd.factorize(region)
+        region_names = list(uniques)
+    valid = region_codes >= 0
+
+    periods, period_codes = np.unique(_period_codes(df["Date"], freq)[valid], return_inverse=True)
+    region_codes = region_codes[valid]
+    n_regions, n_periods = len(region_names), len(periods)
+
+    # Last report per (region, period): rows are ordered by Date, so scan the
+    # keys backwards and keep the first hit of each.
+    order = np.argsort(df["Date"].values[valid], kind="stable")
+    key = (region_codes * n_periods + period_codes)[order]
+    uniq_keys, first_from_end = np.unique(key[::-1], return_index=True)
+    last_rows = order[len(key) - 1 - first_from_end]
+    r_idx, p_idx = np.divmod(uniq_keys, n_periods)
+
+    matrices = {}
+    for col in DEFAULT_CASE_COLUMNS:
+        m = np.full((n_regions, n_periods), np.nan)
+        m[r_idx, p_idx] = df[col].values[valid][last_rows]
+        matrices[col] = ffill_periods(m)
+        # National totals go in an extra last row
+        national = np.nansum(matrices[col], axis=0, keepdims=True)
+        matrices[col] = np.vstack([matrices[col], national])
+
+    confirmed = matrices["Confirmed Cases"]
+    prev = np.hstack([np.full((confirmed.shape[0], 1), np.nan), confirmed[:, :-1]])
+    growth = _safe_divide(confirmed - prev, prev)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        doubling = np.where(growth > 0, np.log(2) / np.log1p(np.where(growth > 0, growth, 0)), np.nan)
+
+    metrics = {
+        "Case Fatality Rate": 100 * _safe_divide(matrices["Death"], confirmed),
+        "Recovery Rate": 100 * _safe_divide(matrices["Cured/Discharged"], confirmed),
+        "Active Share": 100 * _safe_divide(matrices["Active Cases"], confirmed),
+        "Growth Rate": 100 * growth,
+        "Doubling Time": doubling * _DAYS_PER_PERIOD[freq],
+    }
+
+    names = region_names + [NATIONAL]
+    period_starts = pd.to_datetime(periods.astype(f"datetime64[{freq}]"))
+    # Drop cells before a region's first report (still NaN after forward fill)
+    present = ~np.isnan(confirmed)
+    rr, pp = np.nonzero(present)
+    out = pd.DataFrame({
+        "Region": pd.Categorical.from_codes(rr, categories=names),
+        "Period": period_starts[pp],
+    })
+    for col, m in list(matrices.items()) + list(metrics.items()):
+        out[col] = m[rr, pp]
+    out["Year"] = out["Period"].dt.year
+    out["Month"] = out["Period"].dt.month
+    out["Day"] = out["Period"].dt.day
+    return out
+
+
+def rate_table(df: pd.DataFrame, freq: str = "M") -> pd.DataFrame:
+    """``compute_rates`` cached per dataset fingerprint and frequency."""
+    key = (dataset_fingerprint(df), freq)
+    if key in _RATE_CACHE:
+        _RATE_CACHE.move_to_end(key)
+        return _RATE_CACHE[key]
+    table = compute_rates(df, freq)
+    _RATE_CACHE[key] = table
+    if len(_RATE_CACHE) > _RATE_CACHE_SIZE:
+        _RATE_CACHE.popitem(last=False)
+    return table
+
+
+def forget_rates(df: pd.DataFrame):
+    """Drop the cached rate tables of a frame, e.g. when it is evicted from memory."""
+    if not _RATE_CACHE:
+        return
+    fingerprint = dataset_fingerprint(df)
+    for key in [k for k in _RATE_CACHE if k[0] == fingerprint]:
+        del _RATE_CACHE[key]
@@ -0,0 +1,76 @@
+import io
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from analysis.trends import create_figure
+
+
+class RenderCancelled(Exception):
+    """Raised inside a render job that was superseded by a newer request."""
+
+
+def render_png(fig: Figure, width: int | None = None, height: int | None = None) -> bytes:
+    """
+    Rasterise a Figure with the Agg backend and return PNG bytes.
+
+    When width and height (in pixels) are given the figure is resized first so
+    the image matches the widget it will be shown in.
+    """
+    if width and height:
+        fig.set_size_inches(width / fig.dpi, height / fig.dpi)
+    canvas = FigureCanvasAgg(fig)
+    buf = io.BytesIO()
+    canvas.print_png(buf)
+    return buf.getvalue()
+
+
+class ChartRenderer:
+    """
+    Build and rasterise charts on a background thread.
+
+    Every call to ``submit`` starts a new generation. A job checks its
+    generation between the expensive stages (aggregation, figure construction,
+    rasterisation) and raises ``RenderCancelled`` as soon as a newer job has
+    been submitted, so only the latest selection is ever finished.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chart-render')
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def submit(self, df: pd.DataFrame, width: int | None = None, height: int | None = None, **figure_kwargs) -> Future:
+        """
+        Queue a render of ``create_figure(df, **figure_kwargs)``.
+
+        The returned Future resolves to ``(figure, png_bytes)`` or raises
+        ``RenderCancelled`` if a newer render was requested meanwhile.
+        """
+        generation = self.cancel_pending()
+        return self._executor.submit(self._render, generation, df, width, height, figure_kwargs)
+
+    def cancel_pending(self) -> int:
+        """Invalidate all queued and in-flight jobs; returns the new generation."""
+        with self._lock:
+            self._generation += 1
+            return self._generation
+
+    def shutdown(self):
+        self.cancel_pending()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _check(self, generation: int):
+        if generation != self._generation:
+            raise RenderCancelled()
+
+    def _render(self, generation, df, width, height, figure_kwargs):
+        self._check(generation)
+        fig = create_figure(df, **figure_kwargs)
+        self._check(generation)
+        png = render_png(fig, width, height)
+        self._check(generation)
+        return fig, png
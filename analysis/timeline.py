@@ -0,0 +1,338 @@
+"""
+Day-by-day timeline playback of one case column across regions.
+
+``timeline_matrix`` pivots a cleaned frame into a Region x Date matrix once
+(last report per region and day, gaps carried forward). ``TimelinePlot``
+draws a frame of it, either a bar race of the leading regions or their
+cumulative lines growing day by day, by updating a fixed set of animated
+artists, so playback can blit instead of rebuilding the figure per frame.
+``export_timeline`` writes the animation to GIF (Pillow) or MP4 (ffmpeg),
+rasterising chunks of frames in parallel worker processes. Headless::
+
+    python -m analysis.timeline "assets/COVID-19 Cases(02-10-2025).csv" spread.gif --kind "Bar Race"
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import subprocess
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import matplotlib
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from analysis.rates import ffill_periods
+from data.validation import REPORTING_START
+
+TIMELINE_KINDS = ("Bar Race", "Line")
+# Regions drawn per frame
+TOP_REGIONS = 10
+PLAYBACK_FPS = 30
+# Frames rendered per export task, and export image size in pixels
+EXPORT_CHUNK = 24
+EXPORT_SIZE = (960, 540)
+EXPORT_DPI = 100
+
+
+class Timeline:
+    """
+    A Region x Date matrix of one case column: ``values[r, d]`` is the last
+    reported value of ``regions[r]`` on or before ``dates[d]`` (NaN before its
+    first report). ``dates`` holds every day from the first to the last
+    report inside the reporting window (``data.validation.REPORTING_START``
+    to today); reports dated outside it are left out.
+    """
+
+    def __init__(self, case_type: str, regions: list, dates: np.ndarray, values: np.ndarray):
+        self.case_type = case_type
+        self.regions = regions
+        self.dates = dates
+        self.values = values
+
+    def __len__(self):
+        return len(self.dates)
+
+    def window(self, start=None, end=None) -> "Timeline":
+        """The days from start to end (inclusive, None for open ends) as a view."""
+        lo = 0 if start is None else int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start), 'D'), side='left'))
+        hi = len(self.dates) if end is None else int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(end), 'D'), side='right'))
+        return Timeline(self.case_type, self.regions, self.dates[lo:hi], self.values[:, lo:hi])
+
+
+def _build_timeline(df: pd.DataFrame, case_type: str) -> Timeline:
+    region = df['Region']
+    if isinstance(region.dtype, pd.CategoricalDtype):
+        codes = region.cat.codes.values.astype(np.int64)
+        names = [str(r) for r in region.cat.categories]
+    else:
+        codes, uniques = pd.factorize(region)
+        names = [str(r) for r in uniques]
+    days = df['Date'].values.astype('datetime64[D]').astype(np.int64)
+    # Only days inside the reporting window checked by data.validation (NaT
+    # falls below it): with quarantine off, one stray 1970 date would
+    # otherwise stretch the timeline over decades of empty frames
+    first_day = np.datetime64(REPORTING_START, 'D').astype(np.int64)
+    last_day = np.datetime64(pd.Timestamp.today().date(), 'D').astype(np.int64)
+    valid = (codes >= 0) & (days >= first_day) & (days <= last_day)
+    if not valid.any():
+        return Timeline(case_type, names, np.empty(0, dtype='datetime64[D]'), np.empty((len(names), 0)))
+
+    codes, days, values = codes[valid], days[valid], df[case_type].values[valid].astype(np.float64)
+    first = days.min()
+    n_days = int(days.max() - first) + 1
+    # Rows are in Date order, so the last write of each cell is its last report
+    matrix = np.full((len(names), n_days), np.nan)
+    order = np.argsort(days, kind='stable')
+    matrix[codes[order], days[order] - first] = values[order]
+    dates = (first + np.arange(n_days)).astype('datetime64[D]')
+    return Timeline(case_type, names, dates, ffill_periods(matrix))
+
+
+# (id(frame), case_type) -> (weakref to frame, Timeline), see timeline_matrix
+_TIMELINES = {}
+
+
+def timeline_matrix(df: pd.DataFrame, case_type: str = "Confirmed Cases", start_date=None, end_date=None) -> Timeline:
+    """
+    Region x Date ``Timeline`` of case_type for a cleaned frame, built once
+    per frame and column, limited to start_date..end_date when given.
+    """
+    key = (id(df), case_type)
+    hit = _TIMELINES.get(key)
+    if hit is not None and hit[0]() is df:
+        timeline = hit[1]
+    else:
+        timeline = _build_timeline(df, case_type)
+        _TIMELINES[key] = (weakref.ref(df, lambda _: _TIMELINES.pop(key, None)), timeline)
+    if start_date is None and end_date is None:
+        return timeline
+    return timeline.window(start_date, end_date)
+
+
+class TimelinePlot:
+    """
+    One figure animating a ``Timeline``.
+
+    Everything that changes between frames (bars, lines, labels, the date) is
+    an animated artist created once; ``draw_frame(i)`` only updates them and
+    returns them, as ``matplotlib.animation.FuncAnimation(blit=True)``
+    expects. The static parts (axes, legend) are drawn once as background.
+
+    - "Bar Race": the ``top`` leading regions of each day, longest bar first.
+      Bars are scaled to the leader so the axes never rescale; the values are
+      written next to them.
+    - "Line": the ``top`` regions leading on the last day, growing day by
+      day over fixed axes.
+    """
+
+    def __init__(self, timeline: Timeline, kind: str = "Bar Race", top: int = TOP_REGIONS, fig: Figure | None = None):
+        if kind not in TIMELINE_KINDS:
+            raise ValueError(f"Unknown timeline kind: {kind} (expected one of {TIMELINE_KINDS})")
+        if not len(timeline):
+            raise ValueError("No data available for the timeline")
+        self.timeline = timeline
+        self.kind = kind
+        self.fig = fig if fig is not None else Figure(figsize=(10, 6))
+        self.ax = self.fig.add_subplot(111)
+        self.values = np.nan_to_num(timeline.values)
+        self.top = min(top, len(timeline.regions))
+        # One colour per region (40 distinct ones), kept while regions change places
+        palette = matplotlib.colormaps['tab20'].colors + matplotlib.colormaps['tab20b'].colors
+        self.colors = [palette[i % len(palette)] for i in range(len(timeline.regions))]
+        self.ax.set_title(f"{timeline.case_type} by region")
+        # Bottom right under the shortest bars, top right opposite the legend for lines
+        y, va = (0.04, 'bottom') if kind == "Bar Race" else (0.96, 'top')
+        self.date_text = self.ax.text(0.98, y, "", transform=self.ax.transAxes, ha='right', va=va,
+                                      fontsize=16, fontweight='bold', color='0.3', animated=True)
+        if kind == "Bar Race":
+            self._init_bars()
+        else:
+            self._init_lines()
+        self.artists.append(self.date_text)
+
+    def __len__(self):
+        return len(self.timeline)
+
+    def _init_bars(self):
+        ax = self.ax
+        positions = np.arange(self.top)
+        self.bars = ax.barh(positions, np.zeros(self.top), height=0.8, animated=True).patches
+        self.names = [ax.text(-0.01, y, "", ha='right', va='center', fontsize=9, animated=True) for y in positions]
+        self.labels = [ax.text(0, y, "", ha='left', va='center', fontsize=9, animated=True) for y in positions]
+        # Region names left of the bars and values right of them stay inside the axes
+        ax.set_xlim(-0.45, 1.2)
+        ax.set_ylim(self.top - 0.5, -0.5)
+        ax.set_xticks([])
+        ax.set_yticks([])
+        for side in ('top', 'right', 'bottom', 'left'):
+            ax.spines[side].set_visible(False)
+        self.artists = self.bars + self.names + self.labels
+
+    def _init_lines(self):
+        ax = self.ax
+        self.x = mdates.date2num(self.timeline.dates.astype('datetime64[ns]'))
+        self.leaders = np.argsort(-self.values[:, -1], kind='stable')[:self.top]
+        self.lines = [ax.plot([], [], color=f"C{rank}", label=self.timeline.regions[r], animated=True)[0]
+                      for rank, r in enumerate(self.leaders)]
+        ax.set_xlim(self.x[0], self.x[-1] if self.x[-1] > self.x[0] else self.x[0] + 1)
+        ax.set_ylim(0, max(float(self.values[self.leaders].max()), 1) * 1.05)
+        ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(ax.xaxis.get_major_locator()))
+        ax.set_ylabel(self.timeline.case_type)
+        ax.grid(True, linestyle='--', alpha=0.4)
+        ax.legend(handles=self.lines, loc='upper left', fontsize=8)
+        self.artists = list(self.lines)
+
+    def init(self) -> list:
+        """Blank frame (``init_func`` of FuncAnimation)."""
+        for artist in self.artists:
+            artist.set_visible(False)
+        return self.artists
+
+    def draw_frame(self, i: int) -> list:
+        """Update the animated artists to day i and return them."""
+        self.date_text.set_text(str(self.timeline.dates[i]))
+        self.date_text.set_visible(True)
+        if self.kind == "Bar Race":
+            day = self.values[:, i]
+            order = np.argsort(-day, kind='stable')[:self.top]
+            lead = day[order[0]] if day[order[0]] > 0 else 1.0
+            for bar, name, label, r in zip(self.bars, self.names, self.labels, order):
+                width = day[r] / lead
+                bar.set_width(width)
+                bar.set_color(self.colors[r])
+                name.set_text(self.timeline.regions[r])
+                label.set_x(width + 0.01)
+                label.set_text(f"{day[r]:,.0f}")
+                for artist in (bar, name, label):
+                    artist.set_visible(day[r] > 0)
+        else:
+            for line, r in zip(self.lines, self.leaders):
+                line.set_data(self.x[:i + 1], self.values[r, :i + 1])
+                line.set_visible(True)
+        return self.artists
+
+
+def _render_chunk(timeline: Timeline, kind: str, top: int, frames: range, size: tuple, dpi: int, gif: bool):
+    # Worker: rasterise frames with Agg, blitting onto a background drawn once
+    fig = Figure(figsize=(size[0] / dpi, size[1] / dpi), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    plot = TimelinePlot(timeline, kind=kind, top=top, fig=fig)
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+    out = []
+    for i in frames:
+        canvas.restore_region(background)
+        for artist in plot.draw_frame(i):
+            fig.draw_artist(artist)
+        rgb = np.asarray(canvas.buffer_rgba())[..., :3]
+        if gif:
+            from PIL import Image
+            # Quantise here so the parent only assembles palette frames
+            out.append(Image.fromarray(rgb).quantize(colors=256, method=Image.Quantize.FASTOCTREE))
+        else:
+            out.append(rgb.tobytes())
+    return out
+
+
+def export_timeline(timeline: Timeline, path: str, kind: str = "Bar Race", top: int = TOP_REGIONS,
+                    fps: int = PLAYBACK_FPS, size: tuple = EXPORT_SIZE, dpi: int = EXPORT_DPI,
+                    workers: int | None = None, progress=None) -> int:
+    """
+    Write every frame of a timeline to a ``.gif`` (Pillow) or ``.mp4``
+    (ffmpeg, which must be on PATH) at ``size`` pixels and ``fps``.
+
+    Chunks of ``EXPORT_CHUNK`` frames are rasterised by a pool of ``workers``
+    processes (default: CPU count) and written in order as they complete; at
+    most two chunks per worker are in flight, bounding memory for MP4. GIF
+    frames are quantised by the workers, then Pillow assembles and encodes
+    the file in this process. ``progress(done, total)`` is called
+    after each chunk. Returns the number of frames written.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in (".gif", ".mp4"):
+        raise ValueError(f"Unsupported animation format '{ext}' (expected .gif or .mp4)")
+    if not len(timeline):
+        raise ValueError("No data available for the timeline")
+    gif = ext == ".gif"
+    width, height = (int(size[0]) // 2 * 2, int(size[1]) // 2 * 2)
+    if not gif:
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError("ffmpeg was not found on PATH; export a .gif instead or install ffmpeg")
+        writer = subprocess.Popen(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}",
+             "-r", str(fps), "-i", "-", "-c:v", "libx264", "-pix_fmt", "yuv420p", path],
+            stdin=subprocess.PIPE)
+
+    total = len(timeline)
+    chunks = [range(i, min(i + EXPORT_CHUNK, total)) for i in range(0, total, EXPORT_CHUNK)]
+    workers = workers or os.cpu_count() or 1
+    done = 0
+
+    def frames():
+        nonlocal done
+        # Spawned workers: forking a process that runs Tk and render threads is unsafe
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            pending = []
+            queue = iter(chunks)
+            for chunk in queue:
+                pending.append(pool.submit(_render_chunk, timeline, kind, top, chunk, (width, height), dpi, gif))
+                if len(pending) >= 2 * workers:
+                    break
+            while pending:
+                result = pending.pop(0).result()
+                chunk = next(queue, None)
+                if chunk is not None:
+                    pending.append(pool.submit(_render_chunk, timeline, kind, top, chunk, (width, height), dpi, gif))
+                for frame in result:
+                    yield frame
+                done += len(result)
+                if progress is not None:
+                    progress(done, total)
+
+    if gif:
+        stream = frames()
+        first = next(stream)
+        first.save(path, save_all=True, append_images=stream, duration=round(1000 / fps), loop=0, optimize=False)
+    else:
+        try:
+            for frame in frames():
+                writer.stdin.write(frame)
+        finally:
+            writer.stdin.close()
+            code = writer.wait()
+        if code != 0:
+            raise RuntimeError(f"ffmpeg exited with status {code}")
+    return total
+
+
+def main(argv=None):
+    from data import cleaning_pipeline as cp
+
+    parser = argparse.ArgumentParser(description="Export a day-by-day timeline animation of a COVID-19 dataset.")
+    parser.add_argument('data', help="CSV/XLSX file to load")
+    parser.add_argument('output', help="animation to write (.gif or .mp4)")
+    parser.add_argument('--case-type', default="Confirmed Cases")
+    parser.add_argument('--kind', default="Bar Race", choices=TIMELINE_KINDS)
+    parser.add_argument('--top', type=int, default=TOP_REGIONS)
+    parser.add_argument('--start', default=None, help="first day (YYYY-MM-DD)")
+    parser.add_argument('--end', default=None, help="last day (YYYY-MM-DD)")
+    parser.add_argument('--fps', type=int, default=PLAYBACK_FPS)
+    parser.add_argument('--workers', type=int, default=None, help="render processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    df = cp.load_data_from_file(args.data)
+    timeline = timeline_matrix(df, args.case_type, args.start, args.end)
+    n = export_timeline(timeline, args.output, kind=args.kind, top=args.top, fps=args.fps, workers=args.workers,
+                        progress=lambda done, total: print(f"\r{done}/{total} frames", end="", flush=True))
+    print(f"\nWrote {n} frames to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,13 @@
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.figure import Figure
+
+from analysis.rates import NATIONAL, RATE_METRICS, rate_table
+from analysis.distributions import Sketch, distribution_index
+from data.indexing import slice_rows
+from data.store import PartitionedDataset
 from calendar import monthrange
 
 DEFAULT_CASE_COLUMNS = [
@@ -12,7 +18,25 @@ DEFAULT_CASE_COLUMNS = [
 ]
 
 
+# Date-range charts pick their x granularity from the span: up to
+# RANGE_DAILY_DAYS days are drawn per day, up to RANGE_MONTHLY_DAYS per month,
+# longer spans per year.
+RANGE_DAILY_DAYS = 120
+RANGE_MONTHLY_DAYS = 4 * 366
+# Largest number of points drawn with a marker on line/area charts
+MAX_MARKER_POINTS = 120
+
+_PERIOD_STARTS = {'D': 'D', 'M': 'MS', 'Y': 'YS'}
+_RANGE_LABELS = {'D': 'Date', 'M': 'Month', 'Y': 'Year'}
+_RANGE_BAR_WIDTH = {'D': 0.8, 'M': 25, 'Y': 300}
+
+
 def _ensure_date_columns(df: pd.DataFrame) -> pd.DataFrame:
+    # Frames from clean_data already have all of these: return them unchanged
+    # (no copy), which also keeps per-frame indexes and caches valid.
+    has_dates = 'Date' in df.columns and pd.api.types.is_datetime64_any_dtype(df['Date'])
+    if has_dates and {'Year', 'Month', 'Day'} <= set(df.columns):
+        return df
     df = df.copy()
     if 'Date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['Date']):
         df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
@@ -25,13 +49,198 @@ def _ensure_date_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def range_freq(start, end) -> str:
+    """Granularity ('D', 'M' or 'Y') used to chart the span start..end."""
+    days = (pd.Timestamp(end) - pd.Timestamp(start)).days
+    if days <= RANGE_DAILY_DAYS:
+        return 'D'
+    if days <= RANGE_MONTHLY_DAYS:
+        return 'M'
+    return 'Y'
+
+
+def _period_bounds(month: int | None, year: int | None, start_date, end_date) -> tuple:
+    # A year or year+month selection is just a date range
+    if start_date is not None or end_date is not None:
+        return start_date, end_date
+    if year is not None:
+        if month is not None:
+            first = pd.Timestamp(int(year), int(month), 1)
+            return first, first + pd.offsets.MonthEnd(0)
+        return pd.Timestamp(int(year), 1, 1), pd.Timestamp(int(year), 12, 31)
+    return None, None
+
+
+def _filter_rows(df: pd.DataFrame, state: str | None, month: int | None, year: int | None,
+                 start_date=None, end_date=None) -> pd.DataFrame:
+    # Region and date filtering through data.indexing.date_index: binary
+    # searches on the sorted Date column instead of full-frame masks.
+    start, end = _period_bounds(month, year, start_date, end_date)
+    if state or start is not None or end is not None:
+        plot_df = slice_rows(df, state or None, start, end)
+    else:
+        plot_df = df
+    if month is not None and year is None and start_date is None and end_date is None:
+        # Same month across every year is not a contiguous range
+        plot_df = plot_df[plot_df['Month'] == int(month)]
+    return plot_df
+
+
+def _filter_table(df: pd.DataFrame, state: str | None, month: int | None, year: int | None,
+                  start_date=None, end_date=None, date_col: str = 'Date') -> pd.DataFrame:
+    # Mask-based filtering for small derived tables (rates, forecasts)
+    plot_df = df
+    if state:
+        plot_df = plot_df[plot_df['Region'] == state]
+    if start_date is not None or end_date is not None:
+        dates = plot_df[date_col]
+        if start_date is not None:
+            plot_df = plot_df[dates >= pd.Timestamp(start_date)]
+            dates = plot_df[date_col]
+        if end_date is not None:
+            plot_df = plot_df[dates <= pd.Timestamp(end_date)]
+        return plot_df
+    if year is not None:
+        plot_df = plot_df[plot_df['Year'] == int(year)]
+    if month is not None:
+        plot_df = plot_df[plot_df['Month'] == int(month)]
+    return plot_df
+
+
+def _aggregate(plot_df: pd.DataFrame, case_type: str, month: int | None, year: int | None,
+               days_in_month: int | None = None, fill_value=0) -> pd.Series:
+    # Sum case_type per Day (month given), per Month (year given) or per Year,
+    # reindexed to the full day/month range with fill_value for the gaps.
+    # Rates are not additive: a month without a year averages the same day
+    # across years instead.
+    if month is not None:
+        agg = _combine(plot_df.groupby('Day')[case_type], case_type)
+        return agg.reindex(pd.RangeIndex(1, days_in_month + 1), fill_value=fill_value)
+    if year is not None:
+        agg = _combine(plot_df.groupby('Month')[case_type], case_type)
+        return agg.reindex(pd.RangeIndex(1, 13), fill_value=fill_value)
+    return _combine(plot_df.groupby('Year')[case_type], case_type).sort_index()
+
+
+def _combine(groups, case_type: str) -> pd.Series:
+    # Counts add up within a period, rate metrics are averaged
+    return groups.mean() if case_type in RATE_METRICS else groups.sum(min_count=1)
+
+
+def _aggregate_range(plot_df: pd.DataFrame, case_type: str, freq: str, start, end,
+                     fill_value=0, date_col: str = 'Date') -> pd.Series:
+    # Sum case_type per day/month/year period, indexed by the period start and
+    # reindexed to every period of start..end.
+    periods = plot_df[date_col].values.astype(f'datetime64[{freq}]').astype('datetime64[ns]')
+    agg = _combine(plot_df[case_type].groupby(periods), case_type)
+    full_index = pd.date_range(pd.Timestamp(start).to_period(freq).start_time,
+                               pd.Timestamp(end), freq=_PERIOD_STARTS[freq])
+    return agg.reindex(full_index, fill_value=fill_value)
+
+
+def _select(df: pd.DataFrame, state: str | None, month: int | None, year: int | None,
+            case_type: str, start_date=None, end_date=None) -> tuple[pd.DataFrame, float]:
+    # Rows for the selection plus the fill value for periods without data.
+    # Rate metrics come from the rate table (one row per period, NaN gaps).
+    if case_type in RATE_METRICS:
+        if start_date is not None or end_date is not None:
+            start, end = _range_bounds(df, start_date, end_date)
+            freq = range_freq(start, end)
+            table = rate_table(df, freq)
+            start = pd.Timestamp(start).to_period(freq).start_time
+            return _filter_table(table, state or NATIONAL, None, None, start, end, date_col='Period'), np.nan
+        freq = 'D' if month is not None else ('M' if year is not None else 'Y')
+        table = rate_table(df, freq)
+        # One row per period for the selection (per year of it when only a month is given)
+        return _filter_table(table, state or NATIONAL, month, year), np.nan
+    return _filter_rows(_ensure_date_columns(df), state, month, year, start_date, end_date), 0
+
+
+def _read_partitions(dataset: PartitionedDataset, state: str | None, month: int | None, year: int | None,
+                     case_type: str, graph_type: str, start_date=None, end_date=None) -> tuple:
+    # Only the partitions, row groups and columns the selection needs.
+    # Returns (frame, start_date, end_date); open range ends are resolved from
+    # the whole dataset so they match an in-memory frame.
+    if start_date is not None or end_date is not None:
+        start = pd.Timestamp(start_date) if start_date is not None else dataset.min_date
+        end = pd.Timestamp(end_date) if end_date is not None else dataset.max_date
+        start_date, end_date, years = start, end, None
+    else:
+        start, end = _period_bounds(month, year, None, None)
+        years = [year] if year is not None else None
+    if case_type in RATE_METRICS or graph_type.lower() == 'pie':
+        columns = DEFAULT_CASE_COLUMNS
+    else:
+        columns = [case_type]
+    if case_type in RATE_METRICS:
+        # Rates carry values forward, compare with the previous period and use
+        # whole periods at the range ends: read the selected regions' full history
+        start, end, years = None, None, None
+    frame = dataset.read(regions=[state] if state else None, years=years, start=start, end=end, columns=columns)
+    return frame, start_date, end_date
+
+
+def _distribution(df: pd.DataFrame, plot_df: pd.DataFrame, state: str | None, month: int | None, year: int | None,
+                  case_type: str, start_date=None, end_date=None) -> Sketch:
+    # Case columns are answered from the frame's per-(Region, Year, Month)
+    # sketches; rate metrics (one row per period) are sketched directly.
+    index = distribution_index(df)
+    if case_type in index.columns:
+        return index.sketch(case_type, state, month, year, start_date, end_date)
+    return Sketch.from_values(plot_df[case_type].values)
+
+
+def _range_bounds(df: pd.DataFrame, start_date, end_date) -> tuple:
+    # Open ends of a date range default to the first/last date in the data
+    start = pd.Timestamp(start_date) if start_date is not None else df['Date'].min()
+    end = pd.Timestamp(end_date) if end_date is not None else df['Date'].max()
+    if start > end:
+        raise ValueError("Start date must not be after end date")
+    return start, end
+
+
+def _days_in_month(plot_df: pd.DataFrame, month: int, year: int | None) -> int:
+    return monthrange(int(year) if year is not None else int(plot_df['Year'].iloc[0]), int(month))[1]
+
+
+def aggregate_series(df: pd.DataFrame,
+                     state: str | None = None,
+                     month: int | None = None,
+                     year: int | None = None,
+                     case_type: str = "Confirmed Cases",
+                     start_date=None,
+                     end_date=None) -> pd.Series:
+    """
+    Return the series plotted by ``create_figure`` for a selection: case_type per
+    day (month given), per month (year given) or per year, indexed by that unit.
+    With start_date/end_date the index holds period start dates instead, at the
+    granularity chosen by ``range_freq``. df may also be a ``data.store.PartitionedDataset``.
+    """
+    if isinstance(df, PartitionedDataset):
+        df, start_date, end_date = _read_partitions(df, state, month, year, case_type, "Line", start_date, end_date)
+    plot_df, fill_value = _select(df, state, month, year, case_type, start_date, end_date)
+    if plot_df.empty:
+        raise ValueError("No data for selected criteria")
+    if case_type not in plot_df.columns:
+        raise ValueError(f"Column '{case_type}' not found in DataFrame")
+    if start_date is not None or end_date is not None:
+        start, end = _range_bounds(df, start_date, end_date)
+        date_col = 'Period' if case_type in RATE_METRICS else 'Date'
+        return _aggregate_range(plot_df, case_type, range_freq(start, end), start, end, fill_value, date_col)
+    days = _days_in_month(plot_df, month, year) if month is not None else None
+    return _aggregate(plot_df, case_type, month, year, days, fill_value)
+
+
 def create_figure(df: pd.DataFrame,
                   state: str | None = None,
                   month: int | None = None,
                   year: int | None = None,
                   case_type: str = "Confirmed Cases",
                   graph_type: str = "Line",
-                  palette: dict | None = None) -> plt.Figure:
+                  palette: dict | None = None,
+                  forecast: pd.DataFrame | None = None,
+                  start_date=None,
+                  end_date=None) -> Figure:
     """
     Create a matplotlib Figure for different graph types.
 
@@ -42,20 +251,38 @@ def create_figure(df: pd.DataFrame,
       - When month is provided, X axis is integer days (1..N) and missing days are filled with 0.
       - When only year provided, X axis is months 1..12 (aggregated sum per month).
       - When neither provided, X axis is years (aggregated sum per year).
+      - When start_date and/or end_date are given (inclusive; open ends default to the data's
+        first/last date) they replace month/year: X axis is dates, aggregated per day, month
+        or year depending on the span (see ``range_freq``).
+      - Rows are selected by binary search on the sorted Date column (``data.indexing``), not
+        by masking the whole frame.
+      - df may also be a ``data.store.PartitionedDataset``: only the partitions, row groups
+        and columns matching the selection are read from disk.
+      - Histogram and box charts are drawn from mergeable quantile sketches
+        (``analysis.distributions``, ~1% relative error) built once per frame, not from
+        the raw values; boxes use ``Axes.bxp`` and only the extreme values as fliers.
       - For pie charts: if state is None, pie shows sum of case_type per Region. If state provided, pie shows distribution across case columns for that state/selection.
+      - case_type may also be one of ``analysis.rates.RATE_METRICS`` (e.g. "Case Fatality Rate").
+        Rates are read from the cached rate table at the matching period (day/month/year),
+        for the selected state or for all regions combined; they are not summed.
+      - forecast: optional frame shaped like df (Region, Date, case columns), e.g. from
+        ``analysis.forecasting.ForecastEngine.forecast``. On line charts of a month (daily)
+        or a date range it is filtered and aggregated like df and drawn as a dashed overlay;
+        an open end_date then extends to the last forecast date. Per-month and per-year
+        views and other graph types ignore it, since a few forecast days would fill a
+        partial month or year next to complete ones.
     """
     if palette is None:
         palette = {'accent': '#00a8ff'}
 
-    df = _ensure_date_columns(df)
-
-    plot_df = df.copy()
-    if state:
-        plot_df = plot_df[plot_df['Region'] == state]
-    if year is not None:
-        plot_df = plot_df[plot_df['Year'] == int(year)]
-    if month is not None:
-        plot_df = plot_df[plot_df['Month'] == int(month)]
+    gtype = graph_type.lower()
+    if gtype == 'pie' and case_type in RATE_METRICS:
+        raise ValueError("Rates cannot be shown as a pie chart")
+    range_mode = start_date is not None or end_date is not None
+    open_end = end_date is None
+    if isinstance(df, PartitionedDataset):
+        df, start_date, end_date = _read_partitions(df, state, month, year, case_type, graph_type, start_date, end_date)
+    plot_df, fill_value = _select(df, state, month, year, case_type, start_date, end_date)
 
     if plot_df.empty:
         raise ValueError("No data for selected criteria")
@@ -64,14 +291,16 @@ def create_figure(df: pd.DataFrame,
     if graph_type.lower() != 'pie' and case_type not in plot_df.columns:
         raise ValueError(f"Column '{case_type}' not found in DataFrame")
 
-    fig, ax = plt.subplots(figsize=(9, 5), dpi=100)
+    # Build the Figure directly instead of through pyplot so it is safe to
+    # create off the main thread and is not kept alive by pyplot's registry.
+    fig = Figure(figsize=(9, 5), dpi=100)
+    ax = fig.subplots()
     color = palette.get('accent', '#00a8ff')
-    gtype = graph_type.lower()
 
     if gtype == 'pie':
         # two modes: per-region totals (state=None) OR distribution of case-types for selected subset
         if state is None:
-            agg = plot_df.groupby('Region')[case_type].sum().sort_values(ascending=False)
+            agg = plot_df.groupby('Region', observed=True)[case_type].sum().sort_values(ascending=False)
             ax.pie(agg.values, labels=agg.index, autopct='%1.1f%%')
             ax.set_title(f"{case_type} distribution by Region")
         else:
@@ -82,19 +311,63 @@ def create_figure(df: pd.DataFrame,
             if sum(values) == 0:
                 raise ValueError("Selected subset sums to zero, cannot create pie chart")
             ax.pie(values, labels=labels, autopct='%1.1f%%')
-            ax.set_title(f"Case distribution for {state} ({'Month '+str(month) if month else ''}{' Year '+str(year) if year else ''})")
+            if range_mode:
+                span = f"{pd.Timestamp(start_date).date() if start_date is not None else '...'} to {pd.Timestamp(end_date).date() if end_date is not None else '...'}"
+            else:
+                span = f"{'Month '+str(month) if month else ''}{' Year '+str(year) if year else ''}"
+            ax.set_title(f"Case distribution for {state} ({span})")
+        fig.tight_layout()
+        return fig
+
+    if gtype in ('histogram', 'hist', 'box', 'boxplot'):
+        # distribution of the selected case values, from merged per-month sketches
+        sketch = _distribution(df, plot_df, state, month, year, case_type, start_date, end_date)
+        if gtype in ('histogram', 'hist'):
+            if not len(sketch):
+                raise ValueError("No numeric data available for histogram")
+            counts, edges = sketch.histogram()
+            ax.stairs(counts, edges, fill=True)
+            ax.set_xlabel(case_type)
+            ax.set_ylabel('Frequency')
+        else:
+            if not len(sketch):
+                raise ValueError("No numeric data available for boxplot")
+            ax.bxp([sketch.box_stats()], vert=True)
+            ax.set_ylabel(case_type)
+        ax.set_title(f"{case_type} ({graph_type})")
         fig.tight_layout()
         return fig
 
+    # Forecast overlay: daily and date-range line charts only
+    fc_df = None
+    if (gtype == 'line' and forecast is not None and case_type in forecast.columns
+            and (range_mode or month is not None)):
+        fc_df = _filter_table(_ensure_date_columns(forecast), state, month, year, start_date,
+                              None if open_end else end_date)
+        if fc_df.empty:
+            fc_df = None
+
     # For other charts we determine x and y
-    if month is not None:
+    bar_width = 0.8
+    if range_mode:
+        start, end = _range_bounds(df, start_date, end_date)
+        # An open end runs on to the last forecast date
+        fc_end = max(end, fc_df['Date'].max()) if fc_df is not None and open_end else end
+        freq = range_freq(start, fc_end)
+        date_col = 'Period' if case_type in RATE_METRICS else 'Date'
+        agg = _aggregate_range(plot_df, case_type, freq, start, end, fill_value, date_col)
+        x = agg.index
+        y = agg.values
+        bar_width = _RANGE_BAR_WIDTH[freq]
+        ax.set_xlabel(_RANGE_LABELS[freq])
+        locator = mdates.AutoDateLocator()
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    elif month is not None:
         # ensure all days exist in the month
         # aggregate by day
-        days_in_month = monthrange(int(year) if year is not None else int(plot_df['Year'].iloc[0]), int(month))[1]
-        agg = plot_df.groupby('Day')[case_type].sum()
-        
-        full_index = pd.RangeIndex(1, days_in_month + 1)
-        agg = agg.reindex(full_index, fill_value=0)
+        days_in_month = _days_in_month(plot_df, month, year)
+        agg = _aggregate(plot_df, case_type, month, year, days_in_month, fill_value)
         x = list(agg.index)
         y = agg.values
         ax.set_xlabel('Day')
@@ -102,9 +375,8 @@ def create_figure(df: pd.DataFrame,
         ax.set_xticklabels([str(d) for d in range(1, days_in_month + 1)])
     elif year is not None:
         # aggregate by month 1..12
-        agg = plot_df.groupby('Month')[case_type].sum()
-        full_index = pd.RangeIndex(1, 13)
-        agg = agg.reindex(full_index, fill_value=0)
+        days_in_month = None
+        agg = _aggregate(plot_df, case_type, month, year, fill_value=fill_value)
         x = list(range(1, 13))
         y = agg.values
         ax.set_xlabel('Month')
@@ -112,7 +384,8 @@ def create_figure(df: pd.DataFrame,
         ax.set_xticklabels([str(m) for m in x])
     else:
         # aggregate by year
-        agg = plot_df.groupby('Year')[case_type].sum().sort_index()
+        days_in_month = None
+        agg = _aggregate(plot_df, case_type, month, year)
         x = list(agg.index)
         y = agg.values
         ax.set_xlabel('Year')
@@ -120,29 +393,24 @@ def create_figure(df: pd.DataFrame,
         ax.set_xticklabels([str(int(v)) for v in x])
 
     # Plot according to graph type
+    marker = 'o' if len(x) <= MAX_MARKER_POINTS else None
     if gtype == 'line':
-        ax.plot(x, y, marker='o', color=color)
+        ax.plot(x, y, marker=marker, color=color)
+        if fc_df is not None:
+            # NaN where the forecast has no value so only forecast days are drawn
+            if range_mode:
+                fc = _aggregate_range(fc_df, case_type, freq, start, fc_end, fill_value=np.nan)
+            else:
+                fc = _aggregate(fc_df, case_type, month, year, days_in_month, fill_value=np.nan)
+            ax.plot(fc.index, fc.values, linestyle='--', color=color, alpha=0.8, label='Forecast')
+            ax.legend()
     elif gtype == 'bar':
-        ax.bar(x, y, color=color)
+        ax.bar(x, y, width=bar_width, color=color)
     elif gtype == 'scatter':
         ax.scatter(x, y, color=color)
     elif gtype == 'area':
         ax.fill_between(x, y, step='mid', alpha=0.4)
-        ax.plot(x, y, marker='o', color=color)
-    elif gtype == 'histogram' or gtype == 'hist':
-        # histogram of the raw selected case values
-        raw = plot_df[case_type].dropna().values
-        if raw.size == 0:
-            raise ValueError("No numeric data available for histogram")
-        ax.hist(raw)
-        ax.set_xlabel(case_type)
-        ax.set_ylabel('Frequency')
-    elif gtype == 'box' or gtype == 'boxplot':
-        raw = plot_df[case_type].dropna().values
-        if raw.size == 0:
-            raise ValueError("No numeric data available for boxplot")
-        ax.boxplot(raw, vert=True)
-        ax.set_ylabel(case_type)
+        ax.plot(x, y, marker=marker, color=color)
     else:
         raise ValueError(f"Unknown graph type: {graph_type}")
 
@@ -1,7 +1,12 @@
 
+import hashlib
+import weakref
+
 import pandas as pd
 import numpy as np
 
+from data.regions import MERGED_REGIONS, RegionNormalizer, normalize_regions
+
 
 DEFAULT_CASE_COLUMNS = [
     "Confirmed Cases",
@@ -35,9 +40,11 @@ def _standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def load_data_from_file(path: str) -> pd.DataFrame:
+def load_data_from_file(path: str, min_year: int | None = 2020,
+                        region_normalizer: RegionNormalizer | None = None) -> pd.DataFrame:
     """
     Load CSV/XLSX and return cleaned DataFrame. Raises exceptions on failure.
+    min_year and region_normalizer are passed on to ``clean_data``.
     """
     if path.lower().endswith('.csv'):
         df = pd.read_csv(path, dtype=str)
@@ -47,18 +54,27 @@ def load_data_from_file(path: str) -> pd.DataFrame:
         raise ValueError("Unsupported file type: expected .csv or .xlsx")
 
     df = _standardize_columns(df)
-    return clean_data(df)
+    return clean_data(df, min_year=min_year, region_normalizer=region_normalizer)
 
 
-def clean_data(df: pd.DataFrame, min_year: int = 2020) -> pd.DataFrame:
+def clean_data(df: pd.DataFrame, min_year: int | None = 2020,
+               region_normalizer: RegionNormalizer | None = None) -> pd.DataFrame:
     """
     Clean and normalize the DataFrame for plotting. Steps:
       - standardize column names
       - parse Date column to datetime (coerce invalid → NaT)
+      - map Region spellings, aliases and renamed territories to canonical names
+        (``data.regions``; region_normalizer defaults to ``DEFAULT_NORMALIZER``),
+        once per distinct name; the names renamed or left unmatched in this
+        load are kept in ``df.attrs['region_report']`` (see ``region_report``)
       - drop rows without Date or Region
-      - enforce Year >= min_year (removes bad years like 1970, 2014, 2015)
+      - enforce Year >= min_year (removes bad years like 1970, 2014, 2015);
+        pass None to keep them, e.g. to report them with ``data.validation``
       - convert case columns to numeric and fill NaN with 0
       - drop exact duplicates and reset index
+      - add up the former parts of a merged territory (``MERGED_REGIONS``)
+        reported on the same date, so each (Region, Date) appears once
+      - store Region as a categorical (one code per row instead of a string)
     """
     if df is None:
         return pd.DataFrame()
@@ -68,10 +84,11 @@ def clean_data(df: pd.DataFrame, min_year: int = 2020) -> pd.DataFrame:
     # Parse date
     df['Date'] = pd.to_datetime(df.get('Date'), dayfirst=True, errors='coerce')
 
-    # Drop rows without valid date or region
-    df['Region'] = df.get('Region').astype(str).str.strip()
-    df = df.dropna(subset=['Date'])
-    df = df[df['Region'].notna() & (df['Region'] != '')]
+    # Canonical region names as categories; drop rows without valid date or region
+    raw_regions = df['Region']
+    names = []
+    df['Region'] = normalize_regions(raw_regions, region_normalizer, report=names)
+    df = df.dropna(subset=['Date', 'Region'])
 
     # Year/Month/Day
     df['Year'] = df['Date'].dt.year
@@ -79,7 +96,8 @@ def clean_data(df: pd.DataFrame, min_year: int = 2020) -> pd.DataFrame:
     df['Day'] = df['Date'].dt.day
 
     # Remove obviously bad years (before min_year) unless user wants otherwise
-    df = df[df['Year'] >= int(min_year)]
+    if min_year is not None:
+        df = df[df['Year'] >= int(min_year)]
 
     # Ensure numeric columns exist and convert
     for col in DEFAULT_CASE_COLUMNS:
@@ -91,13 +109,65 @@ def clean_data(df: pd.DataFrame, min_year: int = 2020) -> pd.DataFrame:
 
     # Remove duplicates (exact duplicate rows)
     df = df.drop_duplicates()
+    df = _combine_merged_regions(df, raw_regions, names)
 
     # Sort by Date for predictable plotting
     df = df.sort_values('Date').reset_index(drop=True)
 
+    # A few dozen regions repeated over every row: kept as category codes,
+    # without categories left empty by the filters above
+    df['Region'] = df['Region'].cat.remove_unused_categories()
+
+    df.attrs['region_report'] = names
     return df
 
 
+def _combine_merged_regions(df: pd.DataFrame, raw_regions: pd.Series, names: list) -> pd.DataFrame:
+    # Rows of a merged territory reported under its former names (e.g. Dadra
+    # and Nagar Haveli, Daman and Diu) share one (Region, Date) once renamed.
+    # Sum the last row of each former name per date; on a date the merged
+    # name itself is reported, that row wins and the parts are dropped.
+    former = {name for name, region, how, _ in names if region in MERGED_REGIONS and how != "exact"}
+    if not former:
+        return df
+    merged = df['Region'].isin(MERGED_REGIONS).to_numpy()
+    part = df[merged]
+    raw = raw_regions.loc[part.index].astype(str)
+    is_part = raw.isin(former)
+    dates = [part['Region'], part['Date']]
+    whole = (~is_part).groupby(dates, observed=True).transform('any')
+    parts = part[is_part & ~whole].assign(_raw=raw[is_part & ~whole])
+    parts = parts.drop_duplicates(['Region', 'Date', '_raw'], keep='last').drop(columns='_raw')
+    agg = {col: 'sum' if col in DEFAULT_CASE_COLUMNS else 'first'
+           for col in parts.columns if col not in ('Region', 'Date')}
+    summed = parts.groupby(['Region', 'Date'], observed=True, sort=False).agg(agg).reset_index()
+    return pd.concat([df[~merged], part[~is_part], summed[df.columns]], ignore_index=True)
+
+
+# id(frame) -> (weakref to frame, fingerprint), see dataset_fingerprint
+_FINGERPRINTS = {}
+
+
+def dataset_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Return a short hex digest of a DataFrame's column names and values.
+    Equal data gives an equal fingerprint, so it can key caches across reloads.
+
+    The digest is remembered per frame object, so repeated calls on the same
+    (unmodified) frame are free. Cleaned frames are never modified in place.
+    """
+    hit = _FINGERPRINTS.get(id(df))
+    if hit is not None and hit[0]() is df:
+        return hit[1]
+    h = hashlib.blake2b(digest_size=16)
+    h.update("\x1f".join(map(str, df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    fingerprint = h.hexdigest()
+    key = id(df)
+    _FINGERPRINTS[key] = (weakref.ref(df, lambda _: _FINGERPRINTS.pop(key, None)), fingerprint)
+    return fingerprint
+
+
 def remove_outliers(df: pd.DataFrame, case_columns: list | None = None, group_by: str = 'Year', iqr_multiplier: float = 1.5) -> pd.DataFrame:
     """
     Optional IQR-based outlier removal. Operates _in-place_ on a copy and returns cleaned df.
@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+from data.cleaning_pipeline import DEFAULT_CASE_COLUMNS
+
+KEY_COLUMNS = ["Region", "Date"]
+
+
+def _region_codes(df: pd.DataFrame, regions: pd.Index) -> np.ndarray:
+    # Region codes of df in the shared ``regions`` space
+    region = df['Region']
+    if isinstance(region.dtype, pd.CategoricalDtype):
+        mapper = regions.get_indexer(region.cat.categories.astype(str))
+        codes = region.cat.codes.values
+        return np.where(codes < 0, -1, mapper[codes]).astype(np.int64)
+    return regions.get_indexer(region.astype(str)).astype(np.int64)
+
+
+def _keyed_rows(df: pd.DataFrame, regions: pd.Index, dates: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sorted exact int64 (Region, Date) keys of df and the row position of each,
+    with Region and Date numbered in spaces shared by both snapshots. When a key
+    occurs more than once the last row wins.
+    """
+    day = np.searchsorted(dates, df['Date'].values.astype('datetime64[ns]').view('int64'))
+    keys = day * (len(regions) + 1) + _region_codes(df, regions) + 1
+    # Cleaned frames are sorted by Date but not by Region within a date, so the
+    # keys need a real sort; stable, so the last of duplicate keys stays last
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    last = np.ones(len(keys), dtype=bool)
+    last[:-1] = keys[1:] != keys[:-1]
+    return keys[last], order[last]
+
+
+def _lookup(keys: np.ndarray, sorted_keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # (found mask, position in sorted_keys) for every key
+    if not len(sorted_keys):
+        return np.zeros(len(keys), dtype=bool), np.zeros(len(keys), dtype=np.int64)
+    pos = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+    return sorted_keys[pos] == keys, pos
+
+
+class SnapshotDiff:
+    """
+    Result of ``diff_snapshots``.
+
+    ``added`` and ``removed`` are the rows whose (Region, Date) only exist in
+    the new or old snapshot. ``revised`` lists every changed cell of rows
+    present in both, one row per (Region, Date, Column) with the old and new
+    values. All three only hold changed data.
+    """
+
+    def __init__(self, added: pd.DataFrame, removed: pd.DataFrame, revised: pd.DataFrame, revised_rows: int):
+        self.added = added
+        self.removed = removed
+        self.revised = revised
+        self.revised_rows = revised_rows
+
+    def __bool__(self):
+        return bool(len(self.added) or len(self.removed) or self.revised_rows)
+
+    def describe(self) -> str:
+        return (f"{len(self.added):,} rows added, {len(self.removed):,} removed, "
+                f"{self.revised_rows:,} revised ({len(self.revised):,} cells)")
+
+    @property
+    def summary(self) -> pd.DataFrame:
+        """Per-region counts of added, removed and revised rows and the net change of each revised column."""
+        counts = {
+            'Added': self.added['Region'].astype(str).value_counts(),
+            'Removed': self.removed['Region'].astype(str).value_counts(),
+            'Revised': self.revised.drop_duplicates(KEY_COLUMNS)['Region'].value_counts(),
+        }
+        net = self.revised.groupby(['Region', 'Column'])['Change'].sum().unstack(fill_value=0)
+        out = pd.DataFrame(counts).join(net.add_suffix(" change"), how='outer')
+        # Integer case columns stay integers once the missing counts are filled
+        out = out.fillna(0).astype({c: self.revised['Change'].dtype for c in out.columns if c.endswith(" change")})
+        out = out.astype({c: int for c in counts})
+        out.index.name = 'Region'
+        return out.sort_values(['Revised', 'Added', 'Removed'], ascending=False).reset_index()
+
+
+def diff_snapshots(old: pd.DataFrame, new: pd.DataFrame, columns: list | None = None) -> SnapshotDiff:
+    """
+    Compare two cleaned snapshots of the dataset keyed by (Region, Date).
+
+    Each (Region, Date) is reduced to an exact int64 key (date rank x region
+    code); the keys of both frames are matched with binary search and only
+    the ``columns`` (default: the case columns present in both frames) of
+    matched rows are compared, so only rows that actually changed are ever
+    materialised.
+    """
+    if columns is None:
+        columns = [c for c in DEFAULT_CASE_COLUMNS if c in old.columns and c in new.columns]
+
+    regions = pd.Index(sorted(set(map(str, pd.unique(old['Region']))) | set(map(str, pd.unique(new['Region'])))))
+    dates = np.union1d(pd.unique(old['Date'].values.astype('datetime64[ns]').view('int64')),
+                       pd.unique(new['Date'].values.astype('datetime64[ns]').view('int64')))
+    old_keys, old_rows = _keyed_rows(old, regions, dates)
+    new_keys, new_rows = _keyed_rows(new, regions, dates)
+
+    in_old, pos = _lookup(new_keys, old_keys)
+    in_new, _ = _lookup(old_keys, new_keys)
+    added = new.iloc[np.sort(new_rows[~in_old])]
+    removed = old.iloc[np.sort(old_rows[~in_new])]
+
+    # Rows present in both: find the revised ones, then compare those cell by cell
+    old_common, new_common = old_rows[pos[in_old]], new_rows[in_old]
+    changed = np.zeros(len(old_common), dtype=bool)
+    for col in columns:
+        changed |= old[col].values[old_common] != new[col].values[new_common]
+    old_common, new_common = old_common[changed], new_common[changed]
+
+    region = np.asarray(new['Region'].values[new_common]).astype(str)
+    date = new['Date'].values[new_common]
+    parts = []
+    for col in columns:
+        before = old[col].values[old_common]
+        after = new[col].values[new_common]
+        diff = before != after
+        parts.append(pd.DataFrame({
+            'Region': region[diff],
+            'Date': date[diff],
+            'Column': col,
+            'Old': before[diff],
+            'New': after[diff],
+            'Change': after[diff] - before[diff],
+        }))
+    if not parts:
+        # No value columns to compare: only added and removed rows
+        revised = pd.DataFrame({'Region': pd.Series(dtype=str), 'Date': pd.Series(dtype='datetime64[ns]'),
+                                'Column': pd.Series(dtype=str), 'Old': pd.Series(dtype=np.int64),
+                                'New': pd.Series(dtype=np.int64), 'Change': pd.Series(dtype=np.int64)})
+        return SnapshotDiff(added, removed, revised, 0)
+    revised = pd.concat(parts, ignore_index=True).sort_values(KEY_COLUMNS, kind='stable').reset_index(drop=True)
+    return SnapshotDiff(added, removed, revised, int(len(new_common)))
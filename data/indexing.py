@@ -0,0 +1,110 @@
+import weakref
+
+import numpy as np
+import pandas as pd
+
+
+class DateIndex:
+    """
+    Row indexes over a cleaned frame for date-range lookups without masks.
+
+    Two orderings are kept:
+      - all rows sorted by Date (the frame's own order after ``clean_data``)
+      - rows sorted by (Region, Date), with ``region_offsets`` giving the
+        start/end position of each region's block
+
+    A (region, start, end) query is then one or two ``searchsorted`` calls on
+    the sorted dates plus a slice, i.e. O(log n + k) for k matching rows.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        dates = df['Date'].values.astype('datetime64[ns]').view('int64')
+        self.n_rows = len(df)
+
+        # Date order; None when the frame is already sorted (the usual case)
+        if len(dates) and np.any(dates[1:] < dates[:-1]):
+            self.date_order = np.argsort(dates, kind='stable')
+            self.sorted_dates = dates[self.date_order]
+        else:
+            self.date_order = None
+            self.sorted_dates = dates
+
+        region = df['Region']
+        if isinstance(region.dtype, pd.CategoricalDtype):
+            codes = region.cat.codes.values.astype(np.int64)
+            categories = list(region.cat.categories)
+        else:
+            codes, uniques = pd.factorize(region)
+            categories = list(uniques)
+        self.region_codes = {str(name): i for i, name in enumerate(categories)}
+
+        # (Region, Date) order: stable sort of the date-ordered codes
+        by_date = codes if self.date_order is None else codes[self.date_order]
+        order = np.argsort(by_date, kind='stable')
+        self.region_order = order if self.date_order is None else self.date_order[order]
+        self.region_dates = dates[self.region_order]
+        sorted_codes = by_date[order]
+        # Rows without a region (code -1) sort first and fall before offset 0
+        self.region_offsets = np.searchsorted(sorted_codes, np.arange(len(categories) + 1), side='left')
+
+    @staticmethod
+    def _bound(value, default):
+        if value is None:
+            return default
+        return pd.Timestamp(value).value
+
+    def region_range(self, region: str) -> tuple[int, int]:
+        """Start/end positions of region's block in ``region_order``."""
+        code = self.region_codes.get(str(region))
+        if code is None:
+            return 0, 0
+        return int(self.region_offsets[code]), int(self.region_offsets[code + 1])
+
+    def rows(self, region: str | None = None, start=None, end=None) -> np.ndarray | slice:
+        """
+        Positions of rows with Region == region (any region when None) and
+        start <= Date <= end (open-ended when None). Rows without a Date
+        only match when both ends are open.
+
+        Returns a ``slice`` when the rows are contiguous in the frame (no
+        region given and the frame is sorted by Date), otherwise an array.
+        """
+        # NaT is the smallest int64: it only matches a fully open range, like
+        # a mask with no date condition would
+        nat = np.iinfo(np.int64).min
+        lo_value = self._bound(start, nat if end is None else nat + 1)
+        hi_value = self._bound(end, np.iinfo(np.int64).max)
+        if region is None:
+            lo = np.searchsorted(self.sorted_dates, lo_value, side='left')
+            hi = np.searchsorted(self.sorted_dates, hi_value, side='right')
+            if self.date_order is None:
+                return slice(int(lo), int(hi))
+            return self.date_order[lo:hi]
+        a, b = self.region_range(region)
+        block = self.region_dates[a:b]
+        lo = np.searchsorted(block, lo_value, side='left')
+        hi = np.searchsorted(block, hi_value, side='right')
+        return self.region_order[a + lo:a + hi]
+
+
+# id(frame) -> (weakref to frame, DateIndex)
+_INDEXES = {}
+
+
+def date_index(df: pd.DataFrame) -> DateIndex:
+    """
+    Return the ``DateIndex`` of a frame, building it on first use.
+    Indexes are kept per frame object; cleaned frames are never modified in place.
+    """
+    hit = _INDEXES.get(id(df))
+    if hit is not None and hit[0]() is df:
+        return hit[1]
+    index = DateIndex(df)
+    key = id(df)
+    _INDEXES[key] = (weakref.ref(df, lambda _: _INDEXES.pop(key, None)), index)
+    return index
+
+
+def slice_rows(df: pd.DataFrame, region: str | None = None, start=None, end=None) -> pd.DataFrame:
+    """Rows of df for region between start and end (inclusive), via ``date_index``."""
+    return df.iloc[date_index(df).rows(region, start, end)]
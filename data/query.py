@@ -0,0 +1,290 @@
+import re
+import time
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from data.indexing import date_index
+
+# Rows per block for the min/max block summaries
+BLOCK_SIZE = 1024
+
+# Short names accepted in numeric predicates
+COLUMN_ALIASES = {
+    "confirmed": "Confirmed Cases",
+    "cases": "Confirmed Cases",
+    "active": "Active Cases",
+    "cured": "Cured/Discharged",
+    "recovered": "Cured/Discharged",
+    "discharged": "Cured/Discharged",
+    "death": "Death",
+    "deaths": "Death",
+}
+
+_CLAUSE_SPLIT = re.compile(r"\s*(?:,|;|&&)\s*")
+_AND_SPLIT = re.compile(r"\s+and\s+", re.IGNORECASE)
+_NUMERIC = re.compile(r"^(.+?)\s*(>=|<=|==|!=|=|>|<)\s*(-?\d+(?:\.\d+)?)$")
+_DATE_CMP = re.compile(r"^date\s*(>=|<=|=|>|<)\s*(\S+)$", re.IGNORECASE)
+
+
+def _is_region_clause(clause: str) -> bool:
+    return clause.lower().startswith(("region:", "state:"))
+
+
+def _starts_clause(text: str) -> bool:
+    # Whether text reads as a clause rather than the rest of a region name
+    return (_is_region_clause(text) or text.lower().startswith("date:")
+            or bool(_DATE_CMP.match(text)) or bool(_NUMERIC.match(text)))
+
+
+class Query:
+    """
+    Parsed Data-tab query. Clauses are separated by commas, ``;``, ``&&`` or
+    ``and`` (an ``and`` inside a region name, as in ``region:jammu and
+    kashmir``, is kept when the text after it is not a clause of its own):
+
+      - ``region:ma``               regions starting with "ma" (case-insensitive)
+      - ``date:2021-01-01..2021-03-31``  inclusive date range, either end optional
+      - ``date >= 2021-01-01``      one-sided date bounds (>=, <=, >, <, =)
+      - ``Death > 1000``            numeric predicate on a case column
+        (operators >, >=, <, <=, =, ==, !=; short names like ``deaths`` work)
+    """
+
+    def __init__(self, text: str = ""):
+        self.text = text
+        self.region_prefixes = []
+        self.start = None
+        self.end = None
+        self.predicates = []
+        for part in _CLAUSE_SPLIT.split(text.strip()):
+            clauses = []
+            for piece in _AND_SPLIT.split(part):
+                if clauses and _is_region_clause(clauses[-1]) and not _starts_clause(piece):
+                    clauses[-1] += " and " + piece
+                else:
+                    clauses.append(piece)
+            for clause in clauses:
+                if clause:
+                    self._parse_clause(clause)
+
+    def _parse_clause(self, clause: str):
+        lower = clause.lower()
+        if _is_region_clause(clause):
+            self.region_prefixes.append(clause.split(":", 1)[1].strip().casefold())
+            return
+        if lower.startswith("date:"):
+            lo, sep, hi = clause.split(":", 1)[1].partition("..")
+            if not sep:
+                lo = hi = lo
+            if lo.strip():
+                self._set_start(pd.Timestamp(lo.strip()))
+            if hi.strip():
+                self._set_end(pd.Timestamp(hi.strip()))
+            return
+        m = _DATE_CMP.match(clause)
+        if m:
+            op, value = m.group(1), pd.Timestamp(m.group(2))
+            if op in (">=", "="):
+                self._set_start(value)
+            if op in ("<=", "="):
+                self._set_end(value)
+            if op == ">":
+                self._set_start(value + pd.Timedelta(days=1))
+            if op == "<":
+                self._set_end(value - pd.Timedelta(days=1))
+            return
+        m = _NUMERIC.match(clause)
+        if m:
+            name = m.group(1).strip()
+            column = COLUMN_ALIASES.get(name.lower(), name)
+            op = "==" if m.group(2) == "=" else m.group(2)
+            self.predicates.append((column, op, float(m.group(3))))
+            return
+        raise ValueError(f"Cannot parse query clause: '{clause}'")
+
+    def _set_start(self, value):
+        self.start = value if self.start is None else max(self.start, value)
+
+    def _set_end(self, value):
+        self.end = value if self.end is None else min(self.end, value)
+
+
+class QueryResult:
+    """
+    Matching row positions (into the queried frame) plus scan statistics:
+    ``rows_scanned`` were compared value by value, ``rows_skipped`` were
+    ruled out by the region/date indexes or by block min/max summaries.
+    """
+
+    def __init__(self, rows: np.ndarray, rows_scanned: int, rows_skipped: int, seconds: float):
+        self.rows = rows
+        self.rows_scanned = rows_scanned
+        self.rows_skipped = rows_skipped
+        self.seconds = seconds
+
+    def __len__(self):
+        return len(self.rows)
+
+    def describe(self) -> str:
+        return (f"{len(self.rows):,} rows matched - scanned {self.rows_scanned:,}, "
+                f"skipped {self.rows_skipped:,} ({self.seconds * 1000:.1f} ms)")
+
+
+def _ranges_to_positions(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    # Concatenation of arange(s, e) for every (s, e), without a Python loop
+    lengths = ends - starts
+    keep = lengths > 0
+    starts, lengths = starts[keep], lengths[keep]
+    if not len(starts):
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+    return np.arange(lengths.sum(), dtype=np.int64) + offsets
+
+
+_OPS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+
+def _block_status(op: str, value: float, bmin: np.ndarray, bmax: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # (every row of the block matches, no row of the block matches)
+    if op in (">", ">="):
+        return _OPS[op](bmin, value), ~_OPS[op](bmax, value)
+    if op in ("<", "<="):
+        return _OPS[op](bmax, value), ~_OPS[op](bmin, value)
+    if op == "==":
+        return (bmin == value) & (bmax == value), (value < bmin) | (value > bmax)
+    return (value < bmin) | (value > bmax), (bmin == value) & (bmax == value)
+
+
+class QueryIndex:
+    """
+    Indexes used to answer ``Query`` objects on a cleaned frame:
+
+      - region -> row range, and sorted dates within each region, from
+        ``data.indexing.date_index`` (rows in (Region, Date) order)
+      - per-column min/max summaries over blocks of ``BLOCK_SIZE`` rows in
+        that same order, built lazily per column
+
+    Blocks whose min/max rule out a predicate are skipped, blocks whose
+    min/max guarantee it are taken whole, and only the rest are scanned.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        # Weak, so the per-frame cache does not keep the frame alive
+        self._frame = weakref.ref(df)
+        self.index = date_index(df)
+        self._columns = {}
+        self._summaries = {}
+        self._categories = sorted(self.index.region_codes)
+
+    def _column(self, name: str) -> np.ndarray:
+        # Column values in (Region, Date) order
+        if name not in self._columns:
+            df = self._frame()
+            if df is None:
+                raise RuntimeError("The frame of this QueryIndex no longer exists")
+            if name not in df.columns:
+                raise ValueError(f"Unknown column in query: '{name}'")
+            values = df[name].values
+            if not np.issubdtype(values.dtype, np.number):
+                raise ValueError(f"Column '{name}' is not numeric")
+            self._columns[name] = values[self.index.region_order]
+        return self._columns[name]
+
+    def _summary(self, name: str) -> tuple[np.ndarray, np.ndarray]:
+        if name not in self._summaries:
+            values = self._column(name)
+            n = len(values)
+            n_blocks = -(-n // BLOCK_SIZE)
+            starts = np.arange(n_blocks) * BLOCK_SIZE
+            self._summaries[name] = (np.minimum.reduceat(values, starts), np.maximum.reduceat(values, starts))
+        return self._summaries[name]
+
+    def _candidate_ranges(self, query: Query) -> tuple[np.ndarray, np.ndarray]:
+        # Position ranges (in region order) allowed by the region and date clauses
+        if query.region_prefixes:
+            regions = [r for r in self._categories if any(r.casefold().startswith(p) for p in query.region_prefixes)]
+        else:
+            regions = self._categories
+        lo_value = np.iinfo(np.int64).min if query.start is None else query.start.value
+        hi_value = np.iinfo(np.int64).max if query.end is None else query.end.value
+        starts, ends = [], []
+        for region in regions:
+            a, b = self.index.region_range(region)
+            block = self.index.region_dates[a:b]
+            starts.append(a + np.searchsorted(block, lo_value, side='left'))
+            ends.append(a + np.searchsorted(block, hi_value, side='right'))
+        return np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64)
+
+    def run(self, query: Query | str) -> QueryResult:
+        """Answer a query; result rows are frame positions in (Region, Date) order."""
+        t0 = time.perf_counter()
+        if isinstance(query, str):
+            query = Query(query)
+        n = self.index.n_rows
+        starts, ends = self._candidate_ranges(query)
+        in_ranges = int((ends - starts).sum())
+        skipped = n - in_ranges
+
+        if not query.predicates:
+            positions = _ranges_to_positions(starts, ends)
+            return QueryResult(self.index.region_order[positions], 0, skipped, time.perf_counter() - t0)
+
+        # Split the candidate ranges at block boundaries
+        keep = ends > starts
+        starts, ends = starts[keep], ends[keep]
+        b0, b1 = starts // BLOCK_SIZE, (ends - 1) // BLOCK_SIZE
+        counts = b1 - b0 + 1
+        range_of = np.repeat(np.arange(len(starts)), counts)
+        block = b0[range_of] + (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+        seg_start = np.maximum(block * BLOCK_SIZE, starts[range_of])
+        seg_end = np.minimum((block + 1) * BLOCK_SIZE, ends[range_of])
+
+        all_match = np.ones(len(block), dtype=bool)
+        none_match = np.zeros(len(block), dtype=bool)
+        for column, op, value in query.predicates:
+            bmin, bmax = self._summary(column)
+            full, empty = _block_status(op, value, bmin[block], bmax[block])
+            all_match &= full
+            none_match |= empty
+        live = ~none_match
+        skipped += int((seg_end - seg_start)[none_match].sum())
+
+        # Segments stay in (Region, Date) order; only rows of partial blocks are compared
+        seg_start, seg_end, partial = seg_start[live], seg_end[live], ~all_match[live]
+        positions = _ranges_to_positions(seg_start, seg_end)
+        scan = np.repeat(partial, seg_end - seg_start)
+        scan_pos = positions[scan]
+        mask = np.ones(len(scan_pos), dtype=bool)
+        for column, op, value in query.predicates:
+            mask &= _OPS[op](self._column(column)[scan_pos], value)
+        scan[scan] = ~mask
+        positions = positions[~scan]
+        return QueryResult(self.index.region_order[positions], len(scan_pos), skipped, time.perf_counter() - t0)
+
+
+# id(frame) -> (weakref to frame, QueryIndex)
+_QUERY_INDEXES = {}
+
+
+def query_index(df: pd.DataFrame) -> QueryIndex:
+    """Return the ``QueryIndex`` of a frame, building it on first use."""
+    hit = _QUERY_INDEXES.get(id(df))
+    if hit is not None and hit[0]() is df:
+        return hit[1]
+    index = QueryIndex(df)
+    key = id(df)
+    _QUERY_INDEXES[key] = (weakref.ref(df, lambda _: _QUERY_INDEXES.pop(key, None)), index)
+    return index
+
+
+def run_query(df: pd.DataFrame, text: str) -> QueryResult:
+    """Parse and answer a Data-tab query against df (see ``Query`` for the syntax)."""
+    return query_index(df).run(Query(text))
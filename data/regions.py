@@ -0,0 +1,200 @@
+import csv
+import difflib
+import re
+
+import numpy as np
+import pandas as pd
+
+# States and union territories as they should appear after cleaning
+CANONICAL_REGIONS = (
+    "Andaman and Nicobar Islands",
+    "Andhra Pradesh",
+    "Arunachal Pradesh",
+    "Assam",
+    "Bihar",
+    "Chandigarh",
+    "Chhattisgarh",
+    "Dadra and Nagar Haveli and Daman and Diu",
+    "Delhi",
+    "Goa",
+    "Gujarat",
+    "Haryana",
+    "Himachal Pradesh",
+    "Jammu and Kashmir",
+    "Jharkhand",
+    "Karnataka",
+    "Kerala",
+    "Ladakh",
+    "Lakshadweep",
+    "Madhya Pradesh",
+    "Maharashtra",
+    "Manipur",
+    "Meghalaya",
+    "Mizoram",
+    "Nagaland",
+    "Odisha",
+    "Puducherry",
+    "Punjab",
+    "Rajasthan",
+    "Sikkim",
+    "Tamil Nadu",
+    "Telangana",
+    "Tripura",
+    "Uttar Pradesh",
+    "Uttarakhand",
+    "West Bengal",
+)
+
+# Old names, abbreviations and merged territories -> canonical name. Keys are
+# matched after ``_region_key`` normalisation (case, "&", punctuation, markers).
+REGION_ALIASES = {
+    "orissa": "Odisha",
+    "pondicherry": "Puducherry",
+    "uttaranchal": "Uttarakhand",
+    "nct of delhi": "Delhi",
+    "delhi nct": "Delhi",
+    "new delhi": "Delhi",
+    "andaman and nicobar": "Andaman and Nicobar Islands",
+    "dadra and nagar haveli": "Dadra and Nagar Haveli and Daman and Diu",
+    "daman and diu": "Dadra and Nagar Haveli and Daman and Diu",
+    "dnhdd": "Dadra and Nagar Haveli and Daman and Diu",
+    "j and k": "Jammu and Kashmir",
+    "jammu kashmir": "Jammu and Kashmir",
+    "telengana": "Telangana",
+    # Placeholders are kept (and flagged by data.validation), only their spelling is unified
+    "state assignment pending": "State assignment pending",
+    "unassigned": "Unassigned",
+    "unknown": "Unknown",
+}
+
+# Territories formed by merging others: on a date reported only under the
+# former names, clean_data adds those rows up into one
+MERGED_REGIONS = frozenset({"Dadra and Nagar Haveli and Daman and Diu"})
+
+# Columns of the per-load report clean_data keeps in ``df.attrs['region_report']``
+REGION_REPORT_COLUMNS = ["Name", "Region", "Match", "Rows"]
+
+# Minimum difflib similarity for a fuzzy match
+FUZZY_CUTOFF = 0.88
+
+
+def _region_key(name: str) -> str:
+    # Lower case, "&" -> "and", drop punctuation and trailing markers such as "*" or "#"
+    key = str(name).casefold().replace("&", " and ")
+    key = re.sub(r"[^0-9a-z]+", " ", key)
+    return " ".join(key.split())
+
+
+def load_alias_table(path: str) -> dict:
+    """Read a two-column CSV (alias, canonical name) into an alias dict."""
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = [row for row in csv.reader(f) if len(row) >= 2]
+    if rows and rows[0][0].strip().lower() == "alias":
+        rows = rows[1:]
+    return {row[0].strip(): row[1].strip() for row in rows}
+
+
+class RegionNormalizer:
+    """
+    Map raw region names to canonical ones: exact match, then the alias table,
+    then a fuzzy (difflib) match against both, all on ``_region_key``-normalised
+    names. Names that match nothing keep their (whitespace-trimmed) spelling
+    and are recorded in ``unmatched``.
+
+    Every distinct raw name is resolved once and cached, and ``normalize``
+    works on the unique values of a column and broadcasts the result through
+    category codes, so its cost barely depends on the number of rows.
+    """
+
+    def __init__(self, canonical=CANONICAL_REGIONS, aliases: dict | None = None, cutoff: float = FUZZY_CUTOFF):
+        self.cutoff = cutoff
+        self._targets = {_region_key(name): name for name in canonical}
+        for alias, name in (REGION_ALIASES if aliases is None else aliases).items():
+            self._targets.setdefault(_region_key(alias), name)
+        self._keys = list(self._targets)
+        # raw name -> (resolved name, how: "exact" / "alias" / "fuzzy" / None)
+        self._cache = {}
+        # unmatched raw name -> rows seen
+        self.unmatched = {}
+        # raw name -> rows seen, for ``report``
+        self._rows = {}
+
+    def resolve(self, name: str) -> tuple[str, str | None]:
+        """Resolved name for one raw name and how it matched (None when unmatched)."""
+        hit = self._cache.get(name)
+        if hit is not None:
+            return hit
+        stripped = " ".join(str(name).split())
+        key = _region_key(name)
+        target = self._targets.get(key)
+        if target is not None:
+            how = "exact" if _region_key(target) == key else "alias"
+        else:
+            close = difflib.get_close_matches(key, self._keys, n=1, cutoff=self.cutoff)
+            target, how = (self._targets[close[0]], "fuzzy") if close else (stripped, None)
+        self._cache[name] = (target, how)
+        return target, how
+
+    def normalize(self, values: pd.Series, report: list | None = None) -> pd.Series:
+        """
+        Canonical region names for values as a categorical Series (same index).
+        Empty and missing names become NaN. When a list is given as report,
+        one (name, region, how, rows) tuple is appended for every raw name in
+        values that was renamed or left unmatched ("unmatched").
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes, names = values.cat.codes.values, values.cat.categories
+        else:
+            codes, names = pd.factorize(values)
+        names = [str(n) for n in names]
+
+        resolved = []
+        for name in names:
+            target = self.resolve(name)[0]
+            resolved.append(target if target.strip() else None)
+        new_names = sorted({r for r in resolved if r is not None})
+        lookup = {r: i for i, r in enumerate(new_names)}
+        mapper = np.array([lookup[r] if r is not None else -1 for r in resolved] + [-1], dtype=np.int64)
+
+        counts = np.bincount(codes[codes >= 0], minlength=len(names)) if len(names) else []
+        for name, n in zip(names, counts):
+            if not n or not name.strip():
+                continue
+            target, how = self._cache[name]
+            self._rows[name] = self._rows.get(name, 0) + int(n)
+            if how is None:
+                self.unmatched[name] = self.unmatched.get(name, 0) + int(n)
+            if report is not None and (how != "exact" or name != target):
+                report.append((name, target, how or "unmatched", int(n)))
+
+        # codes of -1 (missing) index the trailing -1 of mapper
+        new_codes = mapper[codes]
+        return pd.Series(pd.Categorical.from_codes(new_codes, categories=new_names), index=values.index, name=values.name)
+
+    def report(self) -> pd.DataFrame:
+        """
+        Raw names seen so far that were renamed or left unmatched, with how
+        they matched and their rows over every call (columns as ``region_report``).
+        """
+        rows = [(name, target, how or "unmatched", self._rows.get(name, 0))
+                for name, (target, how) in self._cache.items() if how != "exact" or name != target]
+        return pd.DataFrame(rows, columns=REGION_REPORT_COLUMNS).sort_values("Name", ignore_index=True)
+
+
+# Shared by clean_data so resolved names are cached across reloads
+DEFAULT_NORMALIZER = RegionNormalizer()
+
+
+def normalize_regions(values: pd.Series, normalizer: RegionNormalizer | None = None,
+                      report: list | None = None) -> pd.Series:
+    """Canonical region names for values via ``normalizer`` (``DEFAULT_NORMALIZER`` when None)."""
+    return (normalizer or DEFAULT_NORMALIZER).normalize(values, report)
+
+
+def region_report(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Region names renamed or left unmatched when ``df`` was cleaned, with how
+    they matched and their number of rows in that load (empty if unknown).
+    """
+    rows = df.attrs.get('region_report', ())
+    return pd.DataFrame(list(rows), columns=REGION_REPORT_COLUMNS).sort_values("Name", ignore_index=True)
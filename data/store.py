@@ -0,0 +1,204 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from data.cleaning_pipeline import DEFAULT_CASE_COLUMNS
+from data.indexing import date_index
+
+MANIFEST = "manifest.json"
+# Rows per row group; each group keeps min/max statistics in the manifest
+ROW_GROUP_SIZE = 65536
+
+
+def _partition_dir(year: int, region_code: int) -> str:
+    # Region names contain spaces and slashes, so directories use the region's code
+    return f"year={year}/region={region_code:04d}"
+
+
+def write_partitioned(df: pd.DataFrame, path: str, row_group_size: int = ROW_GROUP_SIZE) -> "PartitionedDataset":
+    """
+    Write a cleaned frame as a Year/Region partitioned columnar dataset.
+
+    Every (Year, Region) partition is a directory holding one ``.npy`` file per
+    column with rows in Date order; ``manifest.json`` lists the partitions and
+    min/max statistics for each block of ``row_group_size`` rows. Year, Month
+    and Day are derived from Date when reading, so they are not stored.
+    An existing dataset at path is replaced.
+    """
+    manifest_path = os.path.join(path, MANIFEST)
+    if os.path.isdir(path) and os.listdir(path):
+        if not os.path.exists(manifest_path):
+            raise ValueError(f"'{path}' is not empty and is not a partitioned dataset")
+        for entry in os.listdir(path):
+            if entry.startswith("year="):
+                shutil.rmtree(os.path.join(path, entry))
+    os.makedirs(path, exist_ok=True)
+
+    columns = ['Date'] + [c for c in DEFAULT_CASE_COLUMNS if c in df.columns]
+    regions = sorted(str(r) for r in pd.unique(df['Region'].dropna()))
+    index = date_index(df)
+    # (Region, Date) order is also (Region, Year, Date) order
+    order = index.region_order
+    region = df['Region']
+    if isinstance(region.dtype, pd.CategoricalDtype):
+        mapper = np.append(pd.Index(regions).get_indexer(region.cat.categories.astype(str)), -1)
+        region_pos = mapper[region.cat.codes.values[order]]
+    else:
+        region_pos = pd.Index(regions).get_indexer(region.astype(str).values[order])
+    dates = df['Date'].values.astype('datetime64[ns]')[order]
+    years = dates.astype('datetime64[Y]').astype(np.int64) + 1970
+    valid = (region_pos >= 0) & ~np.isnat(dates)
+    order, region_pos, dates, years = order[valid], region_pos[valid], dates[valid], years[valid]
+
+    bounds = np.flatnonzero((np.diff(region_pos) != 0) | (np.diff(years) != 0)) + 1
+    starts = np.concatenate(([0], bounds))
+    stops = np.concatenate((bounds, [len(order)]))
+    values = {c: df[c].values[order] for c in columns if c != 'Date'}
+    values['Date'] = dates
+
+    partitions = []
+    for start, stop in zip(starts, stops):
+        if start == stop:
+            continue
+        year, code = int(years[start]), int(region_pos[start])
+        rel = _partition_dir(year, code)
+        os.makedirs(os.path.join(path, rel), exist_ok=True)
+        for i, col in enumerate(columns):
+            np.save(os.path.join(path, rel, f"c{i}.npy"), values[col][start:stop])
+        row_groups = []
+        for g in range(start, stop, row_group_size):
+            h = min(g + row_group_size, stop)
+            stats = {c: values[c][g:h] for c in columns}
+            stats['Date'] = stats['Date'].view('int64')
+            row_groups.append({
+                'start': int(g - start),
+                'stop': int(h - start),
+                'min': {c: v.min().item() for c, v in stats.items()},
+                'max': {c: v.max().item() for c, v in stats.items()},
+            })
+        months = np.unique(dates[start:stop].astype('datetime64[M]').astype(np.int64) % 12 + 1)
+        partitions.append({
+            'year': year,
+            'region': regions[code],
+            'path': rel,
+            'rows': int(stop - start),
+            'months': [int(m) for m in months],
+            'row_groups': row_groups,
+        })
+
+    manifest = {
+        'version': 1,
+        'rows': int(len(order)),
+        'columns': [{'name': c, 'file': f"c{i}.npy"} for i, c in enumerate(columns)],
+        'regions': regions,
+        'row_group_size': row_group_size,
+        'partitions': partitions,
+    }
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f)
+    return PartitionedDataset(path)
+
+
+class PartitionedDataset:
+    """
+    Read side of ``write_partitioned``.
+
+    Only the manifest is loaded up front. ``read`` opens the column files of
+    the partitions that match the filters as memory maps, uses the row-group
+    Date statistics to skip groups outside the requested range and copies just
+    the remaining rows, so datasets larger than memory can be charted one
+    selection at a time. ``last_read`` reports what the latest read touched.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, MANIFEST)) as f:
+            self.manifest = json.load(f)
+        self.columns = [c['name'] for c in self.manifest['columns']]
+        self._files = {c['name']: c['file'] for c in self.manifest['columns']}
+        self.regions = list(self.manifest['regions'])
+        self.partitions = self.manifest['partitions']
+        self.years = sorted({p['year'] for p in self.partitions})
+        self.months = sorted({m for p in self.partitions for m in p['months']})
+        self.last_read = {}
+
+    def __len__(self):
+        return self.manifest['rows']
+
+    @property
+    def min_date(self) -> pd.Timestamp:
+        return pd.Timestamp(min(g['min']['Date'] for p in self.partitions for g in p['row_groups']))
+
+    @property
+    def max_date(self) -> pd.Timestamp:
+        return pd.Timestamp(max(g['max']['Date'] for p in self.partitions for g in p['row_groups']))
+
+    def read(self, regions: list | None = None, years: list | None = None, start=None, end=None,
+             columns: list | None = None) -> pd.DataFrame:
+        """
+        Rows for the given regions and years (all when None) with
+        start <= Date <= end, as a frame shaped like the output of ``clean_data``
+        (Date, Region, the requested case columns, Year, Month, Day) sorted by Date.
+        """
+        lo = np.iinfo(np.int64).min if start is None else pd.Timestamp(start).value
+        hi = np.iinfo(np.int64).max if end is None else pd.Timestamp(end).value
+        wanted = [c for c in (self.columns if columns is None else columns) if c in self.columns and c != 'Date']
+        region_set = None if regions is None else {str(r) for r in regions}
+        year_set = None if years is None else {int(y) for y in years}
+
+        stats = {'partitions_read': 0, 'partitions_skipped': 0, 'row_groups_read': 0, 'row_groups_skipped': 0}
+        parts = {c: [] for c in ['Date'] + wanted}
+        codes = []
+        for part in self.partitions:
+            if ((region_set is not None and part['region'] not in region_set)
+                    or (year_set is not None and part['year'] not in year_set)):
+                stats['partitions_skipped'] += 1
+                stats['row_groups_skipped'] += len(part['row_groups'])
+                continue
+            groups = [g for g in part['row_groups'] if g['max']['Date'] >= lo and g['min']['Date'] <= hi]
+            stats['row_groups_skipped'] += len(part['row_groups']) - len(groups)
+            if not groups:
+                stats['partitions_skipped'] += 1
+                continue
+            stats['partitions_read'] += 1
+            stats['row_groups_read'] += len(groups)
+
+            base = os.path.join(self.path, part['path'])
+            g0, g1 = groups[0]['start'], groups[-1]['stop']
+            dates = np.load(os.path.join(base, self._files['Date']), mmap_mode='r')[g0:g1].view('int64')
+            a = g0 + int(np.searchsorted(dates, lo, side='left'))
+            b = g0 + int(np.searchsorted(dates, hi, side='right'))
+            if a == b:
+                continue
+            for col in parts:
+                parts[col].append(np.array(np.load(os.path.join(base, self._files[col]), mmap_mode='r')[a:b]))
+            codes.append(np.full(b - a, self.regions.index(part['region']), dtype=np.int16))
+
+        self.last_read = stats
+        if not codes:
+            dates = np.empty(0, dtype='datetime64[ns]')
+            data = {c: np.empty(0, dtype=np.int64) for c in wanted}
+            codes = np.empty(0, dtype=np.int16)
+        else:
+            dates = np.concatenate(parts['Date'])
+            order = np.argsort(dates, kind='stable')
+            dates = dates[order]
+            data = {c: np.concatenate(parts[c])[order] for c in wanted}
+            codes = np.concatenate(codes)[order]
+
+        df = pd.DataFrame({
+            'Date': dates,
+            'Region': pd.Categorical.from_codes(codes, categories=self.regions),
+            **data,
+        })
+        df['Year'] = df['Date'].dt.year
+        df['Month'] = df['Date'].dt.month
+        df['Day'] = df['Date'].dt.day
+        return df
+
+    def to_frame(self) -> pd.DataFrame:
+        """Read the whole dataset into memory."""
+        return self.read()
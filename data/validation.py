@@ -0,0 +1,182 @@
+import numpy as np
+import pandas as pd
+
+from data.cleaning_pipeline import DEFAULT_CASE_COLUMNS
+
+
+# Rule name -> human readable description. The position of a rule in this
+# dict is its bit in ``ValidationReport.flags``.
+VALIDATION_RULES = {
+    "date_range": "Date outside the reporting window",
+    "placeholder_region": "Region is a placeholder, not a state/UT",
+    "non_monotonic": "Cumulative count out of line with the region's neighbouring reports",
+    "identity": "Confirmed Cases != Active Cases + Cured/Discharged + Death",
+}
+
+# First day of the reporting window checked by the date_range rule
+REPORTING_START = "2020-01-01"
+
+DEFAULT_PLACEHOLDER_REGIONS = (
+    "State assignment pending",
+    "Unassigned",
+    "Unknown",
+)
+
+# Columns that are running totals and therefore must never decrease
+CUMULATIVE_COLUMNS = [
+    "Confirmed Cases",
+    "Cured/Discharged",
+    "Death",
+]
+
+
+def _breaks_running_total(values: np.ndarray, same_region: np.ndarray) -> np.ndarray:
+    # values are one column ordered by (region, date); same_region[j] is True
+    # when rows j and j + 1 belong to the same region. For every drop a > b
+    # between neighbours, flag a (a spike) when dropping it restores the order
+    # (previous <= b), b (a dip) when dropping b does (a <= next), and when
+    # both or neither do, whichever lies further from the median of the four.
+    a, b = values[:-1], values[1:]
+    drop = same_region & (b < a)
+    out = np.zeros(len(values), dtype=bool)
+    if not drop.any():
+        return out
+    has_prev = np.concatenate([[False], same_region[:-1]])
+    has_next = np.concatenate([same_region[1:], [False]])
+    prev = np.concatenate([[0], values[:-2]])
+    nxt = np.concatenate([values[2:], [0]])
+    spike = ~has_prev | (prev <= b)
+    dip = ~has_next | (a <= nxt)
+    window = np.column_stack([np.where(has_prev, prev, np.nan), a, b, np.where(has_next, nxt, np.nan)])
+    median = np.nanmedian(window[drop], axis=1)
+    further = np.zeros(len(a), dtype=bool)
+    further[drop] = np.abs(a[drop] - median) > np.abs(b[drop] - median)
+    flag_a = drop & ((spike & ~dip) | ((spike == dip) & further))
+    out[:-1] |= flag_a
+    out[1:] |= drop & ~flag_a
+    return out
+
+
+class ValidationReport:
+    """
+    Result of ``validate_data``.
+
+    Only violating rows are stored: ``rows`` holds their positions in the
+    validated frame and ``flags`` the matching bitmask of failed rules (bit i is
+    the i-th rule of ``VALIDATION_RULES``).
+    """
+
+    def __init__(self, n_rows: int, rows: np.ndarray, flags: np.ndarray):
+        self.n_rows = n_rows
+        self.rows = rows
+        self.flags = flags
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def summary(self) -> pd.DataFrame:
+        """Number of violating rows per rule."""
+        counts = [int(np.count_nonzero(self.flags & (1 << bit))) for bit in range(len(VALIDATION_RULES))]
+        return pd.DataFrame({
+            "Rule": list(VALIDATION_RULES),
+            "Description": list(VALIDATION_RULES.values()),
+            "Rows": counts,
+        })
+
+    def mask(self) -> np.ndarray:
+        """Boolean array over the validated frame, True for violating rows."""
+        m = np.zeros(self.n_rows, dtype=bool)
+        m[self.rows] = True
+        return m
+
+    def rule_labels(self) -> pd.Series:
+        """Comma separated rule names per violating row, indexed like ``rows``."""
+        # Label each distinct bitmask once and broadcast, instead of per row
+        uniq, inverse = np.unique(self.flags, return_inverse=True)
+        names = list(VALIDATION_RULES)
+        labels = np.array([", ".join(n for bit, n in enumerate(names) if f & (1 << bit)) for f in uniq], dtype=object)
+        return pd.Series(labels[inverse], index=self.rows, name="Violations")
+
+    def violations(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Rows of ``df`` (the validated frame) that failed, with a Violations column."""
+        out = df.iloc[self.rows].copy()
+        out["Violations"] = self.rule_labels().values
+        return out
+
+
+def validate_data(df: pd.DataFrame,
+                  min_date: str = REPORTING_START,
+                  max_date: str | None = None,
+                  placeholder_regions: tuple | list = DEFAULT_PLACEHOLDER_REGIONS,
+                  identity_tolerance: int = 0) -> ValidationReport:
+    """
+    Run all data-quality rules over a frame returned by ``clean_data``.
+
+    Every rule is a single vectorised pass over the columns:
+      - date_range: Date before min_date or after max_date (default: today)
+      - placeholder_region: Region is one of placeholder_regions
+      - non_monotonic: a cumulative column drops between two of a region's
+        (in-range) reports; the report out of line with its neighbours is
+        flagged, i.e. a spike rather than the correct report after it
+      - identity: |Confirmed - (Active + Cured + Death)| > identity_tolerance
+    """
+    n = len(df)
+    if n == 0:
+        return ValidationReport(0, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.uint8))
+
+    flags = np.zeros(n, dtype=np.uint8)
+    bit = {name: np.uint8(1 << i) for i, name in enumerate(VALIDATION_RULES)}
+
+    # date_range
+    dates = df["Date"].values.astype("datetime64[ns]").view("int64")
+    lo = pd.Timestamp(min_date).value
+    hi = (pd.Timestamp(max_date) if max_date is not None else pd.Timestamp.today().normalize() + pd.Timedelta(days=1)).value
+    bad_date = (dates < lo) | (dates >= hi)
+    flags[bad_date] |= bit["date_range"]
+
+    # placeholder_region: test the unique names only and broadcast through codes
+    region = df["Region"]
+    if isinstance(region.dtype, pd.CategoricalDtype):
+        codes = region.cat.codes.values
+        categories = region.cat.categories
+    else:
+        codes, categories = pd.factorize(region)
+    placeholders = {str(p).casefold() for p in placeholder_regions}
+    is_placeholder = np.array([str(c).casefold() in placeholders for c in categories] + [False], dtype=bool)
+    flags[is_placeholder[codes]] |= bit["placeholder_region"]
+
+    # non_monotonic: order rows by (Region, Date) and compare neighbours within each region.
+    # clean_data sorts by Date, so a stable sort on the small region codes is enough.
+    if df["Date"].is_monotonic_increasing:
+        order = np.argsort(codes, kind="stable")
+    else:
+        order = np.lexsort((dates, codes))
+    order = order[~bad_date[order]]
+    if len(order) > 1:
+        sorted_codes = codes[order]
+        same_region = sorted_codes[1:] == sorted_codes[:-1]
+        outlier = np.zeros(len(order), dtype=bool)
+        for col in CUMULATIVE_COLUMNS:
+            if col in df.columns:
+                outlier |= _breaks_running_total(np.asarray(df[col].values, dtype=np.int64)[order], same_region)
+        flags[order[outlier]] |= bit["non_monotonic"]
+
+    # identity
+    if all(c in df.columns for c in DEFAULT_CASE_COLUMNS):
+        confirmed, active, cured, death = (np.asarray(df[c].values, dtype=np.int64) for c in DEFAULT_CASE_COLUMNS)
+        mismatch = np.abs(confirmed - (active + cured + death)) > identity_tolerance
+        flags[mismatch] |= bit["identity"]
+
+    rows = np.flatnonzero(flags)
+    return ValidationReport(n, rows, flags[rows])
+
+
+def quarantine(df: pd.DataFrame, report: ValidationReport) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Split ``df`` into (valid rows, quarantined rows) using a validation report.
+    Quarantined rows carry a Violations column naming the failed rules.
+    """
+    mask = report.mask()
+    valid = df[~mask].reset_index(drop=True)
+    return valid, report.violations(df).reset_index(drop=True)
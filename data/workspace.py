@@ -0,0 +1,272 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from data.store import PartitionedDataset
+
+# Default total size of the frames a Workspace keeps in memory (bytes)
+MEMORY_BUDGET = 2 * 1024 ** 3
+SPILL_META = "frame.json"
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """Bytes held by a frame, including its index and string contents."""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def _spill_frame(df: pd.DataFrame, path: str) -> int:
+    # One .npy per column in row order; categoricals as codes plus their categories,
+    # and the index as a range or one more .npy. Returns the bytes written.
+    os.makedirs(path, exist_ok=True)
+    columns = []
+    for i, col in enumerate(df.columns):
+        values = df[col]
+        entry = {'name': col, 'file': f"c{i}.npy"}
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            entry['categories'] = values.cat.categories.tolist()
+            entry['ordered'] = bool(values.cat.ordered)
+            values = values.cat.codes
+        array = values.to_numpy()
+        np.save(os.path.join(path, entry['file']), array, allow_pickle=array.dtype == object)
+        columns.append(entry)
+    # The index too, so positional and label-based state both survive
+    index = df.index
+    if isinstance(index, pd.RangeIndex):
+        index_meta = {'range': [index.start, index.stop, index.step], 'name': index.name}
+    else:
+        array = index.to_numpy()
+        np.save(os.path.join(path, "index.npy"), array, allow_pickle=array.dtype == object)
+        index_meta = {'file': "index.npy", 'name': index.name}
+    with open(os.path.join(path, SPILL_META), 'w') as f:
+        json.dump({'rows': len(df), 'columns': columns, 'index': index_meta}, f)
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def _load_frame(path: str) -> pd.DataFrame:
+    with open(os.path.join(path, SPILL_META)) as f:
+        meta = json.load(f)
+    data = {}
+    for entry in meta['columns']:
+        array = np.load(os.path.join(path, entry['file']), allow_pickle=True)
+        if 'categories' in entry:
+            array = pd.Categorical.from_codes(array, categories=entry['categories'], ordered=entry['ordered'])
+        data[entry['name']] = array
+    index_meta = meta['index']
+    if 'range' in index_meta:
+        index = pd.RangeIndex(*index_meta['range'], name=index_meta['name'])
+    else:
+        index = pd.Index(np.load(os.path.join(path, index_meta['file']), allow_pickle=True), name=index_meta['name'])
+    return pd.DataFrame(data, index=index)
+
+
+class WorkspaceEntry:
+    """
+    One named dataset of a ``Workspace``.
+
+    ``frame`` is the in-memory frame, or None while it is evicted to
+    ``spill_path`` (or for a partitioned folder, which is never loaded and is
+    held as ``dataset``). ``derived`` holds frames computed from it (such as
+    the quarantined view or a snapshot to compare with); they count against
+    the budget and are dropped on eviction. ``attrs`` keeps small
+    per-dataset state, such as a validation report, across evictions.
+    """
+
+    def __init__(self, name: str, frame: pd.DataFrame | None = None, dataset: PartitionedDataset | None = None,
+                 source: str | None = None):
+        self.name = name
+        self.frame = frame
+        self.dataset = dataset
+        self.source = source
+        self.rows = len(frame) if frame is not None else len(dataset)
+        self.nbytes = frame_memory(frame) if frame is not None else 0
+        self.derived = {}
+        self.derived_sizes = {}
+        self.spill_path = None
+        self.disk_bytes = 0
+        self.last_used = time.time()
+        self.evictions = 0
+        self.attrs = {}
+
+    @property
+    def in_memory(self) -> bool:
+        return self.frame is not None
+
+    @property
+    def memory(self) -> int:
+        """Bytes held in memory by the frame and its derived frames."""
+        return (self.nbytes if self.in_memory else 0) + sum(self.derived_sizes.values())
+
+    @property
+    def state(self) -> str:
+        if self.dataset is not None:
+            return "folder"
+        return "memory" if self.in_memory else "on disk"
+
+
+class Workspace:
+    """
+    Several named datasets open at once under a total memory budget.
+
+    Frames are immutable once added. Whenever the in-memory frames add up to
+    more than ``budget`` bytes, the least recently used ones (never
+    ``active``, the one last added or returned by ``get``) are written once to
+    a spill directory as one ``.npy`` per column and dropped; ``get`` loads
+    them back. Row order, the index and categories survive the round trip, so
+    positional state such as a validation report stays valid. Frames derived
+    from an entry (``set_derived``) count towards the budget too. Partitioned
+    folders opened with ``add_dataset`` are only referenced and use no budget.
+
+    ``on_evict`` callables are called with every frame the workspace drops,
+    so per-frame caches that are not weakly keyed can be released with it.
+    """
+
+    def __init__(self, budget: int = MEMORY_BUDGET, spill_dir: str | None = None, on_evict: list | None = None):
+        self.budget = budget
+        self.on_evict = list(on_evict or [])
+        self._spill_dir = spill_dir
+        self._owns_spill_dir = spill_dir is None
+        self._entries = {}
+        self._spills = 0
+        self.active = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    @property
+    def names(self) -> list:
+        return list(self._entries)
+
+    @property
+    def memory_usage(self) -> int:
+        """Bytes held by the in-memory frames and their derived frames."""
+        return sum(e.memory for e in self._entries.values())
+
+    def entry(self, name: str) -> WorkspaceEntry:
+        return self._entries[name]
+
+    def _unique_name(self, name: str) -> str:
+        unique, n = name, 2
+        while unique in self._entries:
+            unique, n = f"{name} ({n})", n + 1
+        return unique
+
+    def add(self, name: str, frame: pd.DataFrame, source: str | None = None) -> str:
+        """Add a frame under name (suffixed when taken) and return the name used."""
+        name = self._unique_name(name)
+        self._entries[name] = WorkspaceEntry(name, frame=frame, source=source)
+        self.active = name
+        self._enforce_budget()
+        return name
+
+    def add_dataset(self, name: str, dataset: PartitionedDataset) -> str:
+        """Add a partitioned folder under name and return the name used."""
+        name = self._unique_name(name)
+        self._entries[name] = WorkspaceEntry(name, dataset=dataset, source=dataset.path)
+        self.active = name
+        return name
+
+    def get(self, name: str) -> pd.DataFrame | PartitionedDataset:
+        """
+        The frame (or partitioned folder) named name, loading it back from
+        disk if it was evicted. Marks it as most recently used.
+        """
+        entry = self._entries[name]
+        entry.last_used = time.time()
+        self.active = name
+        if entry.dataset is not None:
+            return entry.dataset
+        if entry.frame is None:
+            entry.frame = _load_frame(entry.spill_path)
+        self._enforce_budget()
+        return entry.frame
+
+    def set_derived(self, name: str, key: str, frame: pd.DataFrame | None):
+        """
+        Record (or, with None, forget) a frame derived from dataset name under
+        key, counting it against the budget.
+        """
+        entry = self._entries[name]
+        old = entry.derived.pop(key, None)
+        entry.derived_sizes.pop(key, None)
+        if old is not None and old is not frame:
+            self._release(old)
+        if frame is not None:
+            entry.derived[key] = frame
+            entry.derived_sizes[key] = frame_memory(frame)
+        self._enforce_budget()
+
+    def _release(self, frame: pd.DataFrame):
+        for callback in self.on_evict:
+            callback(frame)
+
+    def _drop_frames(self, entry: WorkspaceEntry):
+        for frame in entry.derived.values():
+            self._release(frame)
+        entry.derived = {}
+        entry.derived_sizes = {}
+        if entry.frame is not None:
+            self._release(entry.frame)
+            entry.frame = None
+
+    def remove(self, name: str):
+        entry = self._entries.pop(name)
+        self._drop_frames(entry)
+        if self.active == name:
+            self.active = None
+        if entry.spill_path is not None:
+            shutil.rmtree(entry.spill_path, ignore_errors=True)
+
+    def set_budget(self, budget: int):
+        """Change the budget, evicting frames at once if they no longer fit."""
+        self.budget = budget
+        self._enforce_budget()
+
+    def evict(self, name: str):
+        """
+        Write a frame to the spill directory (once) and drop it and its
+        derived frames from memory.
+        """
+        entry = self._entries[name]
+        if not entry.in_memory or entry.dataset is not None:
+            return
+        if entry.spill_path is None:
+            if self._spill_dir is None:
+                self._spill_dir = tempfile.mkdtemp(prefix="covid-workspace-")
+            self._spills += 1
+            path = os.path.join(self._spill_dir, f"dataset-{self._spills:04d}")
+            entry.disk_bytes = _spill_frame(entry.frame, path)
+            entry.spill_path = path
+        self._drop_frames(entry)
+        entry.evictions += 1
+
+    def _enforce_budget(self):
+        loaded = sorted((e for e in self._entries.values() if e.in_memory and e.name != self.active),
+                        key=lambda e: e.last_used)
+        used = self.memory_usage
+        for entry in loaded:
+            if used <= self.budget:
+                break
+            used -= entry.memory
+            self.evict(entry.name)
+
+    def report(self) -> pd.DataFrame:
+        """One row per dataset: rows, where it lives, memory/disk size and last use."""
+        rows = [(e.name, e.rows, e.state, round(e.memory / 1024 ** 2, 1),
+                 round(e.disk_bytes / 1024 ** 2, 1), time.strftime('%H:%M:%S', time.localtime(e.last_used)),
+                 e.evictions, e.source or "")
+                for e in self._entries.values()]
+        return pd.DataFrame(rows, columns=["Dataset", "Rows", "State", "Memory (MB)", "Disk (MB)", "Last Used", "Evictions", "Source"])
+
+    def close(self):
+        """Delete the spill directory if this workspace created it."""
+        if self._owns_spill_dir and self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
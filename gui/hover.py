@@ -0,0 +1,199 @@
+import time
+
+import numpy as np
+import matplotlib.dates as mdates
+from matplotlib.collections import PathCollection
+from matplotlib.lines import Line2D
+from matplotlib.patches import Rectangle
+
+# Do not redraw the overlay more often than this (seconds), ~ one display frame
+HOVER_MIN_INTERVAL = 1 / 60
+
+
+class HoverOverlay:
+	"""
+		Crosshair and value tooltip for an embedded matplotlib canvas.
+
+		The chart itself is drawn once; its pixels are cached on every full
+		draw (``draw_event``) and mouse motion only restores that background
+		and blits the animated crosshair, marker and tooltip artists on top.
+		The nearest point is found with a binary search over each plotted
+		series' sorted x values, so the cost per motion event does not grow
+		with the number of points. Motion events closer together than
+		``min_interval`` are coalesced into one redraw.
+
+		Supports lines, scatter collections and bar rectangles. Keep a
+		reference to the overlay for as long as the canvas lives: matplotlib
+		only holds weak references to the callbacks.
+
+		Parameters
+		----------
+		canvas : matplotlib.backend_bases.FigureCanvasBase
+			Canvas the figure is drawn on (e.g. ``FigureCanvasTkAgg``).
+		ax : matplotlib.axes.Axes
+			Axes whose series are inspected.
+		color : str
+			Color of the crosshair and marker.
+		min_interval : float
+			Minimum time in seconds between two overlay redraws.
+	"""
+
+	def __init__(self, canvas, ax, color='#555555', min_interval=HOVER_MIN_INTERVAL):
+		self.canvas = canvas
+		self.ax = ax
+		self.min_interval = min_interval
+		self._series = self._collect_series(ax)
+		self._background = None
+		self._last_draw = 0.0
+		self._pending = None
+
+		x0, y0 = ax.get_xlim()[0], ax.get_ylim()[0]
+		# Added as plain artists (not axvline/axhline/plot) so they never enter
+		# the data limits and attaching the overlay does not rescale the chart
+		self.vline = ax.add_artist(Line2D([x0, x0], [0, 1], transform=ax.get_xaxis_transform(),
+			color=color, lw=0.8, ls='--', animated=True, visible=False))
+		self.hline = ax.add_artist(Line2D([0, 1], [y0, y0], transform=ax.get_yaxis_transform(),
+			color=color, lw=0.8, ls='--', animated=True, visible=False))
+		self.marker = ax.add_artist(Line2D([x0], [y0], marker='o', ls='', color=color, ms=6,
+			transform=ax.transData, animated=True, visible=False))
+		self.annot = ax.annotate('', xy=(x0, y0), xytext=(12, 12), textcoords='offset points',
+			bbox=dict(boxstyle='round,pad=0.3', fc='white', ec=color, alpha=0.9),
+			animated=True, visible=False)
+		self._artists = [self.vline, self.hline, self.marker, self.annot]
+
+		self._timer = canvas.new_timer(interval=max(int(min_interval * 1000), 1))
+		self._timer.single_shot = True
+		self._timer.add_callback(self._flush)
+		self._cids = [
+			canvas.mpl_connect('draw_event', self._on_draw),
+			canvas.mpl_connect('motion_notify_event', self._on_move),
+			canvas.mpl_connect('axes_leave_event', self._on_leave),
+		]
+
+	@staticmethod
+	def _as_float(values):
+		values = np.asarray(values)
+		if np.issubdtype(values.dtype, np.datetime64) or values.dtype == object:
+			return np.asarray(mdates.date2num(values), dtype=float)
+		return values.astype(float)
+
+	def _collect_series(self, ax):
+		# (label, sorted x, y) for everything plotted on the axes
+		series = []
+		for line in ax.get_lines():
+			series.append((line.get_label(), self._as_float(line.get_xdata()), self._as_float(line.get_ydata())))
+		for coll in ax.collections:
+			if isinstance(coll, PathCollection) and len(coll.get_offsets()):
+				offsets = np.asarray(coll.get_offsets(), dtype=float)
+				series.append((coll.get_label(), offsets[:, 0], offsets[:, 1]))
+		bars = [p for p in ax.patches if isinstance(p, Rectangle)]
+		if bars:
+			x = np.array([p.get_x() + p.get_width() / 2 for p in bars])
+			y = np.array([p.get_y() + p.get_height() for p in bars])
+			series.append(('', x, y))
+
+		out = []
+		for label, x, y in series:
+			keep = ~(np.isnan(x) | np.isnan(y))
+			x, y = x[keep], y[keep]
+			if not len(x):
+				continue
+			if np.any(x[1:] < x[:-1]):
+				order = np.argsort(x, kind='stable')
+				x, y = x[order], y[order]
+			out.append(('' if label.startswith('_') else label, x, y))
+		return out
+
+	def disconnect(self):
+		for cid in self._cids:
+			self.canvas.mpl_disconnect(cid)
+		self._timer.stop()
+
+	def _on_draw(self, event):
+		self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+
+	def _on_leave(self, event):
+		self._pending = None
+		self._hide()
+
+	def _on_move(self, event):
+		if self._background is None or not self._series:
+			return
+		toolbar = getattr(self.canvas, 'toolbar', None)
+		if toolbar is not None and str(getattr(toolbar, 'mode', '')):
+			# Panning/zooming: let the toolbar redraw, do not fight it
+			return
+		if event.inaxes is not self.ax:
+			self._on_leave(event)
+			return
+		self._pending = (event.x, event.y)
+		if time.perf_counter() - self._last_draw >= self.min_interval:
+			self._flush()
+		else:
+			# Coalesce: draw the latest position once the interval has passed
+			self._timer.start()
+
+	def _nearest(self, px, py):
+		# Binary search each series for the x neighbours of the cursor and keep
+		# the candidate closest to it on screen.
+		trans = self.ax.transData
+		xdata, _ = trans.inverted().transform((px, py))
+		best = None
+		for label, xs, ys in self._series:
+			i = np.searchsorted(xs, xdata)
+			cand = np.array([max(i - 1, 0), min(i, len(xs) - 1)])
+			pts = trans.transform(np.column_stack([xs[cand], ys[cand]]))
+			d = np.hypot(pts[:, 0] - px, pts[:, 1] - py)
+			k = int(np.argmin(d))
+			if best is None or d[k] < best[0]:
+				best = (d[k], label, xs[cand[k]], ys[cand[k]])
+		return best
+
+	def _format_x(self, x):
+		date_formatters = (mdates.AutoDateFormatter, mdates.DateFormatter, mdates.ConciseDateFormatter)
+		if isinstance(self.ax.xaxis.get_major_formatter(), date_formatters):
+			return mdates.num2date(x).strftime('%Y-%m-%d')
+		return f"{x:g}"
+
+	def _flush(self):
+		if self._pending is None or self._background is None:
+			return
+		px, py = self._pending
+		self._pending = None
+		self._last_draw = time.perf_counter()
+		hit = self._nearest(px, py)
+		if hit is None:
+			return
+		_, label, x, y = hit
+		y_text = f"{y:,.0f}" if float(y).is_integer() else f"{y:,.2f}"
+		text = f"{self._format_x(x)}: {y_text}"
+		if label:
+			text = f"{label}\n{text}"
+
+		self.vline.set_xdata([x, x])
+		self.hline.set_ydata([y, y])
+		self.marker.set_data([x], [y])
+		self.annot.xy = (x, y)
+		self.annot.set_text(text)
+		# Keep the tooltip inside the axes near the right/top edges
+		ax_box = self.ax.bbox
+		self.annot.set_position((-12 if px > ax_box.x0 + 0.75 * ax_box.width else 12,
+			-24 if py > ax_box.y0 + 0.8 * ax_box.height else 12))
+		self.annot.set_horizontalalignment('right' if px > ax_box.x0 + 0.75 * ax_box.width else 'left')
+		for artist in self._artists:
+			artist.set_visible(True)
+		self._blit()
+
+	def _hide(self):
+		if self._background is None or not self.annot.get_visible():
+			return
+		for artist in self._artists:
+			artist.set_visible(False)
+		self.canvas.restore_region(self._background)
+		self.canvas.blit(self.canvas.figure.bbox)
+
+	def _blit(self):
+		self.canvas.restore_region(self._background)
+		for artist in self._artists:
+			self.ax.draw_artist(artist)
+		self.canvas.blit(self.canvas.figure.bbox)
@@ -1,9 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinter.font import Font
+import base64
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.animation import FuncAnimation
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
 import os
 import sys
 # Make sure the project root is on sys.path so local packages (analysis, data, etc.) can be imported
@@ -14,6 +18,16 @@ if PROJECT_ROOT not in sys.path:
 # Import local modules using absolute imports (project root is on sys.path)
 from data import cleaning_pipeline as cp
 from analysis.trends import create_figure
+from analysis.rendering import ChartRenderer, RenderCancelled
+from analysis.rates import RATE_METRICS, forget_rates, rate_table
+from gui.hover import HoverOverlay
+from data.validation import validate_data, quarantine
+from data.query import run_query
+from data.diff import diff_snapshots
+from data.store import PartitionedDataset, write_partitioned
+from data.regions import region_report
+from data.workspace import Workspace, MEMORY_BUDGET
+from analysis.timeline import PLAYBACK_FPS, TIMELINE_KINDS, TimelinePlot, export_timeline, timeline_matrix
 
 # Configurable color palette and font
 # COLOR_PALETTE = {
@@ -48,6 +62,14 @@ COLOR_PALETTE = {
     'canvas_bg': '#ffffff',
     'text': '#212529',
 }
+# How often (ms) the Tk loop checks whether a background render has finished
+RENDER_POLL_MS = 30
+# Maximum number of violating rows listed in the Quality tab
+MAX_VIOLATION_ROWS = 1000
+# Data tab period choices for the rate table
+RATE_PERIODS = {"Day": "D", "Month": "M", "Year": "Y"}
+# Rows inserted into the Data table at a time; more are added while scrolling
+TABLE_PAGE_ROWS = 200
 APP_FONT = ("Sans-Serif", 11, "bold")
 TITLE_FONT = ("Sans-Serif", 16, "bold")
 
@@ -64,7 +86,23 @@ class MainWindow(tk.Tk):
 		Attributes
 		----------
 		data : pandas.DataFrame | None
-			Currently loaded dataset (None until a CSV is uploaded).
+			Currently loaded dataset (None until a CSV is uploaded). When
+			quarantine is enabled this excludes rows that failed validation.
+		raw_data : pandas.DataFrame | None
+			Cleaned dataset as loaded, before quarantine.
+		validation_report : data.validation.ValidationReport | None
+			Data-quality violations found in ``raw_data``.
+		previous_data : pandas.DataFrame | None
+			Earlier snapshot of the dataset loaded in the Revisions tab.
+		snapshot_diff : data.diff.SnapshotDiff | None
+			Changes from ``previous_data`` to ``raw_data`` (computed on demand).
+		dataset : data.store.PartitionedDataset | None
+			Partitioned dataset opened from disk instead of a CSV; charts read
+			only the partitions of the current selection from it.
+		workspace : data.workspace.Workspace
+			Every dataset uploaded or opened in this session, by name. The
+			active one is mirrored in ``raw_data`` / ``dataset``; the others
+			are evicted to disk when they exceed the memory budget.
 		current_tab : tkinter.StringVar
 			Tracks the current selected tab (Dashboard/Data/About Us).
 		... (other UI state variables)
@@ -78,17 +116,53 @@ class MainWindow(tk.Tk):
 		self.configure(bg=COLOR_PALETTE['bg'])
 
 		self.data = None
+		self.raw_data = None
+		self.validation_report = None
+		self.region_report = None
+		self.quarantined = None
+		self.previous_data = None
+		self.snapshot_diff = None
+		self.dataset = None
+		# Rate tables are cached by fingerprint, not weakly, so release them with evicted frames
+		self.workspace = Workspace(on_evict=[forget_rates])
+		self.dataset_var = tk.StringVar()
+		self.budget_var = tk.StringVar(value=str(MEMORY_BUDGET // 1024 ** 2))
+		self.quarantine_var = tk.BooleanVar(value=True)
 		self.current_tab = tk.StringVar(value="Dashboard")
 		self.state_var = tk.StringVar()
 		self.month_var = tk.StringVar()
 		self.year_var = tk.StringVar()
 		self.case_type_var = tk.StringVar(value="Confirmed Cases")
 		self.graph_type_var = tk.StringVar(value="Line")
+		self.render_mode_var = tk.StringVar(value="Fast")
+		self.start_date_var = tk.StringVar()
+		self.end_date_var = tk.StringVar()
+		self.data_view_var = tk.StringVar(value="Rows")
+		self.rate_period_var = tk.StringVar(value="Month")
+		self.query_var = tk.StringVar()
+		self.timeline_kind_var = tk.StringVar(value=TIMELINE_KINDS[0])
 		self.sidebar_expanded = True
 
+		# Charts are built and rasterised off the Tk thread in "Fast" mode
+		self.renderer = ChartRenderer()
+		self._render_future = None
+		self._graph_image = None
+		self._hover = None
+		self.current_figure = None
+		# Timeline playback on the dashboard and its GIF/MP4 export
+		self._animation = None
+		self._export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='timeline-export')
+		self._export_future = None
+		self._export_progress = None
+
 		self._build_layout()
 		self._show_dashboard()
 
+		# dropdowns to update graph (registered once, not on every tab switch)
+		for var in [self.state_var, self.month_var, self.year_var, self.case_type_var, self.graph_type_var, self.render_mode_var]:
+			var.trace_add('write', lambda *args: self._update_graph())
+		self.protocol("WM_DELETE_WINDOW", self._on_close)
+
 	def _build_layout(self):
 		"""
 			Construct all UI elements and layout frames.
@@ -116,7 +190,7 @@ class MainWindow(tk.Tk):
 		toggle_btn.pack(anchor="nw", padx=8, pady=8)
 
 		self.sidebar_btns = []
-		for tab in ["Dashboard", "Data", "About Us"]:
+		for tab in ["Dashboard", "Data", "Quality", "Revisions", "Datasets", "About Us"]:
 			btn = tk.Radiobutton(
 				self.sidebar, text=tab, variable=self.current_tab, value=tab,
 				indicatoron=False, width=18, pady=15, font=APP_FONT,
@@ -152,7 +226,19 @@ class MainWindow(tk.Tk):
 		upload_label = tk.Label(self.rightbar, text="Upload Data", font=APP_FONT, bg=COLOR_PALETTE['sidebar'], fg='white')
 		upload_label.pack(pady=(20, 5))
 		upload_btn = tk.Button(self.rightbar, text="Upload CSV", font=APP_FONT, bg=COLOR_PALETTE['accent'], fg='white', command=self._upload_file)
-		upload_btn.pack(pady=(0, 20))
+		upload_btn.pack(pady=(0, 5))
+		# Year/Region partitioned datasets on disk (see data.store)
+		store_btns = tk.Frame(self.rightbar, bg=COLOR_PALETTE['sidebar'])
+		store_btns.pack(pady=(0, 5))
+		tk.Button(store_btns, text="Open Folder", font=APP_FONT, bg=COLOR_PALETTE['sidebar_active'], fg='white', command=self._open_partitioned).pack(side=tk.LEFT, padx=5)
+		tk.Button(store_btns, text="Export", font=APP_FONT, bg=COLOR_PALETTE['sidebar_active'], fg='white', command=self._export_partitioned).pack(side=tk.LEFT, padx=5)
+		# Switch between the datasets open in the workspace
+		self._add_rightbar_option("Dataset:", self.dataset_var, 'dataset_menu')
+		self.dataset_menu.bind('<<ComboboxSelected>>', lambda e: self._switch_dataset(self.dataset_var.get()))
+		quarantine_check = tk.Checkbutton(self.rightbar, text="Quarantine invalid rows", variable=self.quarantine_var,
+			font=APP_FONT, bg=COLOR_PALETTE['sidebar'], fg='white', selectcolor=COLOR_PALETTE['sidebar_active'],
+			activebackground=COLOR_PALETTE['sidebar'], activeforeground='white', command=self._on_quarantine_toggle)
+		quarantine_check.pack(pady=(0, 20))
 
 		# Filter controls to analyze data using various filters 
 		filter_label = tk.Label(self.rightbar, text="Visualization Options", font=APP_FONT, bg=COLOR_PALETTE['sidebar'], fg='white')
@@ -161,11 +247,32 @@ class MainWindow(tk.Tk):
 		self._add_rightbar_option("State:", self.state_var, 'state_menu')
 		self._add_rightbar_option("Month:", self.month_var, 'month_menu')
 		self._add_rightbar_option("Year:", self.year_var, 'year_menu')
-		self._add_rightbar_option("Case Type:", self.case_type_var, 'case_type_menu', ["Confirmed Cases", "Active Cases", "Cured/Discharged", "Death"])
+		self._add_rightbar_option("Case Type:", self.case_type_var, 'case_type_menu', ["Confirmed Cases", "Active Cases", "Cured/Discharged", "Death"] + RATE_METRICS)
 		self._add_rightbar_option("Graph Type:", self.graph_type_var, 'graph_type_menu', ["Line", "Bar", "Scatter"])
+		# Fast renders a static image in the background, Interactive embeds a pan/zoom canvas
+		self._add_rightbar_option("Render Mode:", self.render_mode_var, 'render_mode_menu', ["Fast", "Interactive"])
+
+		# Optional date range (YYYY-MM-DD); when set it replaces the Month/Year selection
+		range_label = tk.Label(self.rightbar, text="Date Range (YYYY-MM-DD)", font=APP_FONT, bg=COLOR_PALETTE['sidebar'], fg='white')
+		range_label.pack(pady=(15, 5))
+		self._add_rightbar_entry("Start:", self.start_date_var, 'start_date_entry')
+		self._add_rightbar_entry("End:", self.end_date_var, 'end_date_entry')
+		range_btns = tk.Frame(self.rightbar, bg=COLOR_PALETTE['sidebar'])
+		range_btns.pack(pady=(5, 0))
+		tk.Button(range_btns, text="Apply", font=APP_FONT, bg=COLOR_PALETTE['accent'], fg='white', command=self._update_graph).pack(side=tk.LEFT, padx=5)
+		tk.Button(range_btns, text="Clear", font=APP_FONT, bg=COLOR_PALETTE['sidebar_active'], fg='white', command=self._clear_date_range).pack(side=tk.LEFT, padx=5)
+
+		# Day-by-day playback of the selected case type across regions
+		self._add_rightbar_option("Timeline:", self.timeline_kind_var, 'timeline_menu', list(TIMELINE_KINDS))
+		timeline_btns = tk.Frame(self.rightbar, bg=COLOR_PALETTE['sidebar'])
+		timeline_btns.pack(pady=(5, 0))
+		tk.Button(timeline_btns, text="Play", font=APP_FONT, bg=COLOR_PALETTE['accent'], fg='white', command=self._play_timeline).pack(side=tk.LEFT, padx=2)
+		tk.Button(timeline_btns, text="Stop", font=APP_FONT, bg=COLOR_PALETTE['sidebar_active'], fg='white', command=self._stop_timeline).pack(side=tk.LEFT, padx=2)
+		self.export_timeline_btn = tk.Button(timeline_btns, text="Export", font=APP_FONT, bg=COLOR_PALETTE['sidebar_active'], fg='white', command=self._export_timeline)
+		self.export_timeline_btn.pack(side=tk.LEFT, padx=2)
 
 		download_btn = tk.Button(self.rightbar, text="Download Graph", font=APP_FONT, bg=COLOR_PALETTE['accent'], fg='white', command=self._download_graph)
-		download_btn.pack(pady=(20, 0))
+		download_btn.pack(pady=(15, 0))
 
 		# Main content area to display graph diagrams
 		self.content = tk.Frame(self, bg=COLOR_PALETTE['bg'])
@@ -203,6 +310,45 @@ class MainWindow(tk.Tk):
 		menu.pack(side=tk.RIGHT, padx=5)
 		setattr(self, menu_attr, menu)
 
+	def _add_rightbar_entry(self, label, var, entry_attr):
+		"""
+			Add a labeled text Entry to the right controls sidebar.
+
+			Pressing Return in the entry redraws the graph.
+
+			Parameters
+			----------
+			label : str
+				Label text displayed to the left of the entry.
+			var : tkinter.Variable
+				Variable bound to the entry text.
+			entry_attr : str
+				Attribute name to assign the created Entry to (e.g. 'start_date_entry').
+
+			Returns
+			-------
+			None
+		"""
+		frame = tk.Frame(self.rightbar, bg=COLOR_PALETTE['sidebar'])
+		frame.pack(fill=tk.X, padx=10, pady=2)
+		tk.Label(frame, text=label, font=APP_FONT, bg=COLOR_PALETTE['sidebar'], fg='white').pack(side=tk.LEFT)
+		entry = tk.Entry(frame, textvariable=var, font=APP_FONT, width=14)
+		entry.pack(side=tk.RIGHT, padx=5)
+		entry.bind('<Return>', lambda e: self._update_graph())
+		setattr(self, entry_attr, entry)
+
+	def _clear_date_range(self):
+		"""
+			Empty the date range entries and go back to the Month/Year selection.
+
+			Returns
+			-------
+			None
+		"""
+		self.start_date_var.set("")
+		self.end_date_var.set("")
+		self._update_graph()
+
 	def _toggle_sidebar(self):
 		"""
 			Toggle the visibility of the left sidebar.
@@ -257,12 +403,13 @@ class MainWindow(tk.Tk):
 			Remove all widgets from the main content frame
 
 			Used when switching tabs to destroy previous tab widgets and free
-			space for the new content.
+			space for the new content. A playing timeline is stopped first.
 
 			Returns
 		-------
 			None
 		"""
+		self._stop_timeline()
 		for widget in self.content.winfo_children():
 			widget.destroy()
 
@@ -271,7 +418,8 @@ class MainWindow(tk.Tk):
 			Callback when the selected sidebar tab changes.
 
 			Reads ``self.current_tab`` and displays the corresponding content
-			by calling ``_show_dashboard``, ``_show_data`` or ``_show_about``.
+			by calling ``_show_dashboard``, ``_show_data``, ``_show_quality``,
+			``_show_revisions``, ``_show_datasets`` or ``_show_about``.
 
 			Returns
 			-------
@@ -282,6 +430,12 @@ class MainWindow(tk.Tk):
 			self._show_dashboard()
 		elif tab == "Data":
 			self._show_data()
+		elif tab == "Quality":
+			self._show_quality()
+		elif tab == "Revisions":
+			self._show_revisions()
+		elif tab == "Datasets":
+			self._show_datasets()
 		elif tab == "About Us":
 			self._show_about()
 
@@ -291,7 +445,8 @@ class MainWindow(tk.Tk):
 
 			The dashboard contains a frame where the current figure (created by
 			``analysis.trends.create_figure``) is embedded. Dropdowns on the right
-			sidebar are bound to update the graph automatically.
+			sidebar are bound to update the graph automatically, and the chart for
+			the current selection is redrawn when returning to this tab.
 
 			Returns
 			-------
@@ -303,17 +458,22 @@ class MainWindow(tk.Tk):
 		self.graph_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 		self.content.grid_rowconfigure(0, weight=1)
 		self.content.grid_columnconfigure(0, weight=1)
-
-		# dropdowns to update graph
-		for var in [self.state_var, self.month_var, self.year_var, self.case_type_var, self.graph_type_var]:
-			var.trace_add('write', lambda *args: self._update_graph())
+		if self.data is not None:
+			# Wait for the frame to get its size so the chart is rendered to fit
+			self.after_idle(self._update_graph)
 
 	def _show_data(self):
 		"""
 			Show the raw data in a table view and this will be displayed under data button of left sidebar.
 
 			If no data is loaded a message is displayed. For a loaded DataFrame a
-			``ttk.Treeview`` is populated with rows from ``self.data``.
+			``ttk.Treeview`` is populated with rows from ``self.data``, or, in the
+			"Rates" view, with the per region x period rate table from
+			``analysis.rates.rate_table`` at the selected period. In the "Rows"
+			view the query bar filters rows through ``data.query.run_query``
+			and reports how many rows were scanned and skipped. Rows are fed
+			to the table lazily while scrolling. For a partitioned dataset the
+			partitions of the selected State/Year are shown.
 
 			Returns
 			-------
@@ -321,22 +481,371 @@ class MainWindow(tk.Tk):
 		"""
 		self._clear_content()
 		tk.Label(self.content, text="Data Table", font=TITLE_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text']).pack(anchor="w", padx=20, pady=(20, 5))
-		if self.data is not None:
+		data = self.data
+		if data is None and self.dataset is not None:
+			# Only the partitions of the current State/Year selection are read
+			params = self._graph_params()
+			data = self.dataset.read(regions=[params['state']] if params['state'] else None,
+				years=[params['year']] if params['year'] else None)
+			tk.Label(self.content, text=f"Partitions for {params['state'] or 'all regions'}, {params['year'] or 'all years'}",
+				font=APP_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text']).pack(anchor="w", padx=20, pady=(0, 5))
+		if data is not None:
+			controls = tk.Frame(self.content, bg=COLOR_PALETTE['bg'])
+			controls.pack(anchor="w", padx=20)
+			tk.Label(controls, text="View:", font=APP_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text']).pack(side=tk.LEFT)
+			view_menu = ttk.Combobox(controls, textvariable=self.data_view_var, values=["Rows", "Rates"], font=APP_FONT, width=8, state="readonly")
+			view_menu.pack(side=tk.LEFT, padx=(5, 15))
+			view_menu.bind('<<ComboboxSelected>>', lambda e: self._show_data())
+			rows = None
+			if self.data_view_var.get() == "Rates":
+				tk.Label(controls, text="Period:", font=APP_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text']).pack(side=tk.LEFT)
+				period_menu = ttk.Combobox(controls, textvariable=self.rate_period_var, values=list(RATE_PERIODS), font=APP_FONT, width=8, state="readonly")
+				period_menu.pack(side=tk.LEFT, padx=5)
+				period_menu.bind('<<ComboboxSelected>>', lambda e: self._show_data())
+				table = rate_table(data, RATE_PERIODS[self.rate_period_var.get()])
+				table = table.drop(columns=['Year', 'Month', 'Day']).round(2)
+				table['Period'] = table['Period'].dt.date
+			else:
+				table = data
+				tk.Label(controls, text="Query:", font=APP_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text']).pack(side=tk.LEFT)
+				query_entry = tk.Entry(controls, textvariable=self.query_var, font=APP_FONT, width=50)
+				query_entry.pack(side=tk.LEFT, padx=5)
+				query_entry.bind('<Return>', lambda e: self._show_data())
+				tk.Button(controls, text="Run", font=APP_FONT, command=self._show_data).pack(side=tk.LEFT, padx=2)
+				tk.Button(controls, text="Clear", font=APP_FONT, command=self._clear_query).pack(side=tk.LEFT, padx=2)
+
+				status, color = "e.g. region:ma, date:2021-01-01..2021-03-31, Death > 1000", COLOR_PALETTE['text']
+				if self.query_var.get().strip():
+					try:
+						result = run_query(data, self.query_var.get())
+						rows = result.rows
+						status = result.describe()
+					except ValueError as e:
+						status, color = str(e), 'red'
+				tk.Label(self.content, text=status, font=APP_FONT, bg=COLOR_PALETTE['bg'], fg=color).pack(anchor="w", padx=20, pady=(5, 0))
+
 			table_frame = tk.Frame(self.content, bg=COLOR_PALETTE['bg'])
 			table_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-			cols = list(self.data.columns)
+			cols = list(table.columns)
 			tree = ttk.Treeview(table_frame, columns=cols, show='headings')
 
 			for col in cols:
 				tree.heading(col, text=col)
 				tree.column(col, width=100, anchor='center')
 
-			for _, row in self.data.iterrows():
-				tree.insert('', 'end', values=list(row))
+			scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=tree.yview)
+			scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 			tree.pack(fill=tk.BOTH, expand=True)
+			self._fill_table_lazily(tree, scrollbar, table, rows)
 		else:
 			tk.Label(self.content, text="No data loaded.", font=APP_FONT, bg=COLOR_PALETTE['bg'], fg='red').pack(pady=30)
 
+	def _fill_table_lazily(self, tree, scrollbar, table, rows=None):
+		"""
+			Feed a Treeview ``TABLE_PAGE_ROWS`` rows at a time.
+
+			Only the first page is inserted up front; the next page is added
+			whenever the view is scrolled close to the last inserted row, so
+			large tables and query results open immediately.
+
+			Parameters
+			----------
+			tree : ttk.Treeview
+				Table to fill.
+			scrollbar : ttk.Scrollbar
+				Vertical scrollbar attached to ``tree``.
+			table : pandas.DataFrame
+				Frame whose rows are shown.
+			rows : numpy.ndarray | None
+				Row positions of ``table`` to show, in order (all rows when None).
+
+			Returns
+			-------
+			None
+		"""
+		total = len(table) if rows is None else len(rows)
+		shown = [0]
+
+		def add_page():
+			start, stop = shown[0], min(shown[0] + TABLE_PAGE_ROWS, total)
+			if start >= stop:
+				return
+			page = table.iloc[start:stop] if rows is None else table.iloc[rows[start:stop]]
+			for row in page.itertuples(index=False):
+				tree.insert('', 'end', values=list(row))
+			shown[0] = stop
+
+		def on_scroll(first, last):
+			scrollbar.set(first, last)
+			if float(last) > 0.9 and shown[0] < total:
+				add_page()
+
+		tree.configure(yscrollcommand=on_scroll)
+		add_page()
+
+	def _clear_query(self):
+		"""
+			Clear the Data tab query and show all rows again.
+
+			Returns
+			-------
+			None
+		"""
+		self.query_var.set("")
+		self._show_data()
+
+	def _show_quality(self):
+		"""
+			Show the data-quality validation results for the loaded dataset.
+
+			Region spellings normalised or left unrecognised by ``data.regions``
+			when this dataset was loaded are noted first. A summary table lists each rule with its number of
+			violating rows, followed by the violating rows themselves (first
+			``MAX_VIOLATION_ROWS``) and the rules each one failed.
+
+			Returns
+			-------
+			None
+		"""
+		self._clear_content()
+		tk.Label(self.content, text="Data Quality", font=TITLE_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text']).pack(anchor="w", padx=20, pady=(20, 5))
+		report = self.validation_report
+		if report is None:
+			tk.Label(self.content, text="No data loaded.", font=APP_FONT, bg=COLOR_PALETTE['bg'], fg='red').pack(pady=30)
+			return
+
+		status = "quarantined" if self.quarantine_var.get() else "kept (quarantine disabled)"
+		tk.Label(self.content, text=f"{len(report)} of {report.n_rows} rows failed validation and are {status}.",
+				 font=APP_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text']).pack(anchor="w", padx=20)
+		# Region spellings mapped (or not) by data.regions when this dataset was loaded
+		names = self.region_report
+		if names is not None and len(names):
+			unmatched = names.loc[names['Match'] == "unmatched", 'Name']
+			text = f"{int((names['Match'] != 'unmatched').sum())} region spellings were normalised."
+			if len(unmatched):
+				text += f" Unrecognised regions: {', '.join(unmatched)}"
+			tk.Label(self.content, text=text, font=APP_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text'],
+					 wraplength=800, justify="left").pack(anchor="w", padx=20)
+
+		summary = report.summary
+		summary_tree = ttk.Treeview(self.content, columns=list(summary.columns), show='headings', height=len(summary))
+		for col in summary.columns:
+			summary_tree.heading(col, text=col)
+			summary_tree.column(col, width=120 if col != 'Description' else 420, anchor='w')
+		for row in summary.itertuples(index=False):
+			summary_tree.insert('', 'end', values=list(row))
+		summary_tree.pack(fill=tk.X, padx=20, pady=10)
+
+		if len(report):
+			table_frame = tk.Frame(self.content, bg=COLOR_PALETTE['bg'])
+			table_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 10))
+			violations = report.violations(self.raw_data).head(MAX_VIOLATION_ROWS)
+			cols = list(violations.columns)
+			tree = ttk.Treeview(table_frame, columns=cols, show='headings')
+			for col in cols:
+				tree.heading(col, text=col)
+				tree.column(col, width=100, anchor='center')
+			for row in violations.itertuples(index=False):
+				tree.insert('', 'end', values=list(row))
+			scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=tree.yview)
+			tree.configure(yscrollcommand=scrollbar.set)
+			scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+			tree.pack(fill=tk.BOTH, expand=True)
+
+	def _show_revisions(self):
+		"""
+			Show what changed between an earlier snapshot and the loaded dataset.
+
+			An earlier export of the same dataset is loaded with the button at
+			the top and compared with ``data.diff.diff_snapshots``: a per-region
+			summary of added, removed and revised rows is followed by every
+			revised (Region, Date, Column) cell with its old and new value.
+
+			Returns
+			-------
+			None
+		"""
+		self._clear_content()
+		tk.Label(self.content, text="Revisions", font=TITLE_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text']).pack(anchor="w", padx=20, pady=(20, 5))
+		if self.raw_data is None:
+			tk.Label(self.content, text="No data loaded.", font=APP_FONT, bg=COLOR_PALETTE['bg'], fg='red').pack(pady=30)
+			return
+
+		controls = tk.Frame(self.content, bg=COLOR_PALETTE['bg'])
+		controls.pack(anchor="w", padx=20)
+		tk.Button(controls, text="Load Previous Snapshot", font=APP_FONT, bg=COLOR_PALETTE['accent'], fg='white', command=self._load_previous_snapshot).pack(side=tk.LEFT)
+		if self.previous_data is None:
+			tk.Label(controls, text="Load an earlier export of this dataset to see its revisions.", font=APP_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text']).pack(side=tk.LEFT, padx=10)
+			return
+
+		if self.snapshot_diff is None:
+			self.snapshot_diff = diff_snapshots(self.previous_data, self.raw_data)
+		diff = self.snapshot_diff
+		tk.Label(controls, text=diff.describe(), font=APP_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text']).pack(side=tk.LEFT, padx=10)
+		if not diff:
+			return
+
+		summary = diff.summary
+		summary_frame = tk.Frame(self.content, bg=COLOR_PALETTE['bg'])
+		summary_frame.pack(fill=tk.X, padx=20, pady=10)
+		summary_tree = ttk.Treeview(summary_frame, columns=list(summary.columns), show='headings', height=min(len(summary), 8))
+		for col in summary.columns:
+			summary_tree.heading(col, text=col)
+			summary_tree.column(col, width=110, anchor='center')
+		summary_scroll = ttk.Scrollbar(summary_frame, orient=tk.VERTICAL, command=summary_tree.yview)
+		summary_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+		summary_tree.pack(fill=tk.X)
+		self._fill_table_lazily(summary_tree, summary_scroll, summary)
+
+		table_frame = tk.Frame(self.content, bg=COLOR_PALETTE['bg'])
+		table_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 10))
+		revised = diff.revised.assign(Date=diff.revised['Date'].dt.date)
+		tree = ttk.Treeview(table_frame, columns=list(revised.columns), show='headings')
+		for col in revised.columns:
+			tree.heading(col, text=col)
+			tree.column(col, width=100, anchor='center')
+		scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=tree.yview)
+		scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+		tree.pack(fill=tk.BOTH, expand=True)
+		self._fill_table_lazily(tree, scrollbar, revised)
+
+	def _load_previous_snapshot(self):
+		"""
+			Prompt for an earlier export of the dataset and show its revisions.
+
+			The file is cleaned like an upload (keeping out-of-range years) and
+			diffed against ``self.raw_data``.
+
+			Returns
+			-------
+			None
+		"""
+		file_path = filedialog.askopenfilename()
+		if file_path:
+			try:
+				self.previous_data = cp.load_data_from_file(file_path, min_year=None)
+				self.snapshot_diff = None
+				if self.workspace.active in self.workspace:
+					self.workspace.set_derived(self.workspace.active, 'previous_data', self.previous_data)
+			except Exception as e:
+				messagebox.showerror("Error", f"Failed to load file or parse the file : {e}")
+				return
+			self._show_revisions()
+
+	def _show_datasets(self):
+		"""
+			Show every dataset open in the workspace and the memory budget.
+
+			Each row gives the dataset's rows, whether it is in memory, evicted
+			to disk or a partitioned folder, its memory and disk size and when
+			it was last used. Datasets are switched to by double-clicking a row
+			or with the buttons, which can also evict or close them. The budget
+			(MB) applies to all in-memory datasets together.
+
+			Returns
+			-------
+			None
+		"""
+		self._clear_content()
+		tk.Label(self.content, text="Datasets", font=TITLE_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text']).pack(anchor="w", padx=20, pady=(20, 5))
+		if not len(self.workspace):
+			tk.Label(self.content, text="No data loaded.", font=APP_FONT, bg=COLOR_PALETTE['bg'], fg='red').pack(pady=30)
+			return
+
+		used = self.workspace.memory_usage / 1024 ** 2
+		tk.Label(self.content, text=f"{len(self.workspace)} datasets, {used:,.1f} MB in memory (active: {self.workspace.active}).",
+				 font=APP_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text']).pack(anchor="w", padx=20)
+		controls = tk.Frame(self.content, bg=COLOR_PALETTE['bg'])
+		controls.pack(anchor="w", padx=20, pady=5)
+		tk.Label(controls, text="Memory budget (MB):", font=APP_FONT, bg=COLOR_PALETTE['bg'], fg=COLOR_PALETTE['text']).pack(side=tk.LEFT)
+		budget_entry = tk.Entry(controls, textvariable=self.budget_var, font=APP_FONT, width=8)
+		budget_entry.pack(side=tk.LEFT, padx=5)
+		budget_entry.bind('<Return>', lambda e: self._apply_budget())
+		tk.Button(controls, text="Apply", font=APP_FONT, command=self._apply_budget).pack(side=tk.LEFT, padx=2)
+
+		report = self.workspace.report()
+		table_frame = tk.Frame(self.content, bg=COLOR_PALETTE['bg'])
+		table_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(5, 0))
+		tree = ttk.Treeview(table_frame, columns=list(report.columns), show='headings', selectmode='browse')
+		for col in report.columns:
+			tree.heading(col, text=col)
+			tree.column(col, width=100 if col not in ('Dataset', 'Source') else 200, anchor='center')
+		for row in report.itertuples(index=False):
+			tree.insert('', 'end', iid=row.Dataset, values=list(row))
+		if self.workspace.active in self.workspace:
+			tree.selection_set(self.workspace.active)
+		scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=tree.yview)
+		tree.configure(yscrollcommand=scrollbar.set)
+		scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+		tree.pack(fill=tk.BOTH, expand=True)
+		tree.bind('<Double-1>', lambda e: tree.selection() and self._switch_dataset(tree.selection()[0]))
+
+		buttons = tk.Frame(self.content, bg=COLOR_PALETTE['bg'])
+		buttons.pack(anchor="w", padx=20, pady=10)
+		tk.Button(buttons, text="Switch", font=APP_FONT, bg=COLOR_PALETTE['accent'], fg='white',
+				  command=lambda: tree.selection() and self._switch_dataset(tree.selection()[0])).pack(side=tk.LEFT)
+		tk.Button(buttons, text="Evict", font=APP_FONT, bg=COLOR_PALETTE['sidebar_active'], fg='white',
+				  command=lambda: tree.selection() and self._evict_dataset(tree.selection()[0])).pack(side=tk.LEFT, padx=5)
+		tk.Button(buttons, text="Close", font=APP_FONT, bg=COLOR_PALETTE['sidebar_active'], fg='white',
+				  command=lambda: tree.selection() and self._close_dataset(tree.selection()[0])).pack(side=tk.LEFT)
+
+	def _apply_budget(self):
+		"""
+			Set the workspace memory budget from the Datasets tab entry (MB).
+
+			Returns
+			-------
+			None
+		"""
+		try:
+			budget = float(self.budget_var.get())
+		except ValueError:
+			messagebox.showerror("Error", "Memory budget must be a number of MB.")
+			return
+		self.workspace.set_budget(int(budget * 1024 ** 2))
+		self._show_datasets()
+
+	def _evict_dataset(self, name):
+		"""
+			Move a dataset other than the active one to disk now.
+
+			Returns
+			-------
+			None
+		"""
+		if name == self.workspace.active:
+			messagebox.showwarning("Active Dataset", "Switch to another dataset before evicting this one.")
+			return
+		self.workspace.evict(name)
+		self._show_datasets()
+
+	def _close_dataset(self, name):
+		"""
+			Remove a dataset from the workspace.
+
+			Closing the active dataset switches to the most recently used of
+			the remaining ones, or clears the window when none is left.
+
+			Returns
+			-------
+			None
+		"""
+		active = name == self.workspace.active
+		self.workspace.remove(name)
+		self.dataset_menu['values'] = self.workspace.names
+		if not active:
+			self._show_datasets()
+		elif len(self.workspace):
+			recent = max(self.workspace.names, key=lambda n: self.workspace.entry(n).last_used)
+			self._switch_dataset(recent)
+		else:
+			self.data = self.raw_data = self.quarantined = self.dataset = None
+			self.validation_report = self.region_report = self.previous_data = self.snapshot_diff = None
+			self.dataset_var.set("")
+			for menu, var in [(self.state_menu, self.state_var), (self.month_menu, self.month_var), (self.year_menu, self.year_var)]:
+				menu['values'] = []
+			self._show_datasets()
+
 	def _show_about(self):
 		"""
 			Display the About view for project info and Doc link.
@@ -360,17 +869,17 @@ class MainWindow(tk.Tk):
 			This method:
 
 			- Opens a file dialog filtered to CSV files
-			- Loads the CSV into a pandas DataFrame and stores it in ``self.data``.
-			- Derives ``Month`` and ``Year`` columns from the parsed ``Date`` column.
-			- Populates the right sidebar comboboxes with available options.
+			- Loads and cleans the file, keeping out-of-range years so they can
+			  be reported by validation.
+			- Validates the cleaned frame and adds it to ``self.workspace``
+			  under its file name, next to the datasets already open.
+			- Makes it the active dataset (see ``_switch_dataset``).
 
 			Errors during loading are presented to the user via a messagebox.
 
 			Takes help of:
 			- ``data.cleaning_pipeline.load_data_from_file``
-			- ``pandas.to_datetime``
-			- also make sure to standardize column names if required
-			- 
+			- ``data.validation.validate_data``
 
 			Returns
 			-------
@@ -380,59 +889,243 @@ class MainWindow(tk.Tk):
 		file_path = filedialog.askopenfilename()
 		if file_path:
 			try:
-				self.data = cp.load_data_from_file(file_path)
-
-				# required = {'Date', 'date', 'Region', 'region', 'Death', 'death', 'Cured', 'cured', 'Discharged', 'discharged'}
-				# missing = required - set(self.data.columns)
-				# if missing:
-					# messagebox.showerror("Error", f"CSV missing required columns: {', '.join(missing)}")
-					# return
-
-				# self.data['Date'] = pd.to_datetime(self.data['Date'], errors='coerce')
-				# if self.data['Date'].isna().all():
-				# 	messagebox.showerror("Error", "Failed to parse any dates from the 'Date' column.")
-				# 	return
-				# self.data['Month'] = self.data['Date'].dt.month
-				# self.data['Year'] = self.data['Date'].dt.year
-				# Populate combobox options (guard against missing columns)
-				self.state_menu['values'] = sorted(self.data['Region'].dropna().unique())
-				# Normalize combobox values to strings to avoid float-like values (e.g. '1.0')
-				months = sorted(self.data['Month'].dropna().unique())
-				years = sorted(self.data['Year'].dropna().unique())
-				self.month_menu['values'] = [str(int(m)) for m in months]
-				self.year_menu['values'] = [str(int(y)) for y in years]
-				# Set defaults if possible
-				if len(self.state_menu['values']):
-					self.state_var.set(self.state_menu['values'][0])
-				if len(self.month_menu['values']):
-					self.month_var.set(self.month_menu['values'][0])
-				if len(self.year_menu['values']):
-					self.year_var.set(self.year_menu['values'][0])
-				# Update graph
-				self._update_graph()
-				messagebox.showinfo("Success", "Data loaded successfully!")
+				raw_data = cp.load_data_from_file(file_path, min_year=None)
+				report = validate_data(raw_data)
+				name = self.workspace.add(os.path.basename(file_path), raw_data, source=file_path)
+				self.workspace.entry(name).attrs['validation_report'] = report
+				self.workspace.entry(name).attrs['region_report'] = region_report(raw_data)
+				self._switch_dataset(name)
+				messagebox.showinfo("Success", f"Data loaded successfully!\n{len(report)} rows failed validation (see the Quality tab).")
 			except Exception as e:
 				messagebox.showerror("Error", f"Failed to load file or parse the file : {e}")
 
-	def _update_graph(self):
+	def _open_partitioned(self):
 		"""
-			Generate and embed a matplotlib Figure for the current selection.
+			Open a partitioned dataset folder written by ``data.store.write_partitioned``.
 
-			This method reads selection values (state/month/year/case/graph type),
-			calls ``analysis.trends.create_figure`` and embeds the returned Figure
-			inside the dashboard canvas. Errors are shown inline in the canvas.
+			Only its manifest is loaded; charts then read just the partitions,
+			row groups and columns of the current selection, so datasets larger
+			than memory can be browsed. Validation and revisions need an
+			in-memory dataset and are not available for it.
+
+			Returns
+			-------
+			None
+		"""
+		path = filedialog.askdirectory()
+		if path:
+			try:
+				dataset = PartitionedDataset(path)
+			except Exception as e:
+				messagebox.showerror("Error", f"Failed to open partitioned dataset : {e}")
+				return
+			self._switch_dataset(self.workspace.add_dataset(os.path.basename(os.path.normpath(path)), dataset))
+			messagebox.showinfo("Success", f"Opened {len(dataset):,} rows in {len(dataset.partitions)} partitions.")
+
+	def _export_partitioned(self):
+		"""
+			Write the loaded dataset to a folder as a Year/Region partitioned dataset.
 
 			Returns
 			-------
 			None
 		"""
-		for widget in self.graph_frame.winfo_children():
-			widget.destroy()
 		if self.data is None:
+			messagebox.showwarning("No Data", "Upload a dataset to export first.")
+			return
+		path = filedialog.askdirectory()
+		if path:
+			try:
+				dataset = write_partitioned(self.data, path)
+				messagebox.showinfo("Saved", f"Wrote {len(dataset.partitions)} partitions to {path}")
+			except Exception as e:
+				messagebox.showerror("Error", f"Failed to export dataset: {e}")
+
+	def _chart_source(self):
+		"""
+			Return what charts are drawn from: ``self.data`` or the opened ``self.dataset``.
+
+			Returns
+			-------
+			pandas.DataFrame | data.store.PartitionedDataset | None
+		"""
+		return self.data if self.data is not None else self.dataset
+
+	def _switch_dataset(self, name):
+		"""
+			Make the workspace dataset ``name`` the active one.
+
+			An evicted frame is loaded back from disk (others may be evicted in
+			turn to stay within the memory budget); its validation report is
+			kept by the workspace so it is not recomputed. The quarantined view
+			and the Revisions snapshot are restored from the dataset's derived
+			frames while it stays in memory. Menus and the current tab are
+			refreshed.
+
+			Parameters
+			----------
+			name : str
+				Name of the dataset in ``self.workspace``.
+
+			Returns
+			-------
+			None
+		"""
+		source = self.workspace.get(name)
+		entry = self.workspace.entry(name)
+		if entry.dataset is not None:
+			self.dataset = source
+			self.data = self.raw_data = self.quarantined = self.validation_report = self.region_report = None
+		else:
+			self.dataset = None
+			self.raw_data = source
+			if 'validation_report' not in entry.attrs:
+				entry.attrs['validation_report'] = validate_data(source)
+			self.validation_report = entry.attrs['validation_report']
+			self.region_report = entry.attrs.get('region_report')
+			self._apply_quarantine()
+		self.previous_data = entry.derived.get('previous_data')
+		self.snapshot_diff = None
+		self.dataset_menu['values'] = self.workspace.names
+		self.dataset_var.set(name)
+		self._populate_menus()
+		self._on_tab_change()
+
+	def _apply_quarantine(self):
+		"""
+			Derive ``self.data`` from ``self.raw_data`` and the validation report.
+
+			When quarantine is enabled violating rows are moved to
+			``self.quarantined``; otherwise every row is kept. The filtered
+			copies are registered as derived frames of the active workspace
+			dataset so they count against the memory budget (and are reused
+			when switching back to it).
+
+			Returns
+			-------
+			None
+		"""
+		entry = self.workspace.entry(self.workspace.active) if self.workspace.active in self.workspace else None
+		if self.quarantine_var.get():
+			if entry is not None and 'data' in entry.derived:
+				self.data, self.quarantined = entry.derived['data'], entry.derived['quarantined']
+			else:
+				self.data, self.quarantined = quarantine(self.raw_data, self.validation_report)
+		else:
+			self.data, self.quarantined = self.raw_data, None
+		if entry is not None:
+			self.workspace.set_derived(entry.name, 'data', self.data if self.quarantined is not None else None)
+			self.workspace.set_derived(entry.name, 'quarantined', self.quarantined)
+
+	def _on_quarantine_toggle(self):
+		"""
+			Re-apply quarantine after the checkbox changes and refresh the view.
+
+			Returns
+			-------
+			None
+		"""
+		if self.raw_data is None:
+			return
+		self._apply_quarantine()
+		self._populate_menus()
+		self._on_tab_change()
+
+	def _populate_menus(self):
+		"""
+			Fill the state/month/year comboboxes from ``self.data`` (or the
+			manifest of ``self.dataset``).
+
+			The current selection is kept when it is still available, otherwise
+			the first value is selected.
+
+			Returns
+			-------
+			None
+		"""
+		if self.data is None and self.dataset is not None:
+			# Partitioned dataset: the manifest lists what is available
+			self.state_menu['values'] = self.dataset.regions
+			months, years = self.dataset.months, self.dataset.years
+		else:
+			# Populate combobox options (guard against missing columns)
+			self.state_menu['values'] = sorted(self.data['Region'].dropna().unique())
+			# Normalize combobox values to strings to avoid float-like values (e.g. '1.0')
+			months = sorted(self.data['Month'].dropna().unique())
+			years = sorted(self.data['Year'].dropna().unique())
+		self.month_menu['values'] = [str(int(m)) for m in months]
+		self.year_menu['values'] = [str(int(y)) for y in years]
+		# Set defaults if possible
+		for menu, var in [(self.state_menu, self.state_var), (self.month_menu, self.month_var), (self.year_menu, self.year_var)]:
+			values = list(menu['values'])
+			if values and var.get() not in values:
+				var.set(values[0])
+
+	def _update_graph(self):
+		"""
+			Generate and show a matplotlib Figure for the current selection.
+
+			This method reads selection values (state/month/year/case/graph type)
+			and builds the chart with ``analysis.trends.create_figure``. In "Fast"
+			render mode the aggregation and Agg rasterisation run on the
+			background ``ChartRenderer`` and the resulting image is shown once
+			ready; a newer selection cancels the in-flight render. In
+			"Interactive" mode the Figure is embedded in a ``FigureCanvasTkAgg``
+			with a navigation toolbar for pan/zoom and a ``gui.hover.HoverOverlay``
+			crosshair/tooltip. Errors are shown inline in the canvas.
+
+			Returns
+			-------
+			None
+		"""
+		if not hasattr(self, 'graph_frame') or not self.graph_frame.winfo_exists():
+			# Dashboard is not visible; it is redrawn when the tab is shown again
+			self.renderer.cancel_pending()
+			return
+		source = self._chart_source()
+		if source is None:
 			# No data loaded yet
-			tk.Label(self.graph_frame, text="No data loaded.", font=APP_FONT, bg=COLOR_PALETTE['canvas_bg'], fg='red').pack(expand=True)
+			self._show_graph_message("No data loaded.")
 			return
-		# Prepare plotting parameters
+		params = self._graph_params()
+
+		if self.render_mode_var.get() == "Interactive":
+			self.renderer.cancel_pending()
+			self._render_future = None
+			try:
+				fig = create_figure(source, palette=COLOR_PALETTE, **params)
+			except Exception as e:
+				self._show_graph_message(f"Error: {e}")
+				return
+			self._clear_graph_frame()
+			canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
+			toolbar = NavigationToolbar2Tk(canvas, self.graph_frame, pack_toolbar=False)
+			toolbar.update()
+			toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+			# Created before the first draw so the overlay's background gets cached
+			self._hover = HoverOverlay(canvas, fig.axes[0]) if fig.axes else None
+			canvas.draw()
+			canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+			self.current_figure = fig
+			return
+
+		# Render at the size of the frame so the image fills it without scaling
+		# (falls back to the figure's default size before the frame is mapped)
+		width = self.graph_frame.winfo_width() - 8
+		height = self.graph_frame.winfo_height() - 8
+		if width < 200 or height < 150:
+			width = height = None
+		self._render_future = self.renderer.submit(source, width=width, height=height, palette=COLOR_PALETTE, **params)
+		self.after(RENDER_POLL_MS, self._poll_render, self._render_future)
+
+	def _graph_params(self):
+		"""
+			Read the right sidebar selections as ``create_figure`` keyword arguments.
+
+			Returns
+			-------
+			dict
+		"""
 		state = self.state_var.get() or None
 		# Parse month/year robustly (handle values like '1.0')
 		month = None
@@ -447,17 +1140,203 @@ class MainWindow(tk.Tk):
 				year = int(float(self.year_var.get()))
 			except Exception:
 				year = None
+		return {
+			'state': state,
+			'month': month,
+			'year': year,
+			'case_type': self.case_type_var.get(),
+			'graph_type': self.graph_type_var.get(),
+			# Date range (if any) takes precedence over month/year in create_figure
+			'start_date': self.start_date_var.get().strip() or None,
+			'end_date': self.end_date_var.get().strip() or None,
+		}
+
+	def _poll_render(self, future):
+		"""
+			Show the result of a background render once it has finished.
+
+			Results of renders that were superseded by a newer selection are
+			dropped, so only the latest chart ever reaches the dashboard.
+
+			Parameters
+			----------
+			future : concurrent.futures.Future
+				Future returned by ``ChartRenderer.submit``.
+
+			Returns
+			-------
+			None
+		"""
+		if future is not self._render_future:
+			return
+		if not future.done():
+			self.after(RENDER_POLL_MS, self._poll_render, future)
+			return
+		self._render_future = None
+		if future.cancelled() or not self.graph_frame.winfo_exists():
+			return
+		try:
+			fig, png = future.result()
+		except RenderCancelled:
+			return
+		except Exception as e:
+			self._show_graph_message(f"Error: {e}")
+			return
+		self._clear_graph_frame()
+		self._graph_image = tk.PhotoImage(data=base64.b64encode(png))
+		tk.Label(self.graph_frame, image=self._graph_image, bg=COLOR_PALETTE['canvas_bg']).pack(fill=tk.BOTH, expand=True)
+		self.current_figure = fig
+
+	def _timeline(self):
+		"""
+			Region x Date timeline of the selected case type for playback/export.
+
+			Uses the active frame, or reads the case column of every partition
+			of an opened partitioned dataset. The date range entries (if set)
+			limit the days played; State/Month/Year are not used since every
+			region is shown.
+
+			Returns
+			-------
+			analysis.timeline.Timeline
+		"""
+		source = self._chart_source()
+		if source is None:
+			raise ValueError("No data loaded.")
 		case_type = self.case_type_var.get()
-		graph_type = self.graph_type_var.get()
+		if case_type not in cp.DEFAULT_CASE_COLUMNS:
+			raise ValueError(f"Timeline playback shows case counts, not {case_type}.")
+		if isinstance(source, PartitionedDataset):
+			source = source.read(columns=[case_type])
+		params = self._graph_params()
+		return timeline_matrix(source, case_type, params['start_date'], params['end_date'])
+
+	def _play_timeline(self):
+		"""
+			Play the timeline on the dashboard at ``PLAYBACK_FPS``.
+
+			The figure is built once with ``analysis.timeline.TimelinePlot`` and
+			animated by ``FuncAnimation`` with blitting: each frame only redraws
+			the bars/lines and labels over a cached background. Any selection
+			change replaces the animation with the regular chart.
+
+			Returns
+			-------
+			None
+		"""
+		if not hasattr(self, 'graph_frame') or not self.graph_frame.winfo_exists():
+			messagebox.showwarning("Timeline", "Open the Dashboard to play the timeline.")
+			return
 		try:
-			fig = create_figure(self.data, state=state, month=month, year=year, case_type=case_type, graph_type=graph_type, palette=COLOR_PALETTE)
+			plot = TimelinePlot(self._timeline(), kind=self.timeline_kind_var.get(), fig=Figure(figsize=(10, 6)))
 		except Exception as e:
-			tk.Label(self.graph_frame, text=f"Error: {e}", font=APP_FONT, bg=COLOR_PALETTE['canvas_bg'], fg='red').pack(expand=True)
+			self._show_graph_message(f"Error: {e}")
 			return
-		canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
-		canvas.draw()
+		self.renderer.cancel_pending()
+		self._render_future = None
+		self._clear_graph_frame()
+		canvas = FigureCanvasTkAgg(plot.fig, master=self.graph_frame)
 		canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-		self.current_figure = fig
+		self._animation = FuncAnimation(plot.fig, plot.draw_frame, frames=len(plot), init_func=plot.init,
+			interval=1000 / PLAYBACK_FPS, blit=True, repeat=False)
+		canvas.draw()
+		self.current_figure = plot.fig
+
+	def _stop_timeline(self):
+		"""
+			Stop timeline playback, leaving the current frame on screen.
+
+			Returns
+			-------
+			None
+		"""
+		if self._animation is not None:
+			self._animation.pause()
+			self._animation = None
+
+	def _export_timeline(self):
+		"""
+			Save the timeline as a GIF or MP4 without blocking the window.
+
+			``analysis.timeline.export_timeline`` runs on a background thread and
+			rasterises frames in worker processes; the Export button shows the
+			progress until it finishes. MP4 needs ffmpeg on PATH.
+
+			Returns
+			-------
+			None
+		"""
+		if self._export_future is not None:
+			messagebox.showwarning("Timeline", "An export is already running.")
+			return
+		try:
+			timeline = self._timeline()
+		except Exception as e:
+			messagebox.showerror("Error", f"Failed to build the timeline: {e}")
+			return
+		filetypes = [("GIF Animation", "*.gif"), ("MP4 Video", "*.mp4")]
+		file_path = filedialog.asksaveasfilename(defaultextension=".gif", filetypes=filetypes)
+		if not file_path:
+			return
+		self._export_progress = (0, len(timeline))
+		self._export_future = self._export_executor.submit(export_timeline, timeline, file_path,
+			kind=self.timeline_kind_var.get(), progress=lambda done, total: setattr(self, '_export_progress', (done, total)))
+		self.after(RENDER_POLL_MS * 10, self._poll_export, file_path)
+
+	def _poll_export(self, file_path):
+		"""
+			Update the Export button with the export progress and report the result.
+
+			Parameters
+			----------
+			file_path : str
+				File the timeline is being written to.
+
+			Returns
+			-------
+			None
+		"""
+		future = self._export_future
+		if future is None:
+			return
+		if not future.done():
+			done, total = self._export_progress
+			self.export_timeline_btn.config(text=f"{100 * done // max(total, 1)}%")
+			self.after(RENDER_POLL_MS * 10, self._poll_export, file_path)
+			return
+		self._export_future = None
+		self.export_timeline_btn.config(text="Export")
+		try:
+			frames = future.result()
+			messagebox.showinfo("Saved", f"Timeline ({frames} frames) saved to {file_path}")
+		except Exception as e:
+			messagebox.showerror("Error", f"Failed to export timeline: {e}")
+
+	def _clear_graph_frame(self):
+		self._stop_timeline()
+		if self._hover is not None:
+			self._hover.disconnect()
+			self._hover = None
+		for widget in self.graph_frame.winfo_children():
+			widget.destroy()
+
+	def _show_graph_message(self, text):
+		self._clear_graph_frame()
+		tk.Label(self.graph_frame, text=text, font=APP_FONT, bg=COLOR_PALETTE['canvas_bg'], fg='red').pack(expand=True)
+
+	def _on_close(self):
+		"""
+			Stop the background renderer, delete evicted datasets and close the window.
+
+			Returns
+			-------
+			None
+		"""
+		self.renderer.shutdown()
+		self._stop_timeline()
+		self._export_executor.shutdown(wait=False, cancel_futures=True)
+		self.workspace.close()
+		self.destroy()
 
 	def _download_graph(self):
 		"""
@@ -470,7 +1349,7 @@ class MainWindow(tk.Tk):
 			-------
 			None
 		"""
-		if not hasattr(self, 'current_figure') or self.current_figure is None:
+		if self.current_figure is None:
 			messagebox.showwarning("No Graph", "No graph to download.")
 			return
 		filetypes = [("PNG Image", "*.png"), ("PDF Document", "*.pdf")]
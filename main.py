@@ -1,4 +1,6 @@
 import gui.main_window as gui
 
-app = gui.MainWindow()
-app.mainloop()
\ No newline at end of file
+# Timeline export starts worker processes that re-import this module
+if __name__ == "__main__":
+	app = gui.MainWindow()
+	app.mainloop()
@@ -0,0 +1,316 @@
+"""
+Headless HTTP service exposing aggregate series and rendered charts.
+
+Run from the project root, e.g.::
+
+    python -m service.http_server --data india="assets/COVID-19 Cases(02-10-2025).csv" --port 8080
+
+Endpoints (all GET, query parameters in brackets are optional):
+
+    /datasets                                      loaded datasets and their fingerprints
+    /series?dataset=&[region]&[year]&[month]&[start]&[end]&[case_type]          JSON {x, y}
+    /chart.png?dataset=&[region]&[year]&[month]&[start]&[end]&[case_type]&[graph_type]   PNG
+
+start/end (YYYY-MM-DD) select a date range instead of year/month.
+
+Only the standard library, pandas and matplotlib are used. The event loop
+only parses requests and serves cached bytes; aggregation and rendering run
+in a process pool whose workers each load the datasets once. Responses are
+cached and carry an ETag derived from the dataset fingerprint, so clients can
+revalidate with If-None-Match and get 304 Not Modified. Errors caused by the
+request itself (unknown paths or datasets, invalid parameters) are cached and
+ETagged the same way, so repeating a bad request never reaches the workers.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from email.utils import formatdate
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import numpy as np
+import pandas as pd
+
+# Make sure the project root is on sys.path so local packages can be imported
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from data import cleaning_pipeline as cp
+from analysis.trends import aggregate_series, create_figure
+from analysis.rendering import render_png
+
+# Cached responses kept in memory (LRU)
+RESPONSE_CACHE_SIZE = 2048
+MAX_HEADER_BYTES = 16 * 1024
+# Larger request bodies (never needed by a GET) close the connection instead of being read
+MAX_BODY_BYTES = 64 * 1024
+
+STATUS_TEXT = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+# Datasets of a worker process, filled by _init_worker
+_WORKER_DATASETS = {}
+
+
+def _init_worker(paths: dict):
+    for name, path in paths.items():
+        _WORKER_DATASETS[name] = cp.load_data_from_file(path)
+
+
+def _selection(params: dict) -> dict:
+    def as_int(key):
+        value = params.get(key)
+        if value in (None, ""):
+            return None
+        try:
+            return int(float(value))
+        except ValueError:
+            raise ValueError(f"'{key}' must be an integer")
+
+    return {
+        'state': params.get('region') or None,
+        'month': as_int('month'),
+        'year': as_int('year'),
+        'case_type': params.get('case_type', "Confirmed Cases"),
+        'start_date': params.get('start') or None,
+        'end_date': params.get('end') or None,
+    }
+
+
+def _render_job(kind: str, dataset: str, params: dict) -> tuple[str, bytes]:
+    """Compute one response body in a worker process. Returns (content type, body)."""
+    df = _WORKER_DATASETS[dataset]
+    selection = _selection(params)
+    if kind == 'series':
+        series = aggregate_series(df, **selection)
+        if np.issubdtype(series.dtype, np.integer):
+            values = [int(v) for v in series.values]
+        else:
+            values = [None if np.isnan(v) else float(v) for v in series.values.astype(float)]
+        body = {
+            'dataset': dataset,
+            'region': selection['state'],
+            'year': selection['year'],
+            'month': selection['month'],
+            'case_type': selection['case_type'],
+            'start': selection['start_date'],
+            'end': selection['end_date'],
+            'x': [v.strftime('%Y-%m-%d') for v in series.index] if isinstance(series.index, pd.DatetimeIndex)
+                 else [int(v) for v in series.index],
+            'y': values,
+        }
+        return "application/json", json.dumps(body).encode()
+    fig = create_figure(df, graph_type=params.get('graph_type', "Line"), **selection)
+    return "image/png", render_png(fig)
+
+
+class ChartService:
+    """
+    Serve aggregate series and chart PNGs for a fixed set of datasets.
+
+    ``paths`` maps dataset names to CSV/XLSX files; they are loaded once in
+    this process (for fingerprints and the dataset listing) and once per worker.
+    Identical concurrent requests share a single render.
+    """
+
+    def __init__(self, paths: dict, workers: int | None = None):
+        self.paths = dict(paths)
+        self.datasets = {name: cp.load_data_from_file(path) for name, path in self.paths.items()}
+        self.fingerprints = {name: cp.dataset_fingerprint(df) for name, df in self.datasets.items()}
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.paths,))
+        self._listing_etag = '"' + hashlib.blake2b("".join(sorted(self.fingerprints.values())).encode(), digest_size=8).hexdigest() + '"'
+        self._cache = OrderedDict()
+        self._inflight = {}
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def _dataset_listing(self) -> bytes:
+        listing = []
+        for name, df in self.datasets.items():
+            listing.append({
+                'name': name,
+                'fingerprint': self.fingerprints[name],
+                'rows': int(len(df)),
+                'regions': sorted(map(str, df['Region'].dropna().unique())),
+                'years': sorted(int(y) for y in df['Year'].dropna().unique()),
+            })
+        return json.dumps(listing).encode()
+
+    def _error(self, status: int, message: str) -> tuple[int, str, bytes, str]:
+        # Error bodies only depend on the request and the loaded datasets
+        body = json.dumps({'error': message}).encode()
+        etag = '"' + hashlib.blake2b(self._listing_etag.encode() + body, digest_size=8).hexdigest() + '"'
+        return status, "application/json", body, etag
+
+    async def get(self, path: str, params: dict) -> tuple[int, str, bytes, str | None]:
+        """Resolve a request to (status, content type, body, etag)."""
+        if path == '/datasets':
+            return 200, "application/json", self._dataset_listing(), self._listing_etag
+        if path not in ('/series', '/chart.png'):
+            return self._error(404, "not found")
+
+        dataset = params.get('dataset')
+        if dataset is None and len(self.datasets) == 1:
+            dataset = next(iter(self.datasets))
+        if dataset not in self.datasets:
+            return self._error(404, f"unknown dataset: {dataset}")
+
+        kind = 'series' if path == '/series' else 'chart'
+        # Re-encode the decoded parameters, so an escaped "&" or "=" inside a
+        # value cannot produce the key of a different request
+        query = urlencode(sorted((k, v) for k, v in params.items() if k != 'dataset'))
+        digest = hashlib.blake2b(f"{kind}?{query}".encode(), digest_size=8).hexdigest()
+        etag = f'"{self.fingerprints[dataset][:16]}-{digest}"'
+
+        cached = self._cache.get(etag)
+        if cached is not None:
+            self._cache.move_to_end(etag)
+            return (*cached, etag)
+
+        # Coalesce identical concurrent requests onto one worker job
+        future = self._inflight.get(etag)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.pool, _render_job, kind, dataset, params)
+            self._inflight[etag] = future
+            future.add_done_callback(lambda _: self._inflight.pop(etag, None))
+        try:
+            status, (content_type, body) = 200, await asyncio.shield(future)
+        except ValueError as e:
+            # Invalid parameters: the same request always fails the same way
+            status, content_type, body = 400, "application/json", json.dumps({'error': str(e)}).encode()
+
+        self._cache[etag] = (status, content_type, body)
+        if len(self._cache) > RESPONSE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return status, content_type, body, etag
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve HTTP/1.1 requests on one connection until it is closed."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                if len(head) > MAX_HEADER_BYTES:
+                    break
+                lines = head.decode('latin-1').split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._respond(writer, 400, "application/json", b'{"error": "bad request line"}', None, False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        k, v = line.split(":", 1)
+                        headers[k.strip().lower()] = v.strip()
+                keep_alive = headers.get('connection', '').lower() != 'close' and version == "HTTP/1.1"
+                # Read past any request body so the next request on the connection
+                # starts at its request line; close when it cannot be skipped safely
+                if not await self._discard_body(reader, headers):
+                    keep_alive = False
+
+                if method not in ('GET', 'HEAD'):
+                    await self._respond(writer, 405, "application/json", b'{"error": "method not allowed"}', None, keep_alive)
+                    if not keep_alive:
+                        break
+                    continue
+                url = urlsplit(target)
+                params = dict(parse_qsl(url.query))
+                try:
+                    status, content_type, body, etag = await self.get(url.path, params)
+                except Exception as e:
+                    status, content_type, body, etag = 500, "application/json", json.dumps({'error': str(e)}).encode(), None
+                if status == 200 and etag is not None and headers.get('if-none-match') == etag:
+                    status, body = 304, b""
+                await self._respond(writer, status, content_type, body if method == 'GET' else b"", etag, keep_alive,
+                                    content_length=len(body))
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _discard_body(reader: asyncio.StreamReader, headers: dict) -> bool:
+        """Skip the request body given by Content-Length; False if that is not possible."""
+        if 'transfer-encoding' in headers:
+            return False
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            return False
+        if length < 0 or length > MAX_BODY_BYTES:
+            return False
+        if length:
+            try:
+                await reader.readexactly(length)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return False
+        return True
+
+    async def _respond(self, writer, status, content_type, body, etag, keep_alive, content_length=None):
+        headers = [
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+            f"Date: {formatdate(usegmt=True)}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body) if content_length is None else content_length}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if etag is not None:
+            headers.append(f"ETag: {etag}")
+            headers.append("Cache-Control: no-cache")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode('latin-1') + body)
+        await writer.drain()
+
+
+async def serve(paths: dict, host: str = "127.0.0.1", port: int = 8080, workers: int | None = None):
+    service = ChartService(paths, workers)
+    server = await asyncio.start_server(service.handle_connection, host, port, backlog=1024)
+    print(f"Serving {', '.join(paths)} on http://{host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def _parse_data_args(values: list) -> dict:
+    paths = {}
+    for value in values:
+        name, sep, path = value.partition("=")
+        if not sep:
+            name, path = os.path.splitext(os.path.basename(value))[0], value
+        paths[name] = path
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve COVID-19 aggregates and charts over HTTP.")
+    parser.add_argument('--data', action='append', required=True, metavar='NAME=PATH',
+                        help="dataset to serve (repeatable); NAME defaults to the file name")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=None, help="render processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(_parse_data_args(args.data), args.host, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
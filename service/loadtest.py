@@ -0,0 +1,110 @@
+"""
+Load test for ``service.http_server``.
+
+Opens ``--concurrency`` keep-alive connections that together send
+``--requests`` GET requests over a mix of series and chart URLs for every
+region/year of a dataset, then reports throughput and p50/p99 latency::
+
+    python -m service.loadtest --port 8080 --concurrency 200 --requests 5000
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from urllib.parse import urlencode
+
+import numpy as np
+
+CASE_TYPES = ["Confirmed Cases", "Active Cases", "Cured/Discharged", "Death"]
+
+
+async def _request(reader, writer, host, path):
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode('latin-1').split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    length = 0
+    for line in lines[1:]:
+        if line.lower().startswith("content-length:"):
+            length = int(line.split(":", 1)[1])
+    body = await reader.readexactly(length)
+    return status, body
+
+
+async def _fetch_json(host, port, path):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        status, body = await _request(reader, writer, host, path)
+    finally:
+        writer.close()
+    if status != 200:
+        raise RuntimeError(f"{path} returned {status}")
+    return json.loads(body)
+
+
+def _build_urls(listing: list, charts: float) -> list:
+    urls = []
+    for ds in listing:
+        for region in ds['regions']:
+            for year in ds['years']:
+                for case_type in CASE_TYPES:
+                    query = urlencode({'dataset': ds['name'], 'region': region, 'year': year, 'case_type': case_type})
+                    urls.append(f"/series?{query}")
+                    if random.random() < charts:
+                        urls.append(f"/chart.png?{query}")
+    return urls
+
+
+async def _worker(host, port, urls, counter, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while counter[0] > 0:
+            counter[0] -= 1
+            path = random.choice(urls)
+            start = time.perf_counter()
+            status, _ = await _request(reader, writer, host, path)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+    finally:
+        writer.close()
+
+
+async def run(host: str, port: int, concurrency: int, requests: int, charts: float) -> dict:
+    listing = await _fetch_json(host, port, "/datasets")
+    urls = _build_urls(listing, charts)
+    latencies, statuses = [], Counter()
+    counter = [requests]
+    start = time.perf_counter()
+    await asyncio.gather(*(_worker(host, port, urls, counter, latencies, statuses) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    ms = np.array(latencies) * 1000
+    return {
+        'requests': len(latencies),
+        'seconds': elapsed,
+        'rps': len(latencies) / elapsed,
+        'p50_ms': float(np.percentile(ms, 50)),
+        'p99_ms': float(np.percentile(ms, 99)),
+        'max_ms': float(ms.max()),
+        'statuses': dict(statuses),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the COVID-19 HTTP service.")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--charts', type=float, default=0.2, help="fraction of URLs that request a PNG chart")
+    args = parser.parse_args(argv)
+    result = asyncio.run(run(args.host, args.port, args.concurrency, args.requests, args.charts))
+    print(f"{result['requests']} requests in {result['seconds']:.2f}s ({result['rps']:.0f} req/s)")
+    print(f"p50 {result['p50_ms']:.1f} ms  p99 {result['p99_ms']:.1f} ms  max {result['max_ms']:.1f} ms")
+    print(f"status codes: {result['statuses']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.cleaning_pipeline import clean_data  # noqa: E402
+
+REGIONS = ["Kerala", "Maharashtra", "Jammu and Kashmir", "Delhi"]
+
+
+def make_raw(days: int = 120, regions=REGIONS, start: str = "2021-01-01", seed: int = 0) -> pd.DataFrame:
+    """Raw export-like frame (strings, day-first dates) with cumulative counts per region."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start, periods=days, freq="D")
+    rows = []
+    for r, region in enumerate(regions):
+        confirmed = np.cumsum(rng.integers(50, 500, days)) + 1000 * (r + 1)
+        death = (confirmed * 0.01).astype(int)
+        cured = (confirmed * 0.9).astype(int)
+        active = confirmed - death - cured
+        for d, date in enumerate(dates):
+            rows.append((date.strftime("%d/%m/%Y"), region, confirmed[d], active[d], cured[d], death[d]))
+    raw = pd.DataFrame(rows, columns=["Date", "Region", "Confirmed Cases", "Active Cases", "Cured/Discharged", "Death"])
+    return raw.astype(str)
+
+
+@pytest.fixture
+def raw():
+    return make_raw()
+
+
+@pytest.fixture
+def frame(raw):
+    return clean_data(raw)
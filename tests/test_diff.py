@@ -0,0 +1,46 @@
+import pandas as pd
+
+from data.cleaning_pipeline import clean_data
+from data.diff import diff_snapshots
+from tests.conftest import make_raw
+
+
+def test_identical_snapshots(frame):
+    diff = diff_snapshots(frame, frame.copy())
+    assert not diff
+    assert diff.describe() == "0 rows added, 0 removed, 0 revised (0 cells)"
+
+
+def test_added_removed_and_revised(raw):
+    old = clean_data(raw)
+    edited = raw.copy()
+    edited = edited[~((edited['Region'] == "Delhi") & (edited['Date'] == "01/01/2021"))]
+    kerala = (edited['Region'] == "Kerala") & (edited['Date'] == "10/01/2021")
+    before = int(edited.loc[kerala, 'Death'].iloc[0])
+    edited.loc[kerala, 'Death'] = str(before + 7)
+    extra = make_raw(days=2, regions=["Goa"], start="2021-03-01")
+    new = clean_data(pd.concat([edited, extra], ignore_index=True))
+
+    diff = diff_snapshots(old, new)
+    assert diff.describe() == "2 rows added, 1 removed, 1 revised (1 cells)"
+    assert diff.added['Region'].astype(str).tolist() == ["Goa", "Goa"]
+    assert diff.removed['Region'].astype(str).tolist() == ["Delhi"]
+    assert diff.revised.to_dict('records') == [{
+        'Region': "Kerala", 'Date': pd.Timestamp("2021-01-10"), 'Column': "Death",
+        'Old': before, 'New': before + 7, 'Change': 7,
+    }]
+
+    summary = diff.summary.set_index('Region')
+    assert summary.loc["Kerala", 'Revised'] == 1
+    assert summary.loc["Kerala", 'Death change'] == 7
+    assert summary.loc["Goa", 'Added'] == 2
+    assert summary.loc["Delhi", 'Removed'] == 1
+
+
+def test_no_shared_value_columns(frame):
+    old = frame[['Region', 'Date', 'Death']]
+    new = frame[['Region', 'Date', 'Confirmed Cases']].iloc[1:]
+    diff = diff_snapshots(old, new)
+    assert len(diff.removed) == 1 and len(diff.added) == 0
+    assert len(diff.revised) == 0 and diff.revised_rows == 0
+    assert diff.summary['Removed'].sum() == 1
@@ -0,0 +1,83 @@
+import gc
+import weakref
+
+import numpy as np
+import pytest
+
+from analysis.distributions import RELATIVE_ACCURACY, Sketch, distribution_index
+from data.cleaning_pipeline import clean_data
+
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(1)
+    return np.concatenate([rng.lognormal(8, 2, 20000).round(), np.zeros(50), -rng.integers(1, 100, 50)])
+
+
+def test_quantiles_within_relative_accuracy(values):
+    sketch = Sketch.from_values(values)
+    assert len(sketch) == len(values)
+    assert sketch.min == values.min() and sketch.max == values.max()
+    ordered = np.sort(values)
+    for q in (0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99):
+        exact = ordered[int(np.floor(q * (len(values) - 1)))]
+        assert abs(sketch.quantile(q) - exact) <= RELATIVE_ACCURACY * abs(exact) + 1e-9
+
+
+def test_merge_equals_sketch_of_union(values):
+    parts = np.array_split(values, 7)
+    merged = Sketch.merge([Sketch.from_values(p) for p in parts])
+    whole = Sketch.from_values(values)
+    assert np.array_equal(merged.keys, whole.keys)
+    assert np.array_equal(merged.counts, whole.counts)
+    assert (merged.min, merged.max) == (whole.min, whole.max)
+
+
+def test_merge_of_nothing_is_empty():
+    assert len(Sketch.merge([])) == 0
+
+
+def test_histogram_keeps_every_value(values):
+    counts, edges = Sketch.from_values(values).histogram(10)
+    assert len(counts) == 10 and len(edges) == 11
+    assert counts.sum() == pytest.approx(len(values))
+    assert edges[0] == values.min() and edges[-1] == values.max()
+
+
+def test_box_stats_order(values):
+    stats = Sketch.from_values(values).box_stats("x")
+    assert stats["whislo"] <= stats["q1"] <= stats["med"] <= stats["q3"] <= stats["whishi"]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"state": "Kerala"},
+    {"month": 2},
+    {"month": 3, "year": 2021},
+    {"start_date": "2021-01-15", "end_date": "2021-03-10"},
+    {"state": "Delhi", "start_date": "2021-02-01", "end_date": "2021-02-28"},
+])
+def test_index_matches_rows(frame, kwargs):
+    rows = np.ones(len(frame), dtype=bool)
+    if kwargs.get("state"):
+        rows &= (frame["Region"] == kwargs["state"]).values
+    if "month" in kwargs:
+        rows &= (frame["Month"] == kwargs["month"]).values
+    if "year" in kwargs:
+        rows &= (frame["Year"] == kwargs["year"]).values
+    if "start_date" in kwargs:
+        rows &= ((frame["Date"] >= kwargs["start_date"]) & (frame["Date"] <= kwargs["end_date"])).values
+    expected = Sketch.from_values(frame["Death"].values[rows])
+    sketch = distribution_index(frame).sketch("Death", **kwargs)
+    assert np.array_equal(sketch.keys, expected.keys)
+    assert np.array_equal(sketch.counts, expected.counts)
+    assert (sketch.min, sketch.max) == (expected.min, expected.max)
+
+
+def test_index_does_not_keep_frame_alive(raw):
+    frame = clean_data(raw)
+    distribution_index(frame).sketch("Death")
+    ref = weakref.ref(frame)
+    del frame
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,61 @@
+import json
+
+from analysis.forecasting import ForecastEngine
+from data.cleaning_pipeline import clean_data
+from tests.conftest import make_raw
+
+
+def _frame():
+    return clean_data(make_raw(days=40, regions=["Kerala", "Delhi"]))
+
+
+def test_forecast_shape_and_refit():
+    df = _frame()
+    engine = ForecastEngine(horizon=5, max_workers=1)
+    out = engine.forecast(df, "Death")
+    assert sorted(engine.last_refit) == ["Delhi", "Kerala"]
+    assert len(out) == 10 and list(out.columns) == ['Region', 'Date', 'Death']
+    kerala = out[out['Region'] == "Kerala"]['Death']
+    assert kerala.is_monotonic_increasing
+    assert kerala.iloc[0] >= df[df['Region'] == "Kerala"]['Death'].iloc[-1]
+
+    engine.forecast(df, "Death")
+    assert engine.last_refit == []
+
+
+def test_params_per_case_type_and_model():
+    df = _frame()
+    engine = ForecastEngine(horizon=5)
+    engine.forecast(df, "Death", regions=["Kerala"])
+    assert engine.params("Kerala", "Death") is not None
+    assert engine.params("Kerala") is None
+    assert engine.params("Kerala", "Death", model="arima") is None
+
+
+def test_cache_is_bounded():
+    df = _frame()
+    engine = ForecastEngine(horizon=5, cache_size=1)
+    out = engine.forecast(df, "Death", regions=["Kerala"])
+    engine.forecast(df, "Confirmed Cases", regions=["Kerala"])
+    assert len(engine._cache) == 1
+    assert engine.params("Kerala", "Death") is None
+    # Evicted fits are refitted, with the same result
+    assert engine.forecast(df, "Death", regions=["Kerala"]).equals(out)
+    assert engine.last_refit == ["Kerala"]
+
+
+def test_cache_file_round_trip(tmp_path):
+    df = _frame()
+    path = str(tmp_path / "forecasts.json")
+    out = ForecastEngine(horizon=5, cache_path=path).forecast(df, "Death", regions=["Kerala"])
+    engine = ForecastEngine(horizon=5, cache_path=path)
+    assert engine.forecast(df, "Death", regions=["Kerala"]).equals(out)
+    assert engine.last_refit == []
+
+
+def test_invalid_cache_file_is_ignored(tmp_path):
+    path = tmp_path / "forecasts.json"
+    path.write_bytes(b"\x80\x04cos\nsystem\n.")
+    assert len(ForecastEngine(cache_path=str(path))._cache) == 0
+    path.write_text(json.dumps({'format': 1, 'entries': [{'key': ["x"], 'fit': {}}]}))
+    assert len(ForecastEngine(cache_path=str(path))._cache) == 0
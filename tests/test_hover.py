@@ -0,0 +1,66 @@
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from gui.hover import HoverOverlay
+
+
+def _overlay(*series):
+    fig = Figure(figsize=(6, 4), dpi=100)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    for label, x, y in series:
+        ax.plot(x, y, label=label)
+    ax.set_xlim(-2, 6)
+    ax.set_ylim(-10, 50)
+    canvas.draw()
+    return ax, HoverOverlay(canvas, ax)
+
+
+def _nearest(ax, overlay, x, y):
+    px, py = ax.transData.transform((x, y))
+    _, label, hx, hy = overlay._nearest(px, py)
+    return label, hx, hy
+
+
+LINE = ("cases", [0, 1, 2, 3], [0, 10, 20, 30])
+
+
+@pytest.mark.parametrize("x, y, expected", [
+    (-1.5, 0, (0, 0)),     # before the first point
+    (5.5, 30, (3, 30)),    # after the last point
+    (1.1, 11, (1, 10)),
+    (1.6, 18, (2, 20)),
+])
+def test_nearest_point(x, y, expected):
+    ax, overlay = _overlay(LINE)
+    label, hx, hy = _nearest(ax, overlay, x, y)
+    assert (label, hx, hy) == ("cases", *expected)
+
+
+def test_exactly_between_two_points():
+    ax, overlay = _overlay(LINE)
+    _, hx, hy = _nearest(ax, overlay, 1.5, 15)
+    assert (hx, hy) in ((1, 10), (2, 20))
+
+
+def test_unsorted_x_is_searched_in_order():
+    ax, overlay = _overlay(("cases", [3, 0, 2, 1], [30, 0, 20, 10]))
+    assert _nearest(ax, overlay, 2.1, 21) == ("cases", 2, 20)
+
+
+def test_nearest_across_lines():
+    ax, overlay = _overlay(("low", [0, 1, 2, 3], [0, 1, 2, 3]), ("high", [0, 1, 2, 3], [40, 41, 42, 43]))
+    assert _nearest(ax, overlay, 2, 38) == ("high", 2, 42)
+    assert _nearest(ax, overlay, 2, 6) == ("low", 2, 2)
+
+
+def test_overlay_does_not_change_the_limits():
+    fig = Figure()
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.plot(*LINE[1:])
+    limits = ax.get_xlim(), ax.get_ylim()
+    HoverOverlay(canvas, ax)
+    ax.autoscale_view()
+    assert (ax.get_xlim(), ax.get_ylim()) == limits
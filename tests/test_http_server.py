@@ -0,0 +1,94 @@
+import asyncio
+import json
+
+import pytest
+
+from service.http_server import ChartService
+from tests.conftest import make_raw
+
+
+@pytest.fixture(scope="module")
+def service(tmp_path_factory):
+    path = tmp_path_factory.mktemp("service") / "india.csv"
+    make_raw(days=60).to_csv(path, index=False)
+    svc = ChartService({'india': str(path)}, workers=1)
+    yield svc
+    svc.close()
+
+
+def _exchange(service, requests):
+    """Send requests as (method, target, headers, body) on one keep-alive connection."""
+    async def run():
+        server = await asyncio.start_server(service.handle_connection, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        responses = []
+        try:
+            for method, target, headers, body in requests:
+                lines = [f"{method} {target} HTTP/1.1", "Host: test"] + [f"{k}: {v}" for k, v in headers.items()]
+                if body:
+                    lines.append(f"Content-Length: {len(body)}")
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+                await writer.drain()
+                head = (await reader.readuntil(b"\r\n\r\n")).decode('latin-1').split("\r\n")
+                fields = dict(line.split(": ", 1) for line in head[1:] if line)
+                length = int(fields['Content-Length'])
+                data = await reader.readexactly(length) if method != 'HEAD' else b""
+                responses.append((int(head[0].split(" ")[1]), fields, data))
+        finally:
+            writer.close()
+            server.close()
+            await server.wait_closed()
+        return responses
+
+    return asyncio.run(run())
+
+
+def _get(service, *targets, headers=None):
+    return _exchange(service, [('GET', t, headers or {}, b"") for t in targets])
+
+
+def test_routing_and_not_found(service):
+    (listing, missing, unknown, series) = _get(
+        service, "/datasets", "/nothing", "/series?dataset=nope", "/series?region=Kerala&year=2021")
+    assert listing[0] == 200
+    assert json.loads(listing[2])[0]['name'] == "india"
+    assert missing[0] == 404 and json.loads(missing[2]) == {'error': "not found"}
+    assert unknown[0] == 404 and "nope" in json.loads(unknown[2])['error']
+    assert 'ETag' in missing[1]
+    body = json.loads(series[2])
+    assert series[0] == 200 and body['region'] == "Kerala" and len(body['x']) == len(body['y']) > 0
+
+
+def test_etag_revalidation(service):
+    (first,) = _get(service, "/series?region=Delhi")
+    etag = first[1]['ETag']
+    (again,) = _get(service, "/series?region=Delhi", headers={'If-None-Match': etag})
+    assert again[0] == 304 and again[2] == b""
+    assert again[1]['ETag'] == etag
+
+
+def test_errors_are_cached(service):
+    (bad,) = _get(service, "/series?year=abc")
+    assert bad[0] == 400 and 'ETag' in bad[1]
+    (cached,) = _get(service, "/series?year=abc")
+    assert cached == bad
+
+
+def test_escaped_values_do_not_share_a_cache_entry(service):
+    crafted, real = _get(service, "/series?region=Kerala%26year%3D2021", "/series?region=Kerala&year=2021")
+    assert crafted[0] == 400
+    assert real[0] == 200
+    assert crafted[1]['ETag'] != real[1]['ETag']
+
+
+def test_head_has_no_body(service):
+    head, get = _exchange(service, [('HEAD', "/series?region=Maharashtra", {}, b""), ('GET', "/series?region=Maharashtra", {}, b"")])
+    assert head[0] == get[0] == 200
+    assert head[1]['Content-Length'] == str(len(get[2]))
+
+
+def test_body_is_drained_before_405(service):
+    posted, listing = _exchange(service, [('POST', "/series", {}, b"x" * 1000), ('GET', "/datasets", {}, b"")])
+    assert posted[0] == 405 and posted[1]['Connection'] == "keep-alive"
+    assert listing[0] == 200
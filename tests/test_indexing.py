@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.indexing import date_index, slice_rows
+
+QUERIES = [
+    (None, None, None),
+    ("Kerala", None, None),
+    ("Kerala", "2021-02-01", "2021-02-28"),
+    ("Delhi", "2021-03-15", None),
+    (None, None, "2021-01-10"),
+    (None, "2021-04-01", None),
+    ("Jammu and Kashmir", "2021-02-10", "2021-02-10"),
+    ("Atlantis", None, None),
+    ("Kerala", "2022-01-01", None),
+]
+
+
+def _masked(df, region, start, end):
+    mask = np.ones(len(df), dtype=bool)
+    if region is not None:
+        mask &= (df['Region'].astype(str) == region).values
+    if start is not None:
+        mask &= (df['Date'] >= pd.Timestamp(start)).values
+    if end is not None:
+        mask &= (df['Date'] <= pd.Timestamp(end)).values
+    return df[mask]
+
+
+def _check(df, region, start, end):
+    got = slice_rows(df, region, start, end).sort_index()
+    pd.testing.assert_frame_equal(got, _masked(df, region, start, end).sort_index())
+
+
+@pytest.mark.parametrize("region, start, end", QUERIES)
+def test_sorted_frame(frame, region, start, end):
+    _check(frame, region, start, end)
+
+
+@pytest.mark.parametrize("region, start, end", QUERIES)
+def test_unsorted_frame(frame, region, start, end):
+    shuffled = frame.sample(frac=1, random_state=0)
+    _check(shuffled, region, start, end)
+
+
+@pytest.mark.parametrize("region, start, end", QUERIES)
+def test_frame_with_nat_dates(frame, region, start, end):
+    df = frame.copy()
+    df.loc[[3, 50, 200], 'Date'] = pd.NaT
+    _check(df, region, start, end)
+
+
+def test_sorted_frame_without_region_is_a_slice(frame):
+    assert isinstance(date_index(frame).rows(None, "2021-02-01", "2021-02-28"), slice)
+
+
+def test_unknown_region_is_empty(frame):
+    assert date_index(frame).region_range("Atlantis") == (0, 0)
+    assert slice_rows(frame, "Atlantis").empty
@@ -0,0 +1,70 @@
+import gc
+import weakref
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.cleaning_pipeline import clean_data
+from data.query import Query, run_query
+
+
+def test_parse_clauses():
+    q = Query("region:ma, date:2021-01-01..2021-03-31; Death > 1000 && cases <= 5000")
+    assert q.region_prefixes == ["ma"]
+    assert q.start == pd.Timestamp("2021-01-01") and q.end == pd.Timestamp("2021-03-31")
+    assert q.predicates == [("Death", ">", 1000.0), ("Confirmed Cases", "<=", 5000.0)]
+
+
+def test_parse_date_comparisons():
+    q = Query("date > 2021-01-01 and date < 2021-02-01")
+    assert q.start == pd.Timestamp("2021-01-02")
+    assert q.end == pd.Timestamp("2021-01-31")
+
+
+def test_parse_multi_word_regions():
+    q = Query("region:jammu and kashmir and Death > 10")
+    assert q.region_prefixes == ["jammu and kashmir"]
+    assert q.predicates == [("Death", ">", 10.0)]
+    q = Query("state:Dadra and Nagar Haveli and Daman and Diu, date >= 2021-05-01")
+    assert q.region_prefixes == ["dadra and nagar haveli and daman and diu"]
+    assert q.start == pd.Timestamp("2021-05-01")
+
+
+def test_parse_error():
+    with pytest.raises(ValueError):
+        Query("nonsense clause")
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "region:ke",
+    "region:jammu and kashmir",
+    "date:2021-02-01..2021-02-28",
+    "Death > 50",
+    "region:ma, Death >= 100, date >= 2021-03-01",
+    "Confirmed Cases != 1500",
+])
+def test_run_matches_mask(frame, text):
+    q = Query(text)
+    mask = np.ones(len(frame), dtype=bool)
+    if q.region_prefixes:
+        mask &= frame["Region"].astype(str).str.casefold().str.startswith(tuple(q.region_prefixes)).values
+    if q.start is not None:
+        mask &= (frame["Date"] >= q.start).values
+    if q.end is not None:
+        mask &= (frame["Date"] <= q.end).values
+    ops = {">": np.greater, ">=": np.greater_equal, "<": np.less, "<=": np.less_equal, "==": np.equal, "!=": np.not_equal}
+    for column, op, value in q.predicates:
+        mask &= ops[op](frame[column].values, value)
+    result = run_query(frame, text)
+    assert sorted(result.rows.tolist()) == np.flatnonzero(mask).tolist()
+
+
+def test_index_does_not_keep_frame_alive(raw):
+    frame = clean_data(raw)
+    run_query(frame, "Death > 0")
+    ref = weakref.ref(frame)
+    del frame
+    gc.collect()
+    assert ref() is None
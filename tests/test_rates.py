@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.rates import NATIONAL, RATE_METRICS, compute_rates, rate_table
+from analysis.trends import aggregate_series
+from data.cleaning_pipeline import clean_data
+from tests.conftest import make_raw
+
+
+def _last(frame, region, freq):
+    rows = frame[frame["Region"] == region]
+    return rows.groupby(rows["Date"].dt.to_period(freq)).last()
+
+
+def test_metrics_per_region_and_month(frame):
+    table = compute_rates(frame, "M")
+    assert set(RATE_METRICS) <= set(table.columns)
+    last = _last(frame, "Kerala", "M")
+    kerala = table[table["Region"] == "Kerala"]
+    kerala = kerala.set_index(kerala["Period"].dt.to_period("M"))
+    confirmed = last["Confirmed Cases"]
+    np.testing.assert_allclose(kerala["Case Fatality Rate"], 100 * last["Death"] / confirmed)
+    np.testing.assert_allclose(kerala["Recovery Rate"], 100 * last["Cured/Discharged"] / confirmed)
+    np.testing.assert_allclose(kerala["Active Share"], 100 * last["Active Cases"] / confirmed)
+    growth = confirmed / confirmed.shift() - 1
+    np.testing.assert_allclose(kerala["Growth Rate"].values[1:], 100 * growth.values[1:])
+    assert np.isnan(kerala["Growth Rate"].values[0])
+    doubling = np.log(2) / np.log1p(growth) * 365.25 / 12
+    np.testing.assert_allclose(kerala["Doubling Time"].values[1:], doubling.values[1:])
+
+
+def test_national_row_sums_counts(frame):
+    table = compute_rates(frame, "D")
+    national = table[table["Region"] == NATIONAL].set_index("Period")
+    totals = frame.groupby("Date")["Confirmed Cases"].sum()
+    np.testing.assert_allclose(national["Confirmed Cases"].values, totals.values)
+
+
+def test_gaps_carried_forward():
+    frame = clean_data(make_raw(days=40))
+    frame = frame[~((frame["Region"] == "Delhi") & (frame["Date"] == "2021-01-10"))].reset_index(drop=True)
+    table = compute_rates(frame, "D")
+    delhi = table[table["Region"] == "Delhi"].set_index("Period")
+    assert delhi.loc["2021-01-10", "Death"] == delhi.loc["2021-01-09", "Death"]
+
+
+def test_zero_denominator_is_nan():
+    raw = make_raw(days=3, regions=["Goa"])
+    raw[["Confirmed Cases", "Death", "Active Cases", "Cured/Discharged"]] = "0"
+    table = compute_rates(clean_data(raw), "D")
+    assert table["Case Fatality Rate"].isna().all()
+
+
+def test_rate_table_is_cached(frame):
+    assert rate_table(frame, "M") is rate_table(frame, "M")
+    with pytest.raises(ValueError):
+        compute_rates(frame, "W")
+
+
+def test_month_without_year_averages_rates():
+    frame = clean_data(pd.concat([make_raw(days=60, start="2020-05-01", seed=1),
+                                  make_raw(days=60, start="2021-05-01", seed=2)]))
+    per_year = [aggregate_series(frame, "Kerala", 5, y, "Case Fatality Rate") for y in (2020, 2021)]
+    combined = aggregate_series(frame, "Kerala", 5, None, "Case Fatality Rate")
+    np.testing.assert_allclose(combined.values, (per_year[0].values + per_year[1].values) / 2)
+    # Counts still add up across years
+    counts = [aggregate_series(frame, "Kerala", 5, y, "Death") for y in (2020, 2021)]
+    np.testing.assert_allclose(aggregate_series(frame, "Kerala", 5, None, "Death").values,
+                               counts[0].values + counts[1].values)
@@ -0,0 +1,55 @@
+import pandas as pd
+
+from data.cleaning_pipeline import clean_data
+from data.regions import RegionNormalizer, region_report
+from tests.conftest import make_raw
+
+MERGED = "Dadra and Nagar Haveli and Daman and Diu"
+
+
+def test_region_report_covers_only_this_load():
+    normalizer = RegionNormalizer()
+    first = make_raw(days=5, regions=["Orissa", "Atlantis"])
+    second = make_raw(days=5, regions=["Kerala", "Pondicherry"])
+
+    report = region_report(clean_data(first, region_normalizer=normalizer))
+    assert report.to_dict('records') == [
+        {'Name': "Atlantis", 'Region': "Atlantis", 'Match': "unmatched", 'Rows': 5},
+        {'Name': "Orissa", 'Region': "Odisha", 'Match': "alias", 'Rows': 5},
+    ]
+
+    report = region_report(clean_data(second, region_normalizer=normalizer))
+    assert report['Name'].tolist() == ["Pondicherry"]
+    assert report['Rows'].tolist() == [5]
+
+
+def test_merged_parts_are_summed_per_date():
+    raw = make_raw(days=3, regions=["Dadra and Nagar Haveli", "Daman and Diu"])
+    parts = clean_data(raw, region_normalizer=RegionNormalizer())
+    assert parts.groupby(['Region', 'Date'], observed=True).size().max() == 1
+    assert parts['Region'].unique().tolist() == [MERGED]
+
+    confirmed = raw.astype({'Confirmed Cases': int}).groupby('Date', sort=False)['Confirmed Cases'].sum()
+    assert parts['Confirmed Cases'].tolist() == confirmed.tolist()
+
+
+def test_merged_name_wins_over_its_parts():
+    raw = pd.concat([make_raw(days=2, regions=["Daman and Diu"]),
+                     make_raw(days=2, regions=[MERGED], seed=1)], ignore_index=True)
+    df = clean_data(raw, region_normalizer=RegionNormalizer())
+    assert len(df) == 2
+    assert df['Confirmed Cases'].tolist() == raw.loc[raw['Region'] == MERGED, 'Confirmed Cases'].astype(int).tolist()
+
+
+def test_other_regions_are_untouched(frame, raw):
+    assert len(frame) == len(raw)
+    assert frame.attrs['region_report'] == []
+
+
+def test_normalizer_report_matches_region_report_columns():
+    normalizer = RegionNormalizer()
+    first = clean_data(make_raw(days=5, regions=["Orissa", "Atlantis"]), region_normalizer=normalizer)
+    clean_data(make_raw(days=3, regions=["Orissa"]), region_normalizer=normalizer)
+    overall = normalizer.report()
+    assert list(overall.columns) == list(region_report(first).columns)
+    assert overall.set_index('Name')['Rows'].to_dict() == {"Atlantis": 5, "Orissa": 8}
@@ -0,0 +1,74 @@
+import threading
+
+import pytest
+
+from analysis import rendering
+from analysis.rendering import ChartRenderer, RenderCancelled, render_png
+from analysis.trends import create_figure
+
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+
+@pytest.fixture
+def renderer():
+    r = ChartRenderer()
+    yield r
+    r.shutdown()
+
+
+def _on_done(delivered, name):
+    # What a GUI callback does: drop superseded renders, keep finished ones
+    def callback(future):
+        if future.exception() is None:
+            delivered.append(name)
+    return callback
+
+
+def test_render_png_on_agg(frame):
+    fig = create_figure(frame, state="Kerala", year=2021)
+    png = render_png(fig, 320, 200)
+    assert png.startswith(PNG_MAGIC)
+    # Width and height from the IHDR chunk
+    assert int.from_bytes(png[16:20], 'big') == 320
+    assert int.from_bytes(png[20:24], 'big') == 200
+
+
+def test_only_the_newest_queued_render_completes(frame, renderer):
+    gate = threading.Event()
+    renderer._executor.submit(gate.wait)  # keep the worker busy while both are queued
+    delivered = []
+    old = renderer.submit(frame, state="Kerala")
+    old.add_done_callback(_on_done(delivered, "old"))
+    new = renderer.submit(frame, state="Delhi")
+    new.add_done_callback(_on_done(delivered, "new"))
+    gate.set()
+
+    fig, png = new.result(timeout=30)
+    with pytest.raises(RenderCancelled):
+        old.result(timeout=30)
+    assert delivered == ["new"]
+    assert png.startswith(PNG_MAGIC) and fig.axes
+
+
+def test_in_flight_render_is_cancelled_between_stages(frame, renderer, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_create_figure(df, **kwargs):
+        if kwargs.get('state') == "Kerala":
+            started.set()
+            release.wait(30)
+        return create_figure(df, **kwargs)
+
+    monkeypatch.setattr(rendering, 'create_figure', slow_create_figure)
+    delivered = []
+    old = renderer.submit(frame, state="Kerala")
+    old.add_done_callback(_on_done(delivered, "old"))
+    assert started.wait(30)
+    new = renderer.submit(frame, state="Delhi")
+    new.add_done_callback(_on_done(delivered, "new"))
+    release.set()
+
+    new.result(timeout=30)
+    with pytest.raises(RenderCancelled):
+        old.result(timeout=30)
+    assert delivered == ["new"]
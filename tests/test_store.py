@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from data.store import PartitionedDataset, write_partitioned
+
+
+def _canonical(df):
+    # Same rows in the same order and column layout, regardless of how they were read
+    df = df.assign(Region=df['Region'].astype(str))
+    df = df[sorted(df.columns)].sort_values(['Date', 'Region'], ignore_index=True)
+    return df.astype({c: 'int64' for c in df.columns if c not in ('Date', 'Region')})
+
+
+def test_round_trip(frame, tmp_path):
+    write_partitioned(frame, str(tmp_path), row_group_size=16)
+    dataset = PartitionedDataset(str(tmp_path))
+    assert len(dataset) == len(frame)
+    pd.testing.assert_frame_equal(_canonical(dataset.to_frame()), _canonical(frame))
+
+
+@pytest.mark.parametrize("query", [
+    dict(regions=["Kerala", "Delhi"]),
+    dict(years=[2021], start="2021-02-03", end="2021-02-20"),
+    dict(regions=["Jammu and Kashmir"], start="2021-03-01"),
+    dict(start="2022-01-01"),
+])
+def test_filtered_read_matches_in_memory(frame, tmp_path, query):
+    dataset = write_partitioned(frame, str(tmp_path), row_group_size=16)
+    expected = frame
+    if 'regions' in query:
+        expected = expected[expected['Region'].isin(query['regions'])]
+    if 'years' in query:
+        expected = expected[expected['Year'].isin(query['years'])]
+    if 'start' in query:
+        expected = expected[expected['Date'] >= pd.Timestamp(query['start'])]
+    if 'end' in query:
+        expected = expected[expected['Date'] <= pd.Timestamp(query['end'])]
+    got = dataset.read(**query)
+    pd.testing.assert_frame_equal(_canonical(got), _canonical(expected))
+
+
+def test_date_range_skips_row_groups(frame, tmp_path):
+    dataset = write_partitioned(frame, str(tmp_path), row_group_size=16)
+    dataset.read(start="2021-04-25")
+    assert dataset.last_read['row_groups_skipped'] > 0
+    assert dataset.last_read['row_groups_read'] == len(dataset.partitions)
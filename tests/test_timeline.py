@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from analysis.rates import ffill_periods
+from analysis.timeline import timeline_matrix
+from data.cleaning_pipeline import clean_data
+from tests.conftest import make_raw
+
+
+def test_stray_dates_do_not_stretch_the_timeline():
+    raw = make_raw(days=10)
+    raw.loc[0, 'Date'] = "01/01/1970"
+    df = clean_data(raw, min_year=None)
+    timeline = timeline_matrix(df)
+    assert str(timeline.dates[0]) == "2021-01-01"
+    assert len(timeline) == 10
+    assert timeline.values.shape == (len(timeline.regions), 10)
+
+
+def test_timeline_window_and_values(frame):
+    timeline = timeline_matrix(frame, "Death", "2021-02-01", "2021-02-10")
+    assert len(timeline) == 10
+    kerala = timeline.regions.index("Kerala")
+    expected = frame[(frame['Region'] == "Kerala") & (frame['Date'] == pd.Timestamp("2021-02-10"))]['Death']
+    assert timeline.values[kerala, -1] == expected.iloc[0]
+
+
+def test_ffill_periods():
+    matrix = np.array([[np.nan, 1.0, np.nan, 3.0, np.nan]])
+    out = ffill_periods(matrix)
+    np.testing.assert_array_equal(out, [[np.nan, 1.0, 1.0, 3.0, 3.0]])
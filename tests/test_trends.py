@@ -0,0 +1,42 @@
+import pandas as pd
+
+from analysis.trends import create_figure
+
+
+def _forecast(frame, region="Kerala", days=10):
+    last = frame['Date'].max()
+    level = int(frame.loc[frame['Region'] == region, 'Death'].iloc[-1])
+    dates = pd.date_range(last + pd.Timedelta(days=1), periods=days, freq='D')
+    return pd.DataFrame({'Region': region, 'Date': dates, 'Death': level + pd.RangeIndex(1, days + 1)})
+
+
+def _lines(fig):
+    return {line.get_label(): line for line in fig.axes[0].get_lines()}
+
+
+def test_forecast_extends_an_open_range(frame):
+    forecast = _forecast(frame)
+    fig = create_figure(frame, state="Kerala", case_type="Death", forecast=forecast, start_date="2021-04-20")
+    lines = _lines(fig)
+    fc_x = pd.to_datetime(lines['Forecast'].get_xdata())
+    assert fc_x.max() == forecast['Date'].max()
+    assert pd.Series(lines['Forecast'].get_ydata()).notna().sum() == len(forecast)
+    data_line = next(line for label, line in lines.items() if label != 'Forecast')
+    assert pd.to_datetime(data_line.get_xdata()).max() == frame['Date'].max()
+    left, right = fig.axes[0].get_xlim()
+    assert right >= fig.axes[0].convert_xunits(forecast['Date'].max())
+
+
+def test_forecast_respects_a_closed_range(frame):
+    forecast = _forecast(frame)
+    fig = create_figure(frame, state="Kerala", case_type="Death", forecast=forecast,
+                        start_date="2021-04-20", end_date="2021-05-03")
+    fc_x = pd.to_datetime(_lines(fig)['Forecast'].get_xdata())
+    assert fc_x.max() == pd.Timestamp("2021-05-03")
+
+
+def test_forecast_is_not_drawn_on_yearly_views(frame):
+    forecast = _forecast(frame)
+    for selection in ({'year': 2021}, {}):
+        fig = create_figure(frame, state="Kerala", case_type="Death", forecast=forecast, **selection)
+        assert 'Forecast' not in _lines(fig)
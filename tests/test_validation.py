@@ -0,0 +1,70 @@
+import pandas as pd
+
+from data.cleaning_pipeline import clean_data
+from data.validation import VALIDATION_RULES, quarantine, validate_data
+from tests.conftest import make_raw
+
+
+def _series(confirmed, region="Kerala", start="2021-01-01"):
+    # One region with consistent Active/Cured/Death for the given confirmed counts
+    dates = pd.date_range(start, periods=len(confirmed), freq="D")
+    return pd.DataFrame({
+        "Date": dates,
+        "Region": pd.Categorical([region] * len(confirmed)),
+        "Confirmed Cases": confirmed,
+        "Active Cases": confirmed,
+        "Cured/Discharged": [0] * len(confirmed),
+        "Death": [0] * len(confirmed),
+    })
+
+
+def _flagged(df, rule):
+    report = validate_data(df, max_date="2030-01-01")
+    labels = report.rule_labels()
+    return sorted(int(i) for i, label in labels.items() if rule in label.split(", "))
+
+
+def test_clean_frame_passes(frame):
+    report = validate_data(frame)
+    assert len(report) == 0
+    assert report.summary["Rows"].tolist() == [0] * len(VALIDATION_RULES)
+
+
+def test_date_range():
+    df = clean_data(make_raw(days=3, regions=["Kerala"], start="2019-12-30"), min_year=None)
+    assert _flagged(df, "date_range") == [0, 1]
+
+
+def test_placeholder_region():
+    df = pd.concat([_series([1, 2]), _series([3, 4], region="State assignment pending")], ignore_index=True)
+    assert _flagged(df, "placeholder_region") == [2, 3]
+
+
+def test_identity():
+    df = _series([10, 20, 30])
+    df.loc[1, "Active Cases"] = 15
+    assert _flagged(df, "identity") == [1]
+    assert len(validate_data(df, identity_tolerance=5, max_date="2030-01-01")) == 0
+
+
+def test_non_monotonic_flags_the_spike():
+    assert _flagged(_series([90, 100, 5000, 110, 120]), "non_monotonic") == [2]
+    # At either end of a region's series
+    assert _flagged(_series([5000, 110, 120]), "non_monotonic") == [0]
+    assert _flagged(_series([90, 100, 5000, 110]), "non_monotonic") == [2]
+
+
+def test_non_monotonic_flags_the_dip():
+    assert _flagged(_series([90, 100, 50, 110, 120]), "non_monotonic") == [2]
+
+
+def test_non_monotonic_is_per_region():
+    df = pd.concat([_series([100, 200]), _series([10, 20], region="Goa")], ignore_index=True)
+    assert _flagged(df, "non_monotonic") == []
+
+
+def test_quarantine_splits_rows():
+    df = _series([90, 100, 5000, 110, 120])
+    valid, quarantined = quarantine(df, validate_data(df, max_date="2030-01-01"))
+    assert valid["Confirmed Cases"].tolist() == [90, 100, 110, 120]
+    assert quarantined["Violations"].tolist() == ["non_monotonic"]
@@ -0,0 +1,69 @@
+import gc
+import weakref
+
+import pandas as pd
+
+from analysis.distributions import distribution_index
+from analysis.rates import _RATE_CACHE, forget_rates, rate_table
+from data.cleaning_pipeline import clean_data
+from data.indexing import date_index
+from data.query import run_query
+from data.workspace import Workspace, frame_memory
+from tests.conftest import make_raw
+
+
+def test_evicted_frame_round_trips(tmp_path, frame):
+    workspace = Workspace(budget=0, spill_dir=str(tmp_path))
+    first = workspace.add("a", frame)
+    workspace.add("b", frame.iloc[:10].reset_index(drop=True))
+    assert workspace.entry(first).state == "on disk"
+    pd.testing.assert_frame_equal(workspace.get(first), frame)
+    assert workspace.active == first
+    assert workspace.entry("b").state == "on disk"
+
+
+def test_index_survives_the_spill(tmp_path, frame):
+    workspace = Workspace(budget=0, spill_dir=str(tmp_path))
+    frames = {
+        'labels': frame.iloc[5:8],
+        'dates': frame.set_index('Date'),
+        'named range': frame.rename_axis('row').set_axis(pd.RangeIndex(10, 10 + 2 * len(frame), 2, name='row')),
+    }
+    for name, df in frames.items():
+        workspace.add(name, df)
+    workspace.add("other", frame.iloc[:1])
+    for name, df in frames.items():
+        assert workspace.entry(name).state == "on disk"
+        pd.testing.assert_frame_equal(workspace.get(name), df)
+        workspace.evict(name)
+
+
+def test_derived_frames_count_against_budget(tmp_path, frame):
+    size = frame_memory(frame)
+    workspace = Workspace(budget=int(size * 2.5), spill_dir=str(tmp_path))
+    first = workspace.add("a", frame)
+    workspace.set_derived(first, "data", frame.copy())
+    assert workspace.memory_usage == workspace.entry(first).memory > 2 * size - 1
+    workspace.add("b", frame.copy())
+    # a (frame + derived copy) and b no longer fit: the least recently used goes
+    assert workspace.entry(first).state == "on disk"
+    assert workspace.entry(first).derived == {}
+    assert workspace.memory_usage <= workspace.budget
+
+
+def test_eviction_releases_the_frame(tmp_path):
+    workspace = Workspace(budget=0, spill_dir=str(tmp_path), on_evict=[forget_rates])
+    frame = clean_data(make_raw())
+    ref = weakref.ref(frame)
+    first = workspace.add("a", frame)
+    date_index(frame)
+    run_query(frame, "Death > 0")
+    distribution_index(frame).sketch("Death")
+    rate_table(frame, "M")
+    cached = len(_RATE_CACHE)
+    del frame
+    workspace.add("b", clean_data(make_raw(days=10)))
+    gc.collect()
+    assert workspace.entry(first).state == "on disk"
+    assert ref() is None
+    assert len(_RATE_CACHE) == cached - 1